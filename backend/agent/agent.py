@@ -1,5 +1,8 @@
 import random
 import math
+import logging
+
+import numpy as np
 
 from utils.logger import AILogger
 from agent.decision_policy import calculate_score
@@ -7,16 +10,27 @@ from learning.bandit import MultiArmedBandit
 
 
 class DataCollectionAgent:
-    def __init__(self, total_budget: float, epsilon: float = 0.2):
+    def __init__(
+        self,
+        total_budget: float,
+        epsilon: float = 0.2,
+        bandit_strategy=None,
+        epsilon_decay: float = 0.995,
+        min_epsilon: float = 0.05,
+        ucb_weight: float = 0.5
+    ):
         """
         Stage-2 Autonomous Data Collection Agent
         """
         self.total_budget = total_budget
         self.remaining_budget = total_budget
         self.epsilon = epsilon
+        self.epsilon_decay = epsilon_decay
+        self.min_epsilon = min_epsilon
+        self.ucb_weight = ucb_weight
 
         # 🔹 Learning memory
-        self.bandit = MultiArmedBandit()
+        self.bandit = MultiArmedBandit(strategy=bandit_strategy)
 
         # 🔹 Logger
         self.logger = AILogger(name="DataCollectionAgent")
@@ -56,12 +70,41 @@ class DataCollectionAgent:
         final_score = (
             rule_score
             + learned_value
-            + 0.5 * confidence_bonus
+            + self.ucb_weight * confidence_bonus
             - budget_penalty
         )
 
         return final_score
 
+    def evaluate_sources(self, sources):
+        """
+        evaluate_source() for every source at once.
+        Returns (fields, learned values, scores) in `sources` order.
+        """
+        fields = np.array(
+            [(s["freshness"], s["reliability"], s["cost"]) for s in sources.values()],
+            dtype=float
+        ).reshape(-1, 3)
+        freshness, reliability, cost = fields.T
+        budget = self.remaining_budget
+
+        budget_penalty = 1.5 * np.maximum(cost - budget, 0.0)
+
+        base = 0.45 * freshness + 0.45 * reliability - 0.25 * cost
+        rule_score = (
+            np.maximum(base * min(1.0, budget), 0.0) if budget > 0
+            else np.zeros(len(fields))
+        )
+
+        learned, pulls = self.bandit.lookup(sources)
+        confidence_bonus = (
+            np.sqrt(math.log(self.total_decisions + 1) / (pulls + 1))
+            if self.total_decisions > 0 else 0.0
+        )
+
+        scores = rule_score + learned + self.ucb_weight * confidence_bonus - budget_penalty
+        return fields, learned, scores
+
     # ------------------------------------------------------------------
     # Explainable AI
     # ------------------------------------------------------------------
@@ -110,7 +153,6 @@ class DataCollectionAgent:
 
         self.total_decisions += 1
         sources = environment.get_all_sources()
-        evaluations = {}
 
         # -------- Exploration --------
         if random.random() < self.epsilon:
@@ -129,32 +171,25 @@ class DataCollectionAgent:
             return source_name, score
 
         # -------- Exploitation --------
-        best_source, best_score = None, float("-inf")
-
-        for name, state in sources.items():
-            score = self.evaluate_source(
-                state["freshness"],
-                state["reliability"],
-                state["cost"],
-                name
-            )
-
-            evaluations[name] = {
-                "freshness": state["freshness"],
-                "reliability": state["reliability"],
-                "cost": state["cost"],
-                "learned": self.bandit.get_estimated_value(name),
-                "score": score
-            }
+        names = list(sources)
+        fields, learned, scores = self.evaluate_sources(sources)
 
-            if score > best_score:
-                best_score = score
-                best_source = name
+        best = int(np.argmax(scores))
+        best_source, best_score = names[best], float(scores[best])
 
         self.logger.log_decision(best_source, best_score, self.remaining_budget)
 
-        explanation = self.explain_decision(evaluations, best_source)
-        self.logger.logger.info(f"EXPLANATION | {explanation}")
+        # Explanations are only built when someone will read them
+        if self.logger.logger.isEnabledFor(logging.INFO):
+            evaluations = {
+                name: {
+                    "freshness": f, "reliability": r, "cost": c,
+                    "learned": float(value), "score": float(score)
+                }
+                for name, (f, r, c), value, score in zip(names, fields.tolist(), learned, scores)
+            }
+            explanation = self.explain_decision(evaluations, best_source)
+            self.logger.logger.info("EXPLANATION | %s", explanation)
 
         self._decay_epsilon()
         return best_source, best_score
@@ -181,8 +216,16 @@ class DataCollectionAgent:
         self.remaining_budget = max(0.0, self.remaining_budget - cost)
         self.logger.log_budget(old, self.remaining_budget)
 
+    def refill_budget(self):
+        """
+        Restores the full budget, e.g. at the start of a new budget period.
+        """
+        old = self.remaining_budget
+        self.remaining_budget = self.total_budget
+        self.logger.log_budget(old, self.remaining_budget)
+
     # ------------------------------------------------------------------
     # Exploration Control
     # ------------------------------------------------------------------
     def _decay_epsilon(self):
-        self.epsilon = max(0.05, self.epsilon * 0.995)
+        self.epsilon = max(self.min_epsilon, self.epsilon * self.epsilon_decay)
@@ -0,0 +1,239 @@
+import itertools
+import os
+
+import numpy as np
+
+from utils.process_pool import get_process_pool
+
+
+# Per-agent settings and their DataCollectionAgent defaults
+PARAMS = {
+    "epsilon": 0.2,
+    "total_budget": 5.0,
+    "epsilon_decay": 0.995,
+    "min_epsilon": 0.05,
+    "ucb_weight": 0.5,
+}
+
+
+def grid(**axes):
+    """
+    Cartesian product of parameter values as equal-length arrays,
+    e.g. grid(epsilon=[0.1, 0.2], ucb_weight=[0, 0.5, 1]) → 6 agents.
+    Parameters left out take their PARAMS default.
+    """
+    unknown = set(axes) - set(PARAMS)
+    if unknown:
+        raise ValueError(f"unknown parameters: {sorted(unknown)}")
+
+    names = list(axes)
+    combos = list(itertools.product(*(np.atleast_1d(axes[n]) for n in names)))
+    size = len(combos)
+
+    configs = {name: np.full(size, default, dtype=float) for name, default in PARAMS.items()}
+    for i, name in enumerate(names):
+        configs[name] = np.array([c[i] for c in combos], dtype=float)
+    return configs
+
+
+def market_rewards(fields):
+    """
+    compute_reward() for every source in every frame at once.
+    Returns a (frames × sources) matrix, NaN where a source is absent.
+    """
+    freshness, reliability, cost, value = (
+        np.asarray(fields[f], dtype=float) for f in ("freshness", "reliability", "cost", "value")
+    )
+    avg_value = np.nanmean(value, axis=1, keepdims=True)
+    quality = freshness * reliability * (1 / (1 + np.abs(value - avg_value)))
+    return quality - cost
+
+
+class AgentPopulation:
+    """
+    K DataCollectionAgents stepped together.
+
+    Bandit estimates and pull counts are (agents × sources) matrices;
+    budgets, epsilons and hyperparameters are length-K vectors. Each
+    step scores every source for every agent, applies epsilon-greedy
+    selection, deducts costs and applies the sample-average bandit
+    update for the whole population with NumPy, following the same
+    rules as DataCollectionAgent.evaluate_source / select_best_source.
+    """
+
+    def __init__(self, n_sources, configs=None, seed=None, **params):
+        configs = dict(configs or {}, **params)
+        sizes = {np.size(v) for v in configs.values()} - {1}
+        if len(sizes) > 1:
+            raise ValueError("parameter arrays must have equal length")
+        self.n_agents = sizes.pop() if sizes else 1
+
+        def vector(name):
+            value = configs.get(name, PARAMS[name])
+            return np.broadcast_to(np.asarray(value, dtype=float), self.n_agents).copy()
+
+        self.epsilon = vector("epsilon")
+        self.total_budget = vector("total_budget")
+        self.epsilon_decay = vector("epsilon_decay")
+        self.min_epsilon = vector("min_epsilon")
+        self.ucb_weight = vector("ucb_weight")
+
+        self.n_sources = n_sources
+        self.remaining_budget = self.total_budget.copy()
+        self.values = np.zeros((self.n_agents, n_sources))
+        self.counts = np.zeros((self.n_agents, n_sources))
+        self.total_decisions = np.zeros(self.n_agents)
+        self.total_reward = np.zeros(self.n_agents)
+
+        self.rng = np.random.default_rng(seed)
+
+    # -------------------------------
+    # Decision
+    # -------------------------------
+    def scores(self, freshness, reliability, cost):
+        """
+        evaluate_source() for all agents × sources.
+        """
+        budget = self.remaining_budget[:, None]
+
+        base = 0.45 * freshness + 0.45 * reliability - 0.25 * cost
+        rule = np.maximum(base * np.minimum(1.0, budget), 0.0)
+        rule = np.where(budget > 0, rule, 0.0)
+
+        penalty = 1.5 * np.maximum(cost - budget, 0.0)
+
+        decisions = self.total_decisions[:, None]
+        bonus = np.where(
+            decisions > 0,
+            np.sqrt(np.log(decisions + 1) / (self.counts + 1)),
+            0.0
+        )
+
+        return rule + self.values + self.ucb_weight[:, None] * bonus - penalty
+
+    def select(self, freshness, reliability, cost, present=None):
+        """
+        Epsilon-greedy choice per agent. Returns source indices,
+        -1 for agents whose budget is exhausted.
+        """
+        present = np.ones(self.n_sources, dtype=bool) if present is None else present
+
+        active = (self.remaining_budget > 0) & present.any()
+        self.total_decisions += active
+
+        scores = np.where(present, self.scores(freshness, reliability, cost), -np.inf)
+        greedy = np.argmax(scores, axis=1)
+
+        # Uniform choice among present sources
+        noise = np.where(present, self.rng.random((self.n_agents, self.n_sources)), -1.0)
+        random_choice = np.argmax(noise, axis=1)
+
+        explore = self.rng.random(self.n_agents) < self.epsilon
+        choice = np.where(explore, random_choice, greedy)
+
+        self.epsilon = np.where(
+            active, np.maximum(self.min_epsilon, self.epsilon * self.epsilon_decay), self.epsilon
+        )
+        return np.where(active, choice, -1)
+
+    # -------------------------------
+    # Budget & learning
+    # -------------------------------
+    def deduct(self, choice, cost):
+        acted = choice >= 0
+        spent = np.where(acted, cost[np.maximum(choice, 0)], 0.0)
+        self.remaining_budget = np.maximum(0.0, self.remaining_budget - spent)
+
+    def learn(self, choice, rewards):
+        acted = np.flatnonzero(choice >= 0)
+        if not len(acted):
+            return
+
+        arms = choice[acted]
+        r = rewards[arms]
+
+        self.counts[acted, arms] += 1
+        self.values[acted, arms] += (r - self.values[acted, arms]) / self.counts[acted, arms]
+        self.total_reward[acted] += r
+
+    # -------------------------------
+    # Simulation
+    # -------------------------------
+    def step(self, freshness, reliability, cost, rewards):
+        present = ~np.isnan(rewards)
+        freshness, reliability, cost = (np.nan_to_num(x) for x in (freshness, reliability, cost))
+
+        choice = self.select(freshness, reliability, cost, present)
+        self.deduct(choice, cost)
+        self.learn(choice, rewards)
+        return choice
+
+    def run(self, fields, steps=None):
+        """
+        Replays (frames × sources) field matrices, looping if `steps`
+        exceeds the number of frames. Stops early once every budget
+        is exhausted. Returns summary().
+        """
+        freshness, reliability, cost = (
+            np.asarray(fields[f], dtype=float) for f in ("freshness", "reliability", "cost")
+        )
+        rewards = market_rewards(fields)
+        n_frames = len(rewards)
+        steps = n_frames if steps is None else steps
+
+        for t in range(steps):
+            if not (self.remaining_budget > 0).any():
+                break
+            i = t % n_frames
+            self.step(freshness[i], reliability[i], cost[i], rewards[i])
+
+        return self.summary()
+
+    def summary(self):
+        return {
+            "epsilon": self.epsilon,
+            "remaining_budget": self.remaining_budget,
+            "total_reward": self.total_reward,
+            "decisions": self.total_decisions,
+            "values": self.values,
+            "counts": self.counts,
+        }
+
+
+# -------------------------------
+# Multi-core sweeps
+# -------------------------------
+def _run_chunk(args):
+    configs, fields, steps, seed = args
+    n_sources = np.shape(fields["value"])[1]
+    return AgentPopulation(n_sources, configs, seed=seed).run(fields, steps)
+
+
+def run_sweep(configs, fields, steps=None, max_workers=None, seed=None):
+    """
+    Runs the population defined by `configs` (see grid()) over the
+    replay `fields`, split into chunks across CPU cores.
+    Returns summary() arrays concatenated over all agents.
+    """
+    n_agents = max(np.size(v) for v in configs.values())
+    max_workers = max_workers or os.cpu_count() or 1
+    n_chunks = max(1, min(max_workers, n_agents))
+
+    bounds = np.linspace(0, n_agents, n_chunks + 1).astype(int)
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    fields = {f: np.asarray(v) for f, v in fields.items()}
+
+    tasks = [
+        (
+            {name: np.broadcast_to(v, n_agents)[lo:hi] for name, v in configs.items()},
+            fields, steps, seeds[i]
+        )
+        for i, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:]))
+    ]
+
+    if n_chunks == 1:
+        results = list(map(_run_chunk, tasks))
+    else:
+        results = list(get_process_pool(max_workers).map(_run_chunk, tasks))
+
+    return {key: np.concatenate([r[key] for r in results]) for key in results[0]}
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+
+
+STREAMED_EVENTS = ("DECISION", "REWARD", "LEARNING", "PREDICTION")
+
+
+class EventBus:
+    """
+    Fan-out of pipeline events to streaming clients.
+
+    - Every event gets a monotonically increasing id and is encoded
+      once as an SSE frame shared by all clients.
+    - The last `history` events are kept so a reconnecting client can
+      resume from its cursor (Last-Event-ID). If events after the
+      cursor were already evicted (or the cursor comes from an earlier
+      process), the client gets a `reset` event followed by the whole
+      retained history instead.
+    - Each client has a bounded queue; when a slow client's queue is
+      full its oldest frame is dropped, so the pipeline never waits.
+    """
+
+    def __init__(self, history=1000, client_queue_size=256, events=STREAMED_EVENTS):
+        self.events = frozenset(events)
+        self.client_queue_size = client_queue_size
+
+        self._history = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._clients = set()
+        self._loop = None
+
+        self.dropped = 0
+
+    def bind(self, loop):
+        self._loop = loop
+
+    # -------------------------------
+    # Publishing (any thread)
+    # -------------------------------
+    def publish(self, event, fields):
+        if event not in self.events:
+            return
+
+        with self._lock:
+            event_id = self._next_id
+            self._next_id += 1
+
+            data = json.dumps(
+                {"t": round(time.time(), 3), **fields},
+                separators=(",", ":"),
+                default=str
+            )
+            frame = f"id: {event_id}\nevent: {event}\ndata: {data}\n\n".encode()
+            self._history.append((event_id, frame))
+            fan_out = self._loop is not None and bool(self._clients)
+
+        if fan_out:
+            self._loop.call_soon_threadsafe(self._fan_out, (event_id, frame))
+
+    def _fan_out(self, item):
+        for client in self._clients:
+            if client.full():
+                client.get_nowait()
+                self.dropped += 1
+            client.put_nowait(item)
+
+    # -------------------------------
+    # Subscribing (event loop)
+    # -------------------------------
+    def subscribe(self, cursor=None):
+        """
+        Returns (queue, backlog) where backlog holds (id, frame) after `cursor`,
+        led by a (0, reset frame) when the cursor can't be resumed from.
+        """
+        queue = asyncio.Queue(maxsize=self.client_queue_size)
+
+        # Snapshot and register together, so an event published in
+        # between lands in either the backlog or the queue
+        with self._lock:
+            self._clients.add(queue)
+
+            if cursor is None:
+                return queue, []
+
+            oldest = self._history[0][0] if self._history else self._next_id
+            if oldest - 1 <= cursor < self._next_id:
+                return queue, [item for item in self._history if item[0] > cursor]
+
+            reset = json.dumps({"cursor": cursor, "oldest": oldest}, separators=(",", ":"))
+            return queue, [(0, f"event: reset\ndata: {reset}\n\n".encode()), *self._history]
+
+    def unsubscribe(self, queue):
+        with self._lock:
+            self._clients.discard(queue)
+
+    async def stream(self, cursor=None, heartbeat=15.0):
+        """
+        Async iterator of SSE frames for one client.
+        """
+        queue, backlog = self.subscribe(cursor)
+        last_id = cursor or 0
+        try:
+            for event_id, frame in backlog:
+                last_id = event_id
+                yield frame
+
+            while True:
+                try:
+                    event_id, frame = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+
+                # Skip frames already sent from the backlog
+                if event_id > last_id:
+                    last_id = event_id
+                    yield frame
+        finally:
+            self.unsubscribe(queue)
@@ -0,0 +1,130 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+
+from api.events import EventBus
+from api.snapshot import SnapshotStore
+from utils import metrics
+from utils.logger import add_event_sink, remove_event_sink
+
+
+REFRESH_INTERVAL = float(os.getenv("PIPELINE_INTERVAL", "60"))
+
+snapshots = SnapshotStore()
+events = EventBus()
+
+
+def _start_pipeline(interval):
+    """
+    Builds the resident pipeline and its daemon (heavy imports happen here,
+    off the request path).
+    """
+    from models.silver_predictor_arima import SilverPricePredictorARIMA
+    from pipeline.daemon import PipelineDaemon
+    from pipeline.pipeline import BackendPipeline
+
+    pipeline = BackendPipeline(predictor=SilverPricePredictorARIMA(incremental=True))
+    snapshots.publish(pipeline)
+
+    return PipelineDaemon(
+        pipeline,
+        interval=interval,
+        on_cycle=snapshots.publish,
+        handle_signals=False
+    )
+
+
+@asynccontextmanager
+async def lifespan(app):
+    events.bind(asyncio.get_running_loop())
+    add_event_sink(events.publish)
+
+    daemon = await asyncio.to_thread(_start_pipeline, REFRESH_INTERVAL)
+    task = asyncio.create_task(daemon.serve())
+    app.state.daemon = daemon
+    yield
+
+    daemon.stop()
+    await task
+    remove_event_sink(events.publish)
+
+
+app = FastAPI(title="Data Intelligence System", lifespan=lifespan)
+
+
+def _json(section):
+    return Response(content=snapshots.payload(section), media_type="application/json")
+
+
+# -------------------------------
+# Routes
+# -------------------------------
+@app.get("/health")
+async def health():
+    return {"status": "ok", "version": snapshots.version}
+
+
+@app.get("/snapshot")
+async def snapshot():
+    return _json("snapshot")
+
+
+@app.get("/source")
+async def selected_source():
+    return _json("source")
+
+
+@app.get("/bandit")
+async def bandit_estimates():
+    return _json("bandit")
+
+
+@app.get("/budget")
+async def budget():
+    return _json("budget")
+
+
+@app.get("/forecast")
+async def forecast():
+    return _json("forecast")
+
+
+@app.get("/providers")
+async def providers():
+    """
+    Circuit breaker state and hedge win rates per market data provider.
+    """
+    from data_sources.silver_sources import provider_health
+    return provider_health()
+
+
+@app.get("/metrics")
+async def metrics_exposition():
+    return Response(content=metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.get("/events")
+async def event_stream(request: Request, cursor: int = None):
+    """
+    Server-Sent Events feed of DECISION / REWARD / LEARNING / PREDICTION.
+    Reconnecting clients resume via Last-Event-ID (or ?cursor=); a
+    `reset` event means events were missed and the history is replayed.
+    """
+    last_id = request.headers.get("last-event-id")
+    if last_id is not None and last_id.isdigit():
+        cursor = int(last_id)
+
+    return StreamingResponse(
+        events.stream(cursor),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host=os.getenv("API_HOST", "127.0.0.1"), port=int(os.getenv("API_PORT", "8000")))
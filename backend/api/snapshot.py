@@ -0,0 +1,98 @@
+import json
+import math
+import threading
+import time
+
+
+def _clean(value):
+    """
+    JSON-safe conversion (NumPy scalars, NaN/inf → None).
+    """
+    if isinstance(value, dict):
+        return {str(k): _clean(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clean(v) for v in value]
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class SnapshotStore:
+    """
+    Latest pipeline state, precomputed for serving.
+
+    The background pipeline calls `publish()` after each cycle; every
+    section is serialized to JSON bytes once, so a request is a dict
+    lookup and never waits on a model fit or an upstream API.
+    """
+
+    SECTIONS = ("source", "bandit", "budget", "forecast")
+
+    def __init__(self, horizon_steps=5, alpha=0.05):
+        self.horizon_steps = horizon_steps
+        self.alpha = alpha
+
+        self._lock = threading.Lock()
+        self._payloads = {}
+        self.version = 0
+
+        self._swap({"status": "warming_up", "version": 0, "updated_at": None})
+
+    # -------------------------------
+    # Writes (pipeline thread)
+    # -------------------------------
+    def publish(self, pipeline, result=None):
+        agent = pipeline.agent
+        bandit = agent.bandit
+
+        forecast = pipeline.predictor.predict_horizon(steps=self.horizon_steps, alpha=self.alpha)
+
+        state = {
+            "status": "ok",
+            "version": self.version + 1,
+            "updated_at": time.time(),
+            "timestep": pipeline.env.time_step,
+            "source": None if result is None else {
+                "name": result["source"],
+                "score": result["score"],
+                "reward": result["reward"],
+            },
+            "bandit": {
+                name: {"value": bandit.get_estimated_value(name), "count": bandit.get_count(name)}
+                for name in bandit.arms
+            },
+            "budget": {
+                "total": agent.total_budget,
+                "remaining": agent.remaining_budget,
+                "epsilon": agent.epsilon,
+            },
+            "forecast": {
+                "next": None if result is None else result["prediction"],
+                "horizon": forecast,
+            },
+        }
+
+        self._swap(state)
+
+    def _swap(self, state):
+        state = _clean(state)
+        payloads = {"snapshot": json.dumps(state).encode()}
+
+        for section in self.SECTIONS:
+            payloads[section] = json.dumps({
+                "version": state.get("version"),
+                "updated_at": state.get("updated_at"),
+                section: state.get(section),
+            }).encode()
+
+        with self._lock:
+            self._payloads = payloads
+            self.version = state.get("version", 0)
+
+    # -------------------------------
+    # Reads (request path)
+    # -------------------------------
+    def payload(self, section="snapshot"):
+        return self._payloads[section]
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import argparse
+import warnings
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from models.silver_predictor_arima import SilverPricePredictorARIMA
+
+
+def synthetic_prices(n, seed=7):
+    rng = np.random.default_rng(seed)
+    return list(24.0 + np.cumsum(rng.normal(0, 0.05, n)))
+
+
+def bench_history_size(size, ticks, refit_interval):
+    """
+    Warms a predictor with `size` prices (untimed initial fit), then
+    times add_price + predict_next for `ticks` new prices.
+    """
+    prices = synthetic_prices(size + ticks)
+
+    predictor = SilverPricePredictorARIMA(
+        incremental=True,
+        refit_interval=refit_interval,
+        drift_threshold=float("inf"),
+        window_size=size + ticks
+    )
+
+    for price in prices[:size]:
+        predictor.add_price(price)
+    predictor.predict_next()
+
+    latencies = []
+    for price in prices[size:]:
+        start = time.perf_counter()
+        predictor.add_price(price)
+        predictor.predict_next()
+        latencies.append(time.perf_counter() - start)
+
+    return np.array(latencies) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-tick ARIMA latency vs history size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+
+    print(f"{'history':>10} | {'p50 ms':>8} | {'p99 ms':>8} | {'mean ms':>8}")
+    for size in args.sizes:
+        # Refit never triggers inside the timed window
+        ms = bench_history_size(size, args.ticks, refit_interval=args.ticks + 1)
+        print(
+            f"{size:>10} | {np.percentile(ms, 50):>8.3f} | "
+            f"{np.percentile(ms, 99):>8.3f} | {ms.mean():>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+
+async def _worker(host, port, path, deadline, latencies, errors):
+    """
+    One keep-alive HTTP/1.1 connection issuing GETs back to back.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    request = (
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Connection: keep-alive\r\n\r\n"
+    ).encode()
+
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+
+            headers = await reader.readuntil(b"\r\n\r\n")
+            status = int(headers.split(b" ", 2)[1])
+            length = 0
+            for line in headers.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, path, concurrency, duration):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _worker(host, port, path, deadline, latencies, errors)
+        for _ in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    return latencies, errors, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local load test for the API service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--path", default="/snapshot")
+    parser.add_argument("-c", "--concurrency", type=int, default=50)
+    parser.add_argument("-d", "--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    latencies, errors, elapsed = asyncio.run(
+        run_load(args.host, args.port, args.path, args.concurrency, args.duration)
+    )
+
+    if not latencies:
+        print("No requests completed.")
+        return
+
+    ms = np.array(latencies) * 1000
+    print(f"GET {args.path} | concurrency {args.concurrency} | {elapsed:.1f}s")
+    print(f"requests:   {len(ms)} ({len(errors)} non-200)")
+    print(f"throughput: {len(ms) / elapsed:.1f} req/s")
+    print(f"latency:    p50 {np.percentile(ms, 50):.2f} ms | p99 {np.percentile(ms, 99):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import platform
+import warnings
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from agent.agent import DataCollectionAgent
+from agent.population import AgentPopulation, market_rewards
+from data_sources.source_cache import SourceSnapshotCache
+from environment.environment import SilverMarketEnvironment
+from environment.replay import ReplayMarketEnvironment
+from intelligence.sentiment import SentimentAnalyzer
+from learning.bandit import MultiArmedBandit
+from models.silver_predictor_arima import SilverPricePredictorARIMA
+
+
+SEED = 1234
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(HERE, "results.json")
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+
+# name → (setup, iterations); setup returns the callable to time
+BENCHMARKS = {}
+
+
+def benchmark(name, iterations):
+    def register(setup):
+        BENCHMARKS[name] = (setup, iterations)
+        return setup
+    return register
+
+
+# -------------------------------
+# Offline stubs
+# -------------------------------
+def stub_sources(n_sources, rng):
+    return {
+        f"source_{i}": {
+            "freshness": float(rng.uniform(0.6, 1.0)),
+            "reliability": float(rng.uniform(0.6, 1.0)),
+            "cost": float(rng.uniform(0.1, 0.5)),
+            "value": float(rng.uniform(20, 30)),
+            "provider": "Stub",
+            "last_updated": 0.0
+        }
+        for i in range(n_sources)
+    }
+
+
+def synthetic_prices(n, rng):
+    return list(24.0 + np.cumsum(rng.normal(0, 0.05, n)))
+
+
+# -------------------------------
+# Cases
+# -------------------------------
+def _arima_case(history, incremental):
+    def setup(rng):
+        prices = synthetic_prices(history + 10_000, rng)
+        predictor = SilverPricePredictorARIMA(incremental=incremental, window_size=history)
+        for price in prices[:history]:
+            predictor.add_price(price)
+        predictor.predict_next()
+
+        feed = iter(prices[history:])
+
+        def run():
+            predictor.add_price(next(feed))
+            predictor.predict_next()
+        return run
+    return setup
+
+
+for _history, _iterations in ((50, 20), (200, 10), (1000, 5)):
+    benchmark(f"arima_predict_next_full_{_history}", _iterations)(_arima_case(_history, False))
+    benchmark(f"arima_predict_next_incremental_{_history}", 200)(_arima_case(_history, True))
+
+
+@benchmark("agent_select_best_source_1000", 200)
+def _agent_select(rng):
+    random.seed(SEED)
+    env = ReplayMarketEnvironment.synthetic(n_sources=1000, n_frames=10, seed=SEED)
+    agent = DataCollectionAgent(total_budget=1e9, epsilon=0.0)
+
+    def run():
+        agent.select_best_source(env)
+    return run
+
+
+@benchmark("agent_population_step_1000x10", 500)
+def _population_step(rng):
+    env = ReplayMarketEnvironment.synthetic(n_sources=10, n_frames=1000, seed=SEED)
+    fields = env.fields
+    rewards = market_rewards(fields)
+    population = AgentPopulation(10, epsilon=rng.uniform(0, 0.5, 1000), total_budget=1e9, seed=SEED)
+    frames = iter(range(10**9))
+
+    def run():
+        t = next(frames) % len(rewards)
+        population.step(fields["freshness"][t], fields["reliability"][t], fields["cost"][t], rewards[t])
+    return run
+
+
+@benchmark("environment_calculate_reward", 20_000)
+def _env_reward(rng):
+    sources = stub_sources(10, rng)
+    cache = SourceSnapshotCache(fetch=lambda deadline, providers: {})
+    env = SilverMarketEnvironment(cache=cache)
+    env.sources = sources
+    names = list(sources)
+
+    def run():
+        env.calculate_reward(names[0])
+    return run
+
+
+@benchmark("bandit_update", 100_000)
+def _bandit_update(rng):
+    bandit = MultiArmedBandit()
+    names = [f"arm_{i}" for i in rng.integers(0, 100, 100_000)]
+    rewards = rng.normal(0, 1, 100_000).tolist()
+    feed = iter(zip(names, rewards))
+
+    def run():
+        bandit.update(*next(feed))
+    return run
+
+
+@benchmark("sentiment_analyze_news", 500)
+def _sentiment(rng):
+    analyzer = SentimentAnalyzer()
+    words = ["silver", "rally", "slump", "strong", "weak", "record", "demand", "fears"]
+    pool = [" ".join(rng.choice(words, 12)) for _ in range(40)]
+
+    # Each poll returns 10 headlines, mostly repeated from the last poll
+    def fetch_news(query="silver price"):
+        start = int(rng.integers(0, 30))
+        return pool[start:start + 10]
+
+    analyzer.fetch_news = fetch_news
+
+    def run():
+        analyzer.analyze()
+    return run
+
+
+# -------------------------------
+# Runner
+# -------------------------------
+def time_case(run, iterations, warmup):
+    for _ in range(warmup):
+        run()
+
+    latencies = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        run()
+        latencies[i] = time.perf_counter() - start
+
+    return latencies
+
+
+def summarize(latencies):
+    total = float(latencies.sum())
+    return {
+        "iterations": int(len(latencies)),
+        "ops_per_sec": round(len(latencies) / total, 2) if total > 0 else float("inf"),
+        "p50_us": round(float(np.percentile(latencies, 50)) * 1e6, 3),
+        "p99_us": round(float(np.percentile(latencies, 99)) * 1e6, 3),
+        "mean_us": round(float(latencies.mean()) * 1e6, 3),
+    }
+
+
+def find_regressions(results, baseline, tolerance):
+    """
+    A case regresses when its p50 latency exceeds the baseline p50
+    by more than `tolerance` (fractional, e.g. 0.25 = 25%).
+    """
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+
+        limit = base["p50_us"] * (1 + tolerance)
+        if stats["p50_us"] > limit:
+            regressions.append((name, base["p50_us"], stats["p50_us"]))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backend hot-path benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="run cases whose name contains this")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply iteration counts")
+    args = parser.parse_args(argv)
+
+    warnings.simplefilter("ignore")
+    logging.disable(logging.CRITICAL)
+
+    results = {}
+    for name, (setup, iterations) in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+
+        rng = np.random.default_rng(SEED)
+        run = setup(rng)
+        iterations = max(1, int(iterations * args.scale))
+        stats = summarize(time_case(run, iterations, warmup=max(1, iterations // 10)))
+        results[name] = stats
+
+        print(
+            f"{name:<42} {stats['ops_per_sec']:>12.1f} ops/s  "
+            f"p50 {stats['p50_us']:>11.1f} us  p99 {stats['p99_us']:>11.1f} us"
+        )
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --save-baseline to create one.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for name, base, now in regressions:
+        print(f"REGRESSION | {name} | p50 {base:.1f} us -> {now:.1f} us")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+import threading
+import time
+
+import numpy as np
+
+from data_sources.price_store import index_to_epoch, record_prices
+
+
+# Bars kept in memory per (ticker, interval)
+MAX_BARS = 5000
+
+# How far back Yahoo serves intraday bars, in seconds; a series whose
+# last bar is older than this can't be resumed and is refetched
+DAY = 86400
+MAX_LOOKBACK = {
+    "1m": 7 * DAY,
+    "2m": 60 * DAY, "5m": 60 * DAY, "15m": 60 * DAY, "30m": 60 * DAY, "90m": 60 * DAY,
+    "60m": 730 * DAY, "1h": 730 * DAY,
+}
+
+_default_fetcher = None
+_default_lock = threading.Lock()
+
+
+class YahooDeltaFetcher:
+    """
+    Incremental Yahoo Finance history fetcher.
+
+    Remembers the last bar timestamp per (ticker, interval) and only
+    requests bars from that bar onward (the last bar is re-fetched
+    because it may still be forming). New bars are merged into a
+    bounded in-memory series, so payload and parse time per poll scale
+    with new data only. When the last bar is older than the interval's
+    MAX_LOOKBACK, the series is reset from `initial_period` instead.
+    """
+
+    def __init__(self, max_bars=MAX_BARS, store=True, clock=time.time):
+        self.max_bars = max_bars
+        self.store = store
+        self._clock = clock
+
+        self._series = {}   # (ticker, interval) → {"ts", "close", "volume"}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+    def update(self, ticker_symbol, interval="1m", initial_period="1d", timeout=10):
+        """
+        Fetches bars newer than the last known one and merges them.
+        Returns the merged series as {"ts", "close", "volume"} arrays.
+        """
+        import yfinance as yf
+
+        key = (ticker_symbol, interval)
+
+        series = self._series.get(key)
+        ticker = yf.Ticker(ticker_symbol)
+
+        # The request runs outside the lock so concurrent (e.g. hedged)
+        # updates don't queue behind each other; merging replaces bars
+        # from the first new one on and ignores responses older than
+        # the merged series, so overlapping fetches are safe.
+        empty = series is None or len(series["ts"]) == 0
+        expired = not empty and self._expired(series, interval)
+        if empty or expired:
+            hist = ticker.history(period=initial_period, interval=interval, timeout=timeout)
+        else:
+            hist = ticker.history(start=int(series["ts"][-1]), interval=interval, timeout=timeout)
+
+        with self._key_lock(key):
+            if hist is not None and len(hist):
+                return self._merge(key, None if expired else self._series.get(key), hist)
+
+            series = self._series.get(key)
+            return series if series is not None else self._empty()
+
+    def series(self, ticker_symbol, interval="1m"):
+        return self._series.get((ticker_symbol, interval), self._empty())
+
+    def last_close(self, ticker_symbol, interval="1m", **kwargs):
+        closes = self.update(ticker_symbol, interval, **kwargs)["close"]
+        return float(closes[-1]) if len(closes) else None
+
+    # -------------------------------
+    # Internals
+    # -------------------------------
+    @staticmethod
+    def _empty():
+        return {"ts": np.empty(0), "close": np.empty(0), "volume": np.empty(0)}
+
+    def _expired(self, series, interval):
+        lookback = MAX_LOOKBACK.get(interval)
+        return lookback is not None and self._clock() - series["ts"][-1] > lookback
+
+    def _merge(self, key, series, hist):
+        new = {
+            "ts": index_to_epoch(hist.index),
+            "close": hist["Close"].to_numpy(dtype=float),
+            "volume": hist["Volume"].to_numpy(dtype=float) if "Volume" in hist else np.zeros(len(hist)),
+        }
+
+        if series is None or len(series["ts"]) == 0:
+            merged = new
+        elif new["ts"][-1] < series["ts"][-1]:
+            # A slower, overlapping request (e.g. the losing side of a
+            # hedge) finished after a newer merge; don't roll back
+            return series
+        else:
+            # Bars at or after the first new bar are replaced
+            keep = series["ts"] < new["ts"][0]
+            merged = {
+                field: np.concatenate([series[field][keep], new[field]])[-self.max_bars:]
+                for field in new
+            }
+
+        self._series[key] = merged
+
+        if self.store:
+            record_prices(key[0], new["ts"], new["close"])
+
+        return merged
+
+
+def get_default_fetcher():
+    global _default_fetcher
+    with _default_lock:
+        if _default_fetcher is None:
+            _default_fetcher = YahooDeltaFetcher()
+    return _default_fetcher
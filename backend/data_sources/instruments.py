@@ -0,0 +1,70 @@
+import numpy as np
+
+
+# -------------------------------
+# Instrument Registry
+# -------------------------------
+# name → (Yahoo ticker, label)
+INSTRUMENTS = {
+    "silver": ("SI=F", "Silver Futures (COMEX)"),
+    "silver_spot": ("XAGUSD=X", "Silver Spot (USD)"),
+    "gold": ("GC=F", "Gold Futures (COMEX)"),
+    "platinum": ("PL=F", "Platinum Futures (NYMEX)"),
+    "palladium": ("PA=F", "Palladium Futures (NYMEX)"),
+    "copper": ("HG=F", "Copper Futures (COMEX)"),
+    "aluminum": ("ALI=F", "Aluminum Futures (COMEX)"),
+    "eurusd": ("EURUSD=X", "EUR/USD"),
+    "gbpusd": ("GBPUSD=X", "GBP/USD"),
+    "usdjpy": ("JPY=X", "USD/JPY"),
+    "usdchf": ("CHF=X", "USD/CHF"),
+    "audusd": ("AUDUSD=X", "AUD/USD"),
+    "usdcad": ("CAD=X", "USD/CAD"),
+    "usdcny": ("CNY=X", "USD/CNY"),
+    "usdinr": ("INR=X", "USD/INR"),
+}
+
+
+def ticker_for(name):
+    return INSTRUMENTS[name][0]
+
+
+def fetch_histories(names=None, period="5d", interval="1h", timeout=10):
+    """
+    Downloads close histories for many instruments in one bulk request.
+
+    Returns {name: np.ndarray of closes (oldest first, NaNs dropped)}.
+    Instruments with no data are omitted.
+    """
+    import yfinance as yf
+
+    names = list(names or INSTRUMENTS)
+    tickers = [ticker_for(n) for n in names]
+
+    frame = yf.download(
+        tickers,
+        period=period,
+        interval=interval,
+        group_by="column",
+        progress=False,
+        threads=True,
+        timeout=timeout,
+        multi_level_index=True
+    )
+
+    histories = {}
+    if frame is None or frame.empty:
+        return histories
+
+    closes = frame["Close"]
+
+    for name, ticker in zip(names, tickers):
+        if ticker not in closes:
+            continue
+
+        series = closes[ticker].to_numpy(dtype=float)
+        series = series[~np.isnan(series)]
+
+        if len(series):
+            histories[name] = series
+
+    return histories
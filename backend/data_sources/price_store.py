@@ -0,0 +1,160 @@
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+
+# -------------------------------
+# Config
+# -------------------------------
+DEFAULT_ROOT = os.getenv(
+    "PRICE_STORE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "prices")
+)
+
+RECORD = np.dtype([("ts", "<f8"), ("price", "<f8")])
+
+_default_store = None
+_default_lock = threading.Lock()
+
+
+class PriceStore:
+    """
+    Local append-only time-series store, one binary file of
+    (timestamp, price) records per instrument.
+
+    Reads memory-map the file, so a range read is a binary search plus
+    a slice: no parsing and no network. Records are kept in timestamp
+    order; points before the last stored timestamp are dropped, and a
+    point at it replaces the stored one (that bar may still be forming).
+    """
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._last_ts = {}
+
+    # -------------------------------
+    # Paths
+    # -------------------------------
+    def _path(self, instrument):
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", instrument)
+        return os.path.join(self.root, f"{safe}.bin")
+
+    # -------------------------------
+    # Writes
+    # -------------------------------
+    def append(self, instrument, price, timestamp=None):
+        self.append_many(instrument, [time.time() if timestamp is None else timestamp], [price])
+
+    def append_many(self, instrument, timestamps, prices):
+        """
+        Appends records newer than the last stored timestamp and revises
+        the last stored record in place. Duplicate timestamps keep their
+        latest price. Returns the number of records written.
+        """
+        records = np.empty(len(timestamps), dtype=RECORD)
+        records["ts"] = np.asarray(timestamps, dtype=float)
+        records["price"] = np.asarray(prices, dtype=float)
+
+        records = records[np.isfinite(records["price"])]
+        records = records[np.argsort(records["ts"], kind="stable")]
+
+        with self._lock:
+            last_ts = self.last_timestamp(instrument)
+            if last_ts is not None:
+                records = records[records["ts"] >= last_ts]
+
+            if len(records) > 1:
+                keep = np.ones(len(records), dtype=bool)
+                keep[:-1] = np.diff(records["ts"]) > 0
+                records = records[keep]
+
+            if len(records) == 0:
+                return 0
+
+            revise = records["ts"][0] == last_ts
+            with open(self._path(instrument), "r+b" if revise else "ab") as f:
+                if revise:
+                    f.seek(-RECORD.itemsize, os.SEEK_END)
+                f.write(records.tobytes())
+
+            self._last_ts[instrument] = float(records["ts"][-1])
+
+        return len(records)
+
+    # -------------------------------
+    # Reads
+    # -------------------------------
+    def _records(self, instrument):
+        path = self._path(instrument)
+        if not os.path.exists(path) or os.path.getsize(path) < RECORD.itemsize:
+            return np.empty(0, dtype=RECORD)
+
+        count = os.path.getsize(path) // RECORD.itemsize
+        return np.memmap(path, dtype=RECORD, mode="r", shape=(count,))
+
+    def last_timestamp(self, instrument):
+        if instrument not in self._last_ts:
+            records = self._records(instrument)
+            self._last_ts[instrument] = float(records["ts"][-1]) if len(records) else None
+        return self._last_ts[instrument]
+
+    def read_range(self, instrument, start=None, end=None):
+        """
+        Returns (timestamps, prices) with start <= ts <= end.
+        """
+        records = self._records(instrument)
+        ts = records["ts"]
+
+        lo = 0 if start is None else int(np.searchsorted(ts, start, side="left"))
+        hi = len(records) if end is None else int(np.searchsorted(ts, end, side="right"))
+
+        window = records[lo:hi]
+        return np.array(window["ts"]), np.array(window["price"])
+
+    def tail(self, instrument, n):
+        """
+        Returns the newest `n` prices (oldest first).
+        """
+        records = self._records(instrument)
+        return np.array(records["price"][-n:]) if n > 0 else np.empty(0)
+
+
+def index_to_epoch(index):
+    """
+    pandas DatetimeIndex → float epoch seconds.
+    """
+    return index.as_unit("ns").asi8 / 1e9
+
+
+def get_default_store():
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = PriceStore()
+    return _default_store
+
+
+def record_price(instrument, price, timestamp=None):
+    """
+    Best-effort write used by fetch paths; never raises.
+    """
+    try:
+        get_default_store().append(instrument, price, timestamp)
+    except Exception as e:
+        print("Price store error:", e)
+
+
+def record_prices(instrument, timestamps, prices):
+    """
+    Best-effort bulk write used by fetch paths; never raises.
+    """
+    try:
+        get_default_store().append_many(instrument, timestamps, prices)
+    except Exception as e:
+        print("Price store error:", e)
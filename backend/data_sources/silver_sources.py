@@ -1,13 +1,39 @@
 import os
+import threading
 import time
-import requests
-import yfinance as yf
+from collections import deque
+from data_sources.delta_fetcher import get_default_fetcher
+from data_sources.price_store import record_price
+from utils import http_client, metrics
+from utils.circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dotenv import load_dotenv
 
 load_dotenv()
 
 ALPHA_KEY = os.getenv("ALPHAVANTAGE_API_KEY")
 
+# Global deadline for one refresh cycle (seconds)
+CYCLE_DEADLINE = 5.0
+
+# Circuit breaker: open after N consecutive failures, probe after reset
+BREAKER_FAILURES = 3
+BREAKER_RESET = 30.0
+
+# Hedged requests: duplicate a slow call after the provider's p95 latency
+HEDGED_PROVIDERS = {p for p in os.getenv("SILVER_HEDGED_PROVIDERS", "").split(",") if p}
+HEDGE_DEFAULT_DELAY = 1.0
+HEDGE_MIN_SAMPLES = 20
+HEDGE_PERCENTILE = 0.95
+
+# Shared pool so a refresh never pays thread start-up cost
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="silver-source")
+
+# Separate pool for individual (possibly hedged) attempts
+_attempt_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="silver-attempt")
+
+BREAKER_STATE_CODES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
 
 def normalize(value, min_val, max_val):
     if max_val - min_val == 0:
@@ -15,73 +41,235 @@ def normalize(value, min_val, max_val):
     return max(0.0, min(1.0, (value - min_val) / (max_val - min_val)))
 
 
-def get_silver_data_sources():
+# -------------------------------
+# 1️⃣ Yahoo Finance — Spot Silver
+# -------------------------------
+def fetch_spot_silver(now, timeout):
+    price = get_default_fetcher().update("SI=F", interval="1m", timeout=timeout)["close"][-1]
+
+    return {
+        "freshness": 0.95,
+        "reliability": 0.95,
+        "cost": 0.3,
+        "value": float(price),
+        "provider": "YahooFinance",
+        "last_updated": now
+    }
+
+
+# ---------------------------------
+# 2️⃣ Yahoo Finance — Silver Futures
+# ---------------------------------
+def fetch_silver_futures(now, timeout):
+    volume = get_default_fetcher().update("SIL", interval="1d", timeout=timeout)["volume"][-1]
+
+    return {
+        "freshness": 0.9,
+        "reliability": 0.9,
+        "cost": 0.35,
+        "value": normalize(volume, 0, 1e8),
+        "provider": "YahooFinance",
+        "last_updated": now
+    }
+
+
+# -------------------------------
+# 3️⃣ Alpha Vantage — Silver Price
+# -------------------------------
+def fetch_alphavantage_silver(now, timeout):
+    url = (
+        "https://www.alphavantage.co/query?"
+        "function=COMMODITY_EXCHANGE_RATE"
+        "&from_currency=XAG"
+        "&to_currency=USD"
+        f"&apikey={ALPHA_KEY}"
+    )
+    data = http_client.get(url, timeout=timeout).json()
+    price = float(data["Realtime Commodity Exchange Rate"]["5. Exchange Rate"])
+    record_price("XAGUSD", price, now)
+
+    return {
+        "freshness": 0.85,
+        "reliability": 0.9,
+        "cost": 0.4,
+        "value": normalize(price, 10, 40),
+        "provider": "AlphaVantage",
+        "last_updated": now
+    }
+
+
+# source name → (fetcher, per-source timeout in seconds)
+PROVIDERS = {
+    "spot_silver": (fetch_spot_silver, 4.0),
+    "silver_futures": (fetch_silver_futures, 4.0),
+    "alphavantage_silver": (fetch_alphavantage_silver, 4.0),
+}
+
+
+BREAKERS = {name: CircuitBreaker(BREAKER_FAILURES, BREAKER_RESET) for name in PROVIDERS}
+
+# Written from the fetch pools, read by /providers; guarded by _stats_lock
+_latencies = {name: deque(maxlen=200) for name in PROVIDERS}
+_hedges = {name: {"fired": 0, "won": 0} for name in PROVIDERS}
+_stats_lock = threading.Lock()
+
+
+def hedge_delay(name):
     """
-    Live silver data sources for autonomous agent evaluation
+    p95 of recent successful fetch latencies (default until warmed up).
     """
+    with _stats_lock:
+        samples = sorted(_latencies[name])
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DEFAULT_DELAY
+    return samples[int(HEDGE_PERCENTILE * (len(samples) - 1))]
 
-    sources = {}
-    now = time.time()
 
-    # -------------------------------
-    # 1️⃣ Yahoo Finance — Spot Silver
-    # -------------------------------
-    try:
-        ticker = yf.Ticker("SI=F")
-        price = ticker.history(period="1d")["Close"].iloc[-1]
-
-        sources["spot_silver"] = {
-            "freshness": 0.95,
-            "reliability": 0.95,
-            "cost": 0.3,
-            "value": float(price),
-            "provider": "YahooFinance",
-            "last_updated": now
-        }
-    except Exception:
-        pass
+def _hedged_fetch(name, fetcher, now, timeout):
+    """
+    Starts one attempt and, if it has not finished after hedge_delay,
+    a duplicate. Returns the first successful result.
+    """
+    deadline = time.perf_counter() + timeout
+    primary = _attempt_executor.submit(fetcher, now, timeout)
+    attempts = {primary}
 
-    # ---------------------------------
-    # 2️⃣ Yahoo Finance — Silver Futures
-    # ---------------------------------
-    try:
-        futures = yf.Ticker("SIL")
-        volume = futures.history(period="1d")["Volume"].iloc[-1]
-
-        sources["silver_futures"] = {
-            "freshness": 0.9,
-            "reliability": 0.9,
-            "cost": 0.35,
-            "value": normalize(volume, 0, 1e8),
-            "provider": "YahooFinance",
-            "last_updated": now
-        }
-    except Exception:
-        pass
+    done, _ = wait(attempts, timeout=min(hedge_delay(name), timeout))
+    if not done:
+        attempts.add(_attempt_executor.submit(fetcher, now, timeout))
+        _count_hedge(name, "fired")
 
-    # -------------------------------
-    # 3️⃣ Alpha Vantage — Silver Price
-    # -------------------------------
-    try:
-        url = (
-            "https://www.alphavantage.co/query?"
-            "function=COMMODITY_EXCHANGE_RATE"
-            "&from_currency=XAG"
-            "&to_currency=USD"
-            f"&apikey={ALPHA_KEY}"
+    error = None
+    while attempts:
+        done, attempts = wait(
+            attempts, timeout=max(0.0, deadline - time.perf_counter()), return_when=FIRST_COMPLETED
         )
-        data = requests.get(url, timeout=10).json()
-        price = float(data["Realtime Commodity Exchange Rate"]["5. Exchange Rate"])
-
-        sources["alphavantage_silver"] = {
-            "freshness": 0.85,
-            "reliability": 0.9,
-            "cost": 0.4,
-            "value": normalize(price, 10, 40),
-            "provider": "AlphaVantage",
-            "last_updated": now
+        if not done:
+            raise TimeoutError(f"{name} timed out after {timeout}s")
+
+        for future in done:
+            try:
+                result = future.result()
+            except Exception as e:
+                error = e
+                continue
+
+            if future is not primary:
+                _count_hedge(name, "won")
+            return result
+
+    raise error
+
+
+def _count_hedge(name, result):
+    with _stats_lock:
+        _hedges[name][result] += 1
+    metrics.counter("provider_hedges", "Hedged provider requests", provider=name, result=result).inc()
+
+
+def _timed_fetch(name, fetcher, now, timeout, hedge):
+    start = time.perf_counter()
+    try:
+        if hedge:
+            source = _hedged_fetch(name, fetcher, now, timeout)
+        else:
+            source = fetcher(now, timeout)
+        return source, None, time.perf_counter() - start
+    except Exception as e:
+        return None, e, time.perf_counter() - start
+
+
+def _record_outcome(name, status, elapsed):
+    breaker = BREAKERS[name]
+    if status == "ok":
+        breaker.record_success()
+        with _stats_lock:
+            _latencies[name].append(elapsed)
+    else:
+        breaker.record_failure()
+
+    metrics.gauge(
+        "provider_breaker_state", "0 closed, 1 half-open, 2 open", provider=name
+    ).set(BREAKER_STATE_CODES[breaker.state])
+
+
+def provider_health():
+    """
+    Breaker state, hedge delay and hedge win rate per provider.
+    """
+    health = {}
+    for name in PROVIDERS:
+        with _stats_lock:
+            fired, won = _hedges[name]["fired"], _hedges[name]["won"]
+        health[name] = {
+            "breaker": BREAKERS[name].snapshot(),
+            "hedged": name in HEDGED_PROVIDERS,
+            "hedge_delay": round(hedge_delay(name), 4),
+            "hedges_fired": fired,
+            "hedges_won": won,
+            "hedge_win_rate": round(won / fired, 4) if fired else None,
         }
-    except Exception:
-        pass
+    return health
+
+
+def get_silver_data_sources(deadline=CYCLE_DEADLINE, with_timings=False, providers=None, hedged=None):
+    """
+    Live silver data sources for autonomous agent evaluation.
+
+    All providers are fetched concurrently. Sources that have not
+    finished within `deadline` seconds are left out of this cycle, so
+    refresh latency is bounded by the deadline instead of the sum of
+    provider latencies.
+
+    Providers whose circuit breaker is open are skipped without a
+    request. Providers in `hedged` (default HEDGED_PROVIDERS) get a
+    duplicate request once their p95 latency has passed.
+
+    With `with_timings=True`, returns (sources, timings) where timings
+    maps each provider to {"status": "ok"|"error"|"timeout"|"open", "elapsed"}.
+    `providers` restricts the fetch to a subset of PROVIDERS names.
+    """
+
+    sources = {}
+    timings = {}
+    now = time.time()
+    hedged = HEDGED_PROVIDERS if hedged is None else hedged
+
+    futures = {}
+    for name, (fetcher, timeout) in PROVIDERS.items():
+        if providers is not None and name not in providers:
+            continue
+
+        if not BREAKERS[name].allow():
+            timings[name] = {"status": "open", "elapsed": 0.0}
+            continue
+
+        future = _executor.submit(_timed_fetch, name, fetcher, now, min(timeout, deadline), name in hedged)
+        futures[future] = name
+
+    done, _ = wait(futures, timeout=deadline)
+
+    # Iterate in provider order so the sources dict stays stable
+    for future, name in futures.items():
+        if future not in done:
+            timings[name] = {"status": "timeout", "elapsed": deadline}
+            continue
+
+        source, error, elapsed = future.result()
+        metrics.histogram("provider_fetch_seconds", "Provider fetch latency", provider=name).observe(elapsed)
+
+        if error is None:
+            source["fetch_ms"] = round(elapsed * 1000, 2)
+            sources[name] = source
+            timings[name] = {"status": "ok", "elapsed": elapsed}
+        else:
+            timings[name] = {"status": "error", "elapsed": elapsed}
+
+    for name, timing in timings.items():
+        metrics.counter("provider_fetches", "Provider fetches by outcome", provider=name, status=timing["status"]).inc()
+        if timing["status"] != "open":
+            _record_outcome(name, timing["status"], timing["elapsed"])
 
+    if with_timings:
+        return sources, timings
     return sources
@@ -0,0 +1,146 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from data_sources.silver_sources import PROVIDERS, CYCLE_DEADLINE, get_silver_data_sources
+from utils import metrics
+
+CACHE_LOOKUPS = {
+    result: metrics.counter("source_cache_lookups", "Source cache lookups by result", result=result)
+    for result in ("hit", "stale", "miss")
+}
+
+
+class SourceSnapshotCache:
+    """
+    Per-provider TTL cache of live source snapshots with
+    stale-while-revalidate semantics.
+
+    - age < ttl             → served from cache
+    - ttl <= age < max_stale → served from cache, refreshed in background
+    - otherwise             → fetched synchronously (under the cycle deadline)
+
+    `last_updated` is the real fetch time and `freshness` decays with
+    cache age, halving every `freshness_half_life` seconds.
+    """
+
+    def __init__(
+        self,
+        ttls=None,
+        default_ttl=30.0,
+        max_stale=300.0,
+        freshness_half_life=300.0,
+        deadline=CYCLE_DEADLINE,
+        fetch=get_silver_data_sources
+    ):
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.max_stale = max_stale
+        self.freshness_half_life = freshness_half_life
+        self.deadline = deadline
+        self._fetch = fetch
+
+        self._entries = {}          # name → {"source", "fetched_at"}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="source-cache")
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+    def get_sources(self):
+        """
+        Returns {name: source} for every provider with a usable snapshot.
+        """
+        now = time.time()
+        to_fetch = []
+        to_revalidate = []
+
+        with self._lock:
+            for name in PROVIDERS:
+                entry = self._entries.get(name)
+                age = None if entry is None else now - entry["fetched_at"]
+
+                if age is None or age >= self.max_stale:
+                    to_fetch.append(name)
+                    self.misses += 1
+                    CACHE_LOOKUPS["miss"].inc()
+                elif age >= self.ttl_for(name):
+                    to_revalidate.append(name)
+                    self.stale_hits += 1
+                    CACHE_LOOKUPS["stale"].inc()
+                else:
+                    self.hits += 1
+                    CACHE_LOOKUPS["hit"].inc()
+
+        if to_fetch:
+            self._store(self._fetch(deadline=self.deadline, providers=to_fetch))
+
+        for name in to_revalidate:
+            self._revalidate(name)
+
+        return self.snapshot()
+
+    def snapshot(self):
+        """
+        Returns cached sources with age-derived freshness, without I/O.
+        """
+        now = time.time()
+        sources = {}
+
+        with self._lock:
+            for name in PROVIDERS:
+                entry = self._entries.get(name)
+                if entry is None:
+                    continue
+
+                age = now - entry["fetched_at"]
+                if age >= self.max_stale:
+                    continue
+
+                source = dict(entry["source"])
+                decay = 0.5 ** (age / self.freshness_half_life)
+                source["freshness"] = round(entry["source"]["freshness"] * decay, 4)
+                source["last_updated"] = entry["fetched_at"]
+                source["age"] = round(age, 3)
+                sources[name] = source
+
+        return sources
+
+    def ttl_for(self, name):
+        return self.ttls.get(name, self.default_ttl)
+
+    def invalidate(self, name=None):
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    # -------------------------------
+    # Internals
+    # -------------------------------
+    def _store(self, fetched):
+        fetched_at = time.time()
+        with self._lock:
+            for name, source in fetched.items():
+                self._entries[name] = {"source": source, "fetched_at": fetched_at}
+
+    def _revalidate(self, name):
+        with self._lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+
+        def refresh():
+            try:
+                self._store(self._fetch(deadline=self.deadline, providers=[name]))
+            finally:
+                with self._lock:
+                    self._refreshing.discard(name)
+
+        self._executor.submit(refresh)
@@ -1,6 +1,7 @@
-import yfinance as yf
 from datetime import datetime
 
+from data_sources.delta_fetcher import get_default_fetcher
+
 # Priority order: Futures → Spot
 SILVER_TICKERS = [
     ("SI=F", "Silver Futures (COMEX)"),
@@ -18,16 +19,14 @@ def get_live_silver_price():
     Returns:
         (price: float, source: str) or (None, None)
     """
+    fetcher = get_default_fetcher()
 
     for symbol, label in SILVER_TICKERS:
         try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period="1d")
+            latest_price = fetcher.last_close(symbol, interval="1m")
 
-            if not data.empty:
-                latest_price = data["Close"].iloc[-1]
-                if latest_price > 0:
-                    return round(float(latest_price), 4), label
+            if latest_price is not None and latest_price > 0:
+                return round(latest_price, 4), label
 
         except Exception as e:
             print(
@@ -1,19 +1,42 @@
-from data_sources.silver_sources import get_silver_data_sources
+from data_sources.source_cache import SourceSnapshotCache
 from utils.logger import AILogger
 
 
+def compute_reward(source, avg_value):
+    """
+    Quality-minus-cost reward shared by live and replay environments.
+    Returns (reward, quality).
+    """
+    quality = (
+        source["freshness"]
+        * source["reliability"]
+        * (1 / (1 + abs(source["value"] - avg_value)))
+    )
+
+    return quality - source["cost"], quality
+
+
 class SilverMarketEnvironment:
-    def __init__(self):
+    def __init__(self, cache=None, recorder=None):
         """
         Stage-2 real-time silver market environment
         """
         self.time_step = 0
         self.logger = AILogger(name="Environment")
 
+        # 🔹 TTL snapshot cache (stepping costs a lookup until TTLs expire)
+        self.cache = cache or SourceSnapshotCache()
+
+        # 🔹 Optional snapshot recorder for offline replay
+        self.recorder = recorder
+
         self.sources = self._load_sources()
 
+        if self.recorder is not None:
+            self.recorder.record(self.sources)
+
     def _load_sources(self):
-        sources = get_silver_data_sources()
+        sources = self.cache.get_sources()
         if not sources:
             self.logger.logger.warning("No live sources loaded")
         return sources
@@ -21,21 +44,43 @@ class SilverMarketEnvironment:
     # -------------------------------
     # Interface
     # -------------------------------
+    @property
+    def sources(self):
+        return self._sources
+
+    @sources.setter
+    def sources(self, sources):
+        # Average once per snapshot; every reward in the step reads it
+        self._sources = sources
+        self._market_avg = (
+            sum(s["value"] for s in sources.values()) / len(sources) if sources else 0.0
+        )
+
     def get_all_sources(self):
         return self.sources
 
     # -------------------------------
     # Dynamics
     # -------------------------------
-    def step(self):
+    def fetch_sources(self):
+        """
+        Loads a fresh snapshot without changing environment state.
+        """
+        return self._load_sources()
+
+    def step(self, sources=None):
         """
         Refresh environment with live data
+        (or with a snapshot already fetched via fetch_sources).
         """
         self.time_step += 1
-        self.sources = self._load_sources()
+        self.sources = self._load_sources() if sources is None else sources
+
+        if self.recorder is not None:
+            self.recorder.record(self.sources)
 
         self.logger.logger.info(
-            f"ENV UPDATE | Timestep: {self.time_step} | Sources: {list(self.sources.keys())}"
+            "ENV UPDATE | Timestep: %s | Sources: %s", self.time_step, list(self.sources)
         )
 
     # -------------------------------
@@ -45,19 +90,13 @@ class SilverMarketEnvironment:
         source = self.sources[source_name]
         avg_value = self._market_average_value()
 
-        quality = (
-            source["freshness"]
-            * source["reliability"]
-            * (1 / (1 + abs(source["value"] - avg_value)))
-        )
-
-        reward = quality - source["cost"]
+        reward, quality = compute_reward(source, avg_value)
 
         self.logger.logger.info(
-            f"REWARD | Source: {source_name} | Quality: {quality:.4f} | Cost: {source['cost']}"
+            "REWARD | Source: %s | Quality: %.4f | Cost: %s", source_name, quality, source["cost"]
         )
 
         return reward
 
     def _market_average_value(self):
-        return sum(s["value"] for s in self.sources.values()) / len(self.sources)
+        return self._market_avg
@@ -0,0 +1,192 @@
+import time
+
+import numpy as np
+
+from environment.environment import compute_reward
+
+
+FIELDS = ("freshness", "reliability", "cost", "value")
+
+
+# -------------------------------
+# Recording
+# -------------------------------
+class SourceRecorder:
+    """
+    Collects live source snapshots and writes them to a compressed
+    .npz file (one float32 matrix per field, timesteps × sources).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.names = []
+        self.providers = {}
+        self.frames = []
+
+    def record(self, sources, timestamp=None):
+        for name, source in sources.items():
+            if name not in self.providers:
+                self.names.append(name)
+                self.providers[name] = source.get("provider", "")
+
+        self.frames.append((
+            time.time() if timestamp is None else timestamp,
+            {name: [source[f] for f in FIELDS] for name, source in sources.items()}
+        ))
+
+    def save(self):
+        n_frames, n_sources = len(self.frames), len(self.names)
+        column = {name: i for i, name in enumerate(self.names)}
+
+        data = np.full((len(FIELDS), n_frames, n_sources), np.nan, dtype=np.float32)
+        timestamps = np.zeros(n_frames)
+
+        for t, (timestamp, frame) in enumerate(self.frames):
+            timestamps[t] = timestamp
+            for name, values in frame.items():
+                data[:, t, column[name]] = values
+
+        np.savez_compressed(
+            self.path,
+            names=np.array(self.names),
+            providers=np.array([self.providers[n] for n in self.names]),
+            timestamps=timestamps,
+            **{field: data[i] for i, field in enumerate(FIELDS)}
+        )
+        return self.path
+
+
+# -------------------------------
+# Replay Environment
+# -------------------------------
+class ReplayMarketEnvironment:
+    """
+    Offline drop-in for SilverMarketEnvironment.
+
+    Drives the same get_all_sources() / step() / calculate_reward()
+    interface from recorded (or synthetic) snapshots without any I/O.
+    Per-frame source dicts and market averages are built once up front,
+    so a step is an index increment.
+    """
+
+    def __init__(self, names, timestamps, fields, providers=None, loop=True):
+        self.names = [str(n) for n in names]
+        self.timestamps = np.asarray(timestamps, dtype=float)
+        self.loop = loop
+        self.time_step = 0
+
+        providers = providers if providers is not None else ["Replay"] * len(self.names)
+        n_frames = len(self.timestamps)
+
+        if n_frames == 0:
+            raise ValueError("replay needs at least one frame")
+
+        matrices = [np.asarray(fields[f], dtype=float) for f in FIELDS]
+        present = ~np.isnan(matrices[3])
+
+        # Raw (frames × sources) matrices, e.g. for AgentPopulation.run
+        self.fields = dict(zip(FIELDS, matrices))
+
+        self._frames = []
+        self._averages = np.zeros(n_frames)
+
+        for t in range(n_frames):
+            frame = {}
+            for j, name in enumerate(self.names):
+                if not present[t, j]:
+                    continue
+                frame[name] = {
+                    "freshness": float(matrices[0][t, j]),
+                    "reliability": float(matrices[1][t, j]),
+                    "cost": float(matrices[2][t, j]),
+                    "value": float(matrices[3][t, j]),
+                    "provider": str(providers[j]),
+                    "last_updated": float(self.timestamps[t])
+                }
+            self._frames.append(frame)
+
+            if frame:
+                self._averages[t] = sum(s["value"] for s in frame.values()) / len(frame)
+
+        self._averages = self._averages.tolist()
+        self._cursor = 0
+        self.sources = self._frames[0]
+
+    # -------------------------------
+    # Constructors
+    # -------------------------------
+    @classmethod
+    def from_file(cls, path, loop=True):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                names=data["names"],
+                timestamps=data["timestamps"],
+                fields={f: data[f] for f in FIELDS},
+                providers=data["providers"],
+                loop=loop
+            )
+
+    @classmethod
+    def synthetic(cls, n_sources=3, n_frames=10_000, seed=0, loop=True):
+        """
+        Random-walk sources with drifting quality, for policy evaluation
+        when no recording is available.
+        """
+        rng = np.random.default_rng(seed)
+        shape = (n_frames, n_sources)
+
+        def bounded_walk(start, scale):
+            walk = start + np.cumsum(rng.normal(0, scale, shape), axis=0)
+            return np.clip(walk, 0.0, 1.0)
+
+        fields = {
+            "freshness": bounded_walk(rng.uniform(0.7, 1.0, n_sources), 0.01),
+            "reliability": bounded_walk(rng.uniform(0.7, 1.0, n_sources), 0.005),
+            "cost": np.tile(rng.uniform(0.1, 0.5, n_sources), (n_frames, 1)),
+            "value": bounded_walk(rng.uniform(0.3, 0.7, n_sources), 0.01),
+        }
+
+        return cls(
+            names=[f"synthetic_{i}" for i in range(n_sources)],
+            timestamps=np.arange(n_frames, dtype=float),
+            fields=fields,
+            providers=["Synthetic"] * n_sources,
+            loop=loop
+        )
+
+    # -------------------------------
+    # Interface
+    # -------------------------------
+    def get_all_sources(self):
+        return self.sources
+
+    def __len__(self):
+        return len(self._frames)
+
+    # -------------------------------
+    # Dynamics
+    # -------------------------------
+    def step(self):
+        """
+        Advance to the next recorded snapshot.
+        """
+        self.time_step += 1
+        cursor = self._cursor + 1
+
+        if cursor >= len(self._frames):
+            if not self.loop:
+                raise IndexError("replay exhausted")
+            cursor = 0
+
+        self._cursor = cursor
+        self.sources = self._frames[cursor]
+
+    # -------------------------------
+    # Reward Logic
+    # -------------------------------
+    def calculate_reward(self, source_name: str) -> float:
+        reward, _ = compute_reward(self.sources[source_name], self._averages[self._cursor])
+        return reward
+
+    def _market_average_value(self):
+        return self._averages[self._cursor]
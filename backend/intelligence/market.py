@@ -1,4 +1,7 @@
-import requests
+from utils import http_client
+from utils.streaming_stats import EWMA, RollingMinMax, WindowedMomentum
+from collections import deque
+import math
 import os
 import time
 
@@ -9,6 +12,12 @@ import time
 
 ALPHA_KEY = os.getenv("ALPHA_VANTAGE_KEY")
 
+BAR_INTERVAL = "5min"
+BAR_SECONDS = 300
+
+# Intraday bars kept in memory
+MAX_BARS = 2000
+
 
 # -------------------------------
 # Market Impact Analyzer
@@ -18,60 +27,153 @@ class MarketImpactAnalyzer:
     """
     Uses Alpha Vantage time series to estimate
     short-term market momentum for silver
+
+    Keeps a bounded, timestamp-ordered cache of intraday bars. The API
+    is polled at most once per bar interval and only bars newer than
+    the last cached one are merged, so repeated evaluations within a
+    bar cost nothing and use no quota.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        momentum_windows=(4,),
+        max_bars=MAX_BARS,
+        refresh_interval=BAR_SECONDS,
+        volatility_halflife=12,
+        range_window=48
+    ):
         self.base_url = "https://www.alphavantage.co/query"
+        self.refresh_interval = refresh_interval
 
-    def fetch_intraday(self, symbol="XAGUSD"):
+        # 🔹 Cached bars: (timestamp, close), oldest first
+        self.bars = deque(maxlen=max_bars)
+        self._next_refresh = 0.0
+        self.api_calls = 0
+
+        # 🔹 Streaming stats fed once per new bar
+        self.momentum_windows = tuple(momentum_windows)
+        self.momenta = {w: WindowedMomentum(w) for w in self.momentum_windows}
+        self.log_returns = EWMA(halflife=volatility_halflife)
+        self.extremes = RollingMinMax(range_window)
+
+        self._impact = 0.0
+
+    # -------------------------------
+    # Bar cache
+    # -------------------------------
+    def _fetch_series(self):
+        """
+        Raw {timestamp: bar} mapping from FX_INTRADAY.
+        """
         try:
             params = {
                 "function": "FX_INTRADAY",
                 "from_symbol": "XAG",
                 "to_symbol": "USD",
-                "interval": "5min",
+                "interval": BAR_INTERVAL,
                 "apikey": ALPHA_KEY
             }
 
-            r = requests.get(self.base_url, params=params, timeout=10)
+            self.api_calls += 1
+            r = http_client.get(self.base_url, params=params)
             data = r.json()
 
-            series = data.get("Time Series FX (5min)", {})
+            return data.get(f"Time Series FX ({BAR_INTERVAL})", {})
 
-            prices = []
+        except Exception as e:
+            print("Alpha Vantage error:", e)
+            return {}
 
-            for t in sorted(series.keys(), reverse=True)[:5]:
-                prices.append(float(series[t]["4. close"]))
+    def refresh(self, force=False):
+        """
+        Merges bars newer than the last cached one.
+        Returns the number of new bars (0 if throttled).
+        """
+        now = time.monotonic()
+        if not force and now < self._next_refresh:
+            return 0
+        self._next_refresh = now + self.refresh_interval
 
-            return prices
+        series = self._fetch_series()
+        last = self.bars[-1][0] if self.bars else None
 
-        except Exception as e:
-            print("Alpha Vantage error:", e)
-            return []
+        # Only the unseen timestamps need sorting
+        new_keys = sorted(t for t in series if last is None or t > last)
+        for t in new_keys:
+            self._ingest(t, float(series[t]["4. close"]))
 
-    def evaluate(self, symbol=None):
+        if new_keys:
+            self._impact = self._compute_impact()
+        return len(new_keys)
+
+    def _ingest(self, t, close):
+        previous = self.bars[-1][1] if self.bars else None
+        self.bars.append((t, close))
+
+        for m in self.momenta.values():
+            m.update(close)
+        self.extremes.update(close)
+        if previous and close > 0:
+            self.log_returns.update(math.log(close / previous))
+
+    def fetch_intraday(self, symbol="XAGUSD"):
         """
-        Returns market impact score ∈ [-1,1]
+        Newest five closes, newest first.
         """
+        self.refresh()
+        return [close for _, close in list(self.bars)[-5:][::-1]]
 
-        prices = self.fetch_intraday()
+    # -------------------------------
+    # Scoring
+    # -------------------------------
+    def momentum(self, window=None):
+        """
+        Fractional change over `window` cached bars.
+        """
+        window = window or self.momentum_windows[0]
+        if window in self.momenta:
+            return self.momenta[window].value
 
-        if len(prices) < 2:
+        if len(self.bars) < 2:
             return 0.0
+        older = self.bars[max(0, len(self.bars) - 1 - window)][1]
+        return (self.bars[-1][1] - older) / older if older else 0.0
 
-        # simple momentum
-        recent = prices[0]
-        older = prices[-1]
+    def volatility(self):
+        """
+        EWMA standard deviation of per-bar log returns.
+        """
+        return self.log_returns.std
 
-        change_pct = (recent - older) / older
+    def price_range(self):
+        """
+        (low, high) close over the last `range_window` bars.
+        """
+        return self.extremes.min, self.extremes.max
 
-        # clamp
-        if change_pct > 0.02:
-            change_pct = 0.02
-        if change_pct < -0.02:
-            change_pct = -0.02
+    def _compute_impact(self):
+        if len(self.bars) < 2:
+            return 0.0
+
+        impacts = []
+        for w in self.momentum_windows:
+            change_pct = self.momenta[w].value
+
+            # clamp
+            if change_pct > 0.02:
+                change_pct = 0.02
+            if change_pct < -0.02:
+                change_pct = -0.02
+
+            # normalize approx to [-1,1]
+            impacts.append(change_pct / 0.02)
 
-        # normalize approx to [-1,1]
-        impact = change_pct / 0.02
+        return round(sum(impacts) / len(impacts), 4)
 
-        return round(impact, 4)
+    def evaluate(self, symbol=None):
+        """
+        Returns market impact score ∈ [-1,1]
+        (mean over the configured momentum windows)
+        """
+        self.refresh()
+        return self._impact
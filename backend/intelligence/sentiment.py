@@ -1,8 +1,9 @@
 # intelligence/sentiment.py
 
-import requests
+from utils import http_client
 import os
-from textblob import TextBlob
+import hashlib
+from collections import OrderedDict
 
 
 # -------------------------------
@@ -18,11 +19,20 @@ class SentimentAnalyzer:
     """
     Fetches silver-related news and computes sentiment score.
     Provides BOTH raw and normalized interfaces.
+
+    Polarities are cached in a bounded LRU keyed by a hash of the
+    normalized article text, so repeated headlines are scored once.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size=2048):
         self.endpoint = "https://gnews.io/api/v4/search"
 
+        # 🔹 Polarity cache
+        self.cache_size = cache_size
+        self._polarity_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     # --------------------------------------------------
     # News Fetching
     # --------------------------------------------------
@@ -35,7 +45,7 @@ class SentimentAnalyzer:
                 "apikey": GNEWS_API_KEY,
             }
 
-            response = requests.get(self.endpoint, params=params, timeout=10)
+            response = http_client.get(self.endpoint, params=params)
             data = response.json()
 
             articles = data.get("articles", [])
@@ -68,16 +78,54 @@ class SentimentAnalyzer:
         if not texts:
             return 0.0, 0.0
 
-        polarities = []
-        for text in texts:
-            blob = TextBlob(text)
-            polarities.append(blob.sentiment.polarity)
+        polarities = self.analyze_many(texts)
 
         avg_sentiment = sum(polarities) / len(polarities)
         confidence = min(1.0, len(texts) / 10)
 
         return round(avg_sentiment, 4), round(confidence, 4)
 
+    def analyze_many(self, texts):
+        """
+        Returns polarity ∈ [-1, 1] for each text, in order.
+        Only texts missing from the cache are scored.
+        """
+        from textblob import TextBlob
+
+        cache = self._polarity_cache
+        keys = [self._cache_key(text) for text in texts]
+        polarities = []
+
+        for key, text in zip(keys, texts):
+            polarity = cache.get(key)
+
+            if polarity is None:
+                self.cache_misses += 1
+                polarity = TextBlob(text).sentiment.polarity
+                cache[key] = polarity
+
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+            else:
+                self.cache_hits += 1
+                cache.move_to_end(key)
+
+            polarities.append(polarity)
+
+        return polarities
+
+    def cache_stats(self):
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._polarity_cache),
+        }
+
+    @staticmethod
+    def _cache_key(text):
+        normalized = " ".join(text.lower().split())
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
     def analyze_from_news(self, query="silver price"):
         """
         Returns normalized sentiment ∈ [0,1]
@@ -1,45 +1,279 @@
 # learning/bandit.py
 
+import numpy as np
+
+
+# -------------------------------
+# Strategies
+# -------------------------------
+class SampleAverage:
+    """
+    Stationary running mean (the original bandit behaviour).
+    """
+
+    def resize(self, bandit, capacity):
+        pass
+
+    def update(self, bandit, idx, reward):
+        bandit.counts[idx] += 1
+        bandit.values[idx] += (reward - bandit.values[idx]) / bandit.counts[idx]
+
+    def update_many(self, bandit, idx, rewards):
+        pulls = np.bincount(idx, minlength=len(bandit.arms))
+        reward_sums = np.bincount(idx, weights=rewards, minlength=len(bandit.arms))
+
+        touched = pulls > 0
+        counts = bandit.counts[:len(bandit.arms)]
+        values = bandit.values[:len(bandit.arms)]
+
+        new_counts = counts[touched] + pulls[touched]
+        values[touched] = (values[touched] * counts[touched] + reward_sums[touched]) / new_counts
+        counts[touched] = new_counts
+
+    def effective_counts(self, bandit):
+        return bandit.counts[:len(bandit.arms)]
+
+    def effective_horizon(self, bandit):
+        # Number of pulls the estimates still reflect (UCB log term)
+        return bandit.total_pulls
+
+
+class DiscountedMean(SampleAverage):
+    """
+    Recency-weighted mean with constant step size `alpha`.
+    The step is bias-corrected so early rewards are not pulled toward 0.
+    """
+
+    def __init__(self, alpha=0.1):
+        self.alpha = alpha
+        self._trace = np.zeros(0)
+
+    def resize(self, bandit, capacity):
+        self._trace = _grow(self._trace, capacity)
+
+    def update(self, bandit, idx, reward):
+        self._trace[idx] += self.alpha * (1.0 - self._trace[idx])
+        step = self.alpha / self._trace[idx]
+
+        bandit.counts[idx] += 1
+        bandit.values[idx] += step * (reward - bandit.values[idx])
+
+    def update_many(self, bandit, idx, rewards):
+        # Order matters for recency weighting
+        for i, reward in zip(idx, rewards):
+            self.update(bandit, i, reward)
+
+    def effective_counts(self, bandit):
+        # Effective sample size of an exponentially weighted mean
+        n = len(bandit.arms)
+        horizon = (2.0 - self.alpha) / self.alpha
+        return np.minimum(bandit.counts[:n], horizon)
+
+    def effective_horizon(self, bandit):
+        return min(bandit.total_pulls, (2.0 - self.alpha) / self.alpha)
+
+
+class SlidingWindow(SampleAverage):
+    """
+    Mean over each arm's last `window` rewards (sliding-window UCB
+    when combined with MultiArmedBandit.ucb_scores).
+    """
+
+    def __init__(self, window=50):
+        self.window = window
+        self._rewards = np.zeros((0, window))
+        self._sums = np.zeros(0)
+
+    def resize(self, bandit, capacity):
+        rewards = np.zeros((capacity, self.window))
+        rewards[:len(self._rewards)] = self._rewards
+        self._rewards = rewards
+        self._sums = _grow(self._sums, capacity)
+
+    def update(self, bandit, idx, reward):
+        slot = bandit.counts[idx] % self.window
+
+        self._sums[idx] += reward - self._rewards[idx, slot]
+        self._rewards[idx, slot] = reward
+
+        bandit.counts[idx] += 1
+        bandit.values[idx] = self._sums[idx] / min(bandit.counts[idx], self.window)
+
+    def update_many(self, bandit, idx, rewards):
+        for i, reward in zip(idx, rewards):
+            self.update(bandit, i, reward)
+
+    def effective_counts(self, bandit):
+        return np.minimum(bandit.counts[:len(bandit.arms)], self.window)
+
+    def effective_horizon(self, bandit):
+        # min(t, window) as in sliding-window UCB
+        return min(bandit.total_pulls, self.window)
+
+
+class GaussianThompson(SampleAverage):
+    """
+    Thompson sampling with a Gaussian prior and known reward noise.
+    Shares the sample-average storage; the posterior is derived from it.
+    """
+
+    def __init__(self, prior_mean=0.0, prior_var=1.0, noise_var=0.25, seed=None):
+        self.prior_mean = prior_mean
+        self.prior_var = prior_var
+        self.noise_var = noise_var
+        self.rng = np.random.default_rng(seed)
+
+    def posterior(self, bandit):
+        n = len(bandit.arms)
+        counts = bandit.counts[:n]
+
+        precision = 1.0 / self.prior_var + counts / self.noise_var
+        mean = (
+            self.prior_mean / self.prior_var
+            + counts * bandit.values[:n] / self.noise_var
+        ) / precision
+
+        return mean, 1.0 / precision
+
+    def sample(self, bandit):
+        mean, var = self.posterior(bandit)
+        return self.rng.normal(mean, np.sqrt(var))
+
+
+def _grow(array, capacity):
+    grown = np.zeros(capacity, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+# -------------------------------
+# Bandit
+# -------------------------------
 class MultiArmedBandit:
     """
     Multi-Armed Bandit for tracking source performance.
+
+    Arms are registered by name and mapped to indices over NumPy
+    arrays, so updates and queries are O(1) and `estimates()` returns
+    all values as one vector. The update rule is a pluggable strategy.
     """
 
-    def __init__(self):
-        self.counts = {}   # number of pulls per source
-        self.values = {}   # average reward per source
+    def __init__(self, strategy=None, initial_capacity=16):
+        self.strategy = strategy or SampleAverage()
+
+        self.arms = []          # index → arm name
+        self.arm_index = {}     # arm name → index
+
+        self.counts = np.zeros(0, dtype=np.int64)   # number of pulls per source
+        self.values = np.zeros(0)                    # estimated reward per source
+        self.total_pulls = 0
+
+        self._resize(initial_capacity)
 
     # -------------------------------
     # Initialization
     # -------------------------------
-    def _ensure_arm(self, arm_name: str):
-        if arm_name not in self.counts:
-            self.counts[arm_name] = 0
-            self.values[arm_name] = 0.0
+    def _resize(self, capacity):
+        self.counts = _grow(self.counts, capacity)
+        self.values = _grow(self.values, capacity)
+        self.strategy.resize(self, capacity)
+
+    def _ensure_arm(self, arm_name: str) -> int:
+        idx = self.arm_index.get(arm_name)
+        if idx is not None:
+            return idx
+
+        idx = len(self.arms)
+        if idx == len(self.counts):
+            self._resize(max(1, 2 * idx))
+
+        self.arms.append(arm_name)
+        self.arm_index[arm_name] = idx
+        return idx
+
+    def register(self, arm_names):
+        """
+        Registers arms up front and returns their indices.
+        """
+        return np.array([self._ensure_arm(name) for name in arm_names], dtype=np.int64)
 
     # -------------------------------
     # Public API
     # -------------------------------
     def update(self, arm_name: str, reward: float):
         """
-        Update running average reward.
+        Update the reward estimate of one arm.
         """
-        self._ensure_arm(arm_name)
-
-        self.counts[arm_name] += 1
-        n = self.counts[arm_name]
-        old_value = self.values[arm_name]
+        idx = self._ensure_arm(arm_name)
+        self.strategy.update(self, idx, reward)
+        self.total_pulls += 1
 
-        self.values[arm_name] = old_value + (reward - old_value) / n
+    def update_many(self, arm_names, rewards):
+        """
+        Apply a batch of (arm, reward) observations in order.
+        """
+        idx = self.register(arm_names)
+        rewards = np.asarray(rewards, dtype=float)
+        self.strategy.update_many(self, idx, rewards)
+        self.total_pulls += len(idx)
 
     def get_estimated_value(self, arm_name: str) -> float:
         """
         Return learned value for a source.
         """
-        return self.values.get(arm_name, 0.0)
+        idx = self.arm_index.get(arm_name)
+        return 0.0 if idx is None else float(self.values[idx])
 
     def get_count(self, arm_name: str) -> int:
         """
         Return how many times a source was selected.
         """
-        return self.counts.get(arm_name, 0)
+        idx = self.arm_index.get(arm_name)
+        return 0 if idx is None else int(self.counts[idx])
+
+    # -------------------------------
+    # Vector queries
+    # -------------------------------
+    def estimates(self) -> np.ndarray:
+        """
+        Learned values of all registered arms, indexed like `arms`.
+        """
+        return self.values[:len(self.arms)]
+
+    def pull_counts(self) -> np.ndarray:
+        return self.counts[:len(self.arms)]
+
+    def lookup(self, arm_names):
+        """
+        (estimates, pull counts) for `arm_names` without registering them.
+        Unknown arms read as 0.
+        """
+        idx = np.fromiter(
+            (self.arm_index.get(name, -1) for name in arm_names), dtype=np.int64
+        )
+        known = idx >= 0
+        return (
+            np.where(known, self.values[idx], 0.0),
+            np.where(known, self.counts[idx], 0),
+        )
+
+    def ucb_scores(self, c=1.0) -> np.ndarray:
+        """
+        Upper-confidence scores for all arms. Unpulled arms score +inf.
+        """
+        n = self.strategy.effective_counts(self)
+        bonus = np.full(len(n), np.inf)
+
+        pulled = n > 0
+        t = self.strategy.effective_horizon(self)
+        bonus[pulled] = c * np.sqrt(np.log(t + 1) / n[pulled])
+
+        return self.estimates() + bonus
+
+    def sample(self) -> np.ndarray:
+        """
+        Posterior sample per arm (Thompson strategies); estimates otherwise.
+        """
+        if hasattr(self.strategy, "sample"):
+            return self.strategy.sample(self)
+        return self.estimates().copy()
@@ -1,70 +1,76 @@
-from agent.agent import DataCollectionAgent
-from environment.environment import SilverMarketEnvironment
-from models.silver_predictor_arima import SilverPricePredictorARIMA
-from utils.logger import AILogger
+from pipeline.pipeline import BackendPipeline
 
 
 def main():
-    logger = AILogger(name="BackendRunner")
+    pipeline = BackendPipeline(total_budget=5.0, epsilon=0.2)
+    logger = pipeline.logger
     logger.logger.info("===== BACKEND EXECUTION STARTED =====")
 
-    # 1️⃣ Create dynamic silver market environment
-    env = SilverMarketEnvironment()
+    # Fetch → select → predict → reward → learn (one cycle)
+    result = pipeline.run_cycle()
 
-    logger.log_environment(
-        timestep=env.time_step,
-        info=f"Initialized environment with {len(env.get_all_sources())} sources"
-    )
-
-    # 2️⃣ Create agent
-    agent = DataCollectionAgent(total_budget=5.0, epsilon=0.2)
-
-    # 3️⃣ Agent selects best source
-    selected_source, decision_score = agent.select_best_source(env)
-
-    if selected_source is None:
+    if result is None:
         logger.log_error("No source selected. Exiting backend.")
         return
 
-    # 4️⃣ Deduct cost from budget
-    source_state = env.get_all_sources()[selected_source]
-    agent.deduct_cost(source_state["cost"])
-
-    # 5️⃣ Run prediction model
-    predictor = SilverPricePredictorARIMA()
-    # 🔹 Warm-up ARIMA with historical-like prices (demo-safe)
-    historical_prices = [
-    23.5, 23.6, 23.55, 23.7, 23.8,
-    23.75, 23.9, 24.0, 23.95, 24.1
-    ]
-
-    for price in historical_prices:
-        predictor.add_price(price)
-
-    # 🔹 Feed real-time price from environment
-    current_price = env.get_all_sources()[selected_source]["value"]
-
-    predictor.add_price(current_price)
+    # Advance environment dynamics
+    pipeline.advance()
 
-    prediction_result = predictor.predict_next()
+    logger.logger.info("===== BACKEND EXECUTION FINISHED =====")
 
-    predicted_price = prediction_result["predicted_price"]
-    trend = prediction_result["trend"]
-    confidence = prediction_result["confidence"]
 
-    logger.log_prediction(predicted_price, trend, confidence)
+def run_daemon(interval, metrics_file=None, metrics_port=None, budget_period=900.0):
+    from pipeline.daemon import PipelineDaemon
+    from models.silver_predictor_arima import SilverPricePredictorARIMA
+    from utils.metrics import REGISTRY
 
-    # 6️⃣ Calculate reward using environment logic
-    reward = env.calculate_reward(selected_source)
+    pipeline = BackendPipeline(
+        total_budget=5.0,
+        epsilon=0.2,
+        predictor=SilverPricePredictorARIMA(incremental=True),
+        budget_period=budget_period or None
+    )
 
-    # 7️⃣ Update learning
-    agent.update_learning(selected_source, reward)
+    # 🔹 Optional Prometheus exposition (scrape endpoint and/or textfile)
+    if metrics_port is not None:
+        REGISTRY.start_http_server(metrics_port)
 
-    # 8️⃣ Advance environment dynamics
-    env.step()
+    on_cycle = None
+    if metrics_file:
+        on_cycle = lambda pipeline, result: REGISTRY.write_textfile(metrics_file)
 
-    logger.logger.info("===== BACKEND EXECUTION FINISHED =====")
+    PipelineDaemon(pipeline, interval=interval, on_cycle=on_cycle).run()
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the backend pipeline")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="report cold-start import times instead of running a cycle"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running cycles on a fixed cadence until interrupted"
+    )
+    parser.add_argument("--interval", type=float, default=60.0, help="daemon cadence in seconds")
+    parser.add_argument(
+        "--budget-period",
+        type=float,
+        default=900.0,
+        help="daemon: refill the agent budget every N seconds (0 = never)"
+    )
+    parser.add_argument("--metrics-file", help="daemon: write Prometheus metrics here after every cycle")
+    parser.add_argument("--metrics-port", type=int, help="daemon: serve Prometheus metrics on this port")
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        from utils.startup_profile import print_startup_report
+        print_startup_report("main")
+    elif args.daemon:
+        run_daemon(args.interval, args.metrics_file, args.metrics_port, args.budget_period)
+    else:
+        main()
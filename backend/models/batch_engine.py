@@ -0,0 +1,170 @@
+import os
+import time
+import warnings
+
+import numpy as np
+
+from models.silver_predictor_arima import SilverPricePredictorARIMA, one_step_mse
+from utils.process_pool import get_process_pool
+
+
+def _forecast_task(args):
+    """
+    Stateless worker fit: one instrument's window → forecast row.
+    """
+    from statsmodels.tsa.arima.model import ARIMA
+
+    name, prices, order, steps, alpha = args
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            fitted = ARIMA(prices, order=order).fit()
+
+        forecast = fitted.get_forecast(steps=steps)
+        mean = np.asarray(forecast.predicted_mean)
+        intervals = np.asarray(forecast.conf_int(alpha=alpha))
+        mse = one_step_mse(fitted)
+
+        return name, float(mean[-1]), float(intervals[-1, 0]), float(intervals[-1, 1]), 1 / (1 + mse)
+
+    except Exception:
+        return name, np.nan, np.nan, np.nan, 0.0
+
+
+class BatchForecastEngine:
+    """
+    Holds one predictor state per instrument and forecasts all of
+    them in one batch per tick.
+
+    With `max_workers > 1`, fits run in a process pool on each
+    instrument's price window; with 1 worker, each instrument's own
+    predictor is used in-process (keeping incremental updates).
+    Results come back as one columnar table (dict of NumPy arrays).
+    """
+
+    def __init__(self, instruments, predictor_factory=None, max_workers=None):
+        self.predictor_factory = predictor_factory or (
+            lambda: SilverPricePredictorARIMA(incremental=True, window_size=2000)
+        )
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        self.predictors = {}
+        for name in instruments:
+            self.add_instrument(name)
+
+    # -------------------------------
+    # Instruments
+    # -------------------------------
+    def add_instrument(self, name):
+        if name not in self.predictors:
+            self.predictors[name] = self.predictor_factory()
+        return self.predictors[name]
+
+    @property
+    def instruments(self):
+        return list(self.predictors)
+
+    # -------------------------------
+    # Data ingestion
+    # -------------------------------
+    def add_prices(self, prices):
+        """
+        prices: {instrument: price} for one tick.
+        """
+        for name, price in prices.items():
+            if price is not None and np.isfinite(price):
+                self.add_instrument(name).add_price(float(price))
+
+    def load_histories(self, histories, replace=False):
+        """
+        histories: {instrument: sequence of prices, oldest first}.
+        With replace=True each instrument's window is reset to its history.
+        """
+        for name, series in histories.items():
+            self.add_instrument(name).load_history(series, replace=replace)
+
+    def refresh(self, fetch=None, **fetch_kwargs):
+        """
+        Bulk-fetches histories for every instrument and loads them.
+        Each fetch returns the full period, so it replaces the window
+        rather than appending bars that are already there.
+        """
+        if fetch is None:
+            from data_sources.instruments import fetch_histories
+            fetch = fetch_histories
+
+        self.load_histories(fetch(self.instruments, **fetch_kwargs), replace=True)
+
+    # -------------------------------
+    # Forecasting
+    # -------------------------------
+    def forecast(self, steps=1, alpha=0.05):
+        """
+        Forecasts `steps` ahead for all instruments.
+        Returns {column: np.ndarray} with one row per instrument.
+        """
+        ready = [n for n, p in self.predictors.items() if p.is_ready()]
+
+        if self.max_workers == 1:
+            rows = [self._forecast_local(n, steps, alpha) for n in ready]
+        else:
+            tasks = [
+                (n, np.array(self.predictors[n].prices.view()), self.predictors[n].order, steps, alpha)
+                for n in ready
+            ]
+            pool = get_process_pool(self.max_workers)
+            chunksize = max(1, len(tasks) // (4 * self.max_workers))
+            rows = list(pool.map(_forecast_task, tasks, chunksize=chunksize))
+
+        return self._to_table(rows)
+
+    def _forecast_local(self, name, steps, alpha):
+        predictor = self.predictors[name]
+        horizon = predictor.predict_horizon(steps=steps, alpha=alpha)
+
+        if horizon["forecast"] is None:
+            return name, np.nan, np.nan, np.nan, 0.0
+
+        predictor.predict_next()
+        return (
+            name,
+            horizon["forecast"][-1],
+            horizon["lower"][-1],
+            horizon["upper"][-1],
+            predictor.confidence()
+        )
+
+    def _to_table(self, rows):
+        n = len(rows)
+        table = {
+            "instrument": np.empty(n, dtype=object),
+            "last_price": np.empty(n),
+            "predicted_price": np.empty(n),
+            "lower": np.empty(n),
+            "upper": np.empty(n),
+            "trend": np.empty(n, dtype=object),
+            "confidence": np.empty(n),
+            "n_obs": np.empty(n, dtype=np.int64),
+        }
+
+        for i, (name, predicted, lower, upper, confidence) in enumerate(rows):
+            prices = self.predictors[name].prices
+            last = prices.last()
+
+            table["instrument"][i] = name
+            table["last_price"][i] = last
+            table["predicted_price"][i] = round(predicted, 4)
+            table["lower"][i] = round(lower, 4)
+            table["upper"][i] = round(upper, 4)
+            table["confidence"][i] = round(confidence, 4)
+            table["n_obs"][i] = len(prices)
+            table["trend"][i] = (
+                "unknown" if np.isnan(predicted)
+                else "up" if predicted > last
+                else "down" if predicted < last
+                else "stable"
+            )
+
+        table["timestamp"] = time.time()
+        return table
@@ -0,0 +1,79 @@
+import itertools
+import math
+import os
+import warnings
+
+import numpy as np
+
+from utils.process_pool import get_process_pool
+
+
+# -------------------------------
+# Config
+# -------------------------------
+DEFAULT_P = range(0, 4)
+DEFAULT_D = range(0, 3)
+DEFAULT_Q = range(0, 4)
+
+
+def candidate_orders(p_values=DEFAULT_P, d_values=DEFAULT_D, q_values=DEFAULT_Q):
+    """
+    Full (p, d, q) grid.
+    """
+    return list(itertools.product(p_values, d_values, q_values))
+
+
+def score_order(prices, order, criterion="aic"):
+    """
+    Fits one candidate and returns its information criterion.
+    Failed or non-finite fits score +inf.
+    """
+    from statsmodels.tsa.arima.model import ARIMA
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            fitted = ARIMA(prices, order=order).fit()
+
+        score = float(getattr(fitted, criterion))
+        return score if math.isfinite(score) else math.inf
+
+    except Exception:
+        return math.inf
+
+
+def _score_task(args):
+    prices, order, criterion = args
+    return order, score_order(prices, order, criterion)
+
+
+def select_order(prices, candidates=None, criterion="aic", max_workers=None):
+    """
+    Grid-searches ARIMA orders by AIC/BIC, fitting candidates
+    concurrently across CPU cores.
+
+    Returns (best_order, {order: score}).
+    """
+    if criterion not in ("aic", "bic"):
+        raise ValueError("criterion must be 'aic' or 'bic'")
+
+    prices = np.asarray(prices, dtype=float)
+    candidates = list(candidates or candidate_orders())
+    max_workers = max_workers or os.cpu_count() or 1
+
+    tasks = [(prices, tuple(order), criterion) for order in candidates]
+
+    if max_workers == 1 or len(tasks) == 1:
+        results = map(_score_task, tasks)
+    else:
+        pool = get_process_pool(max_workers)
+        chunksize = max(1, len(tasks) // (4 * max_workers))
+        results = pool.map(_score_task, tasks, chunksize=chunksize)
+
+    scores = dict(results)
+    best_order = min(scores, key=scores.get)
+
+    if math.isinf(scores[best_order]):
+        raise RuntimeError("no ARIMA order candidate could be fitted")
+
+    return best_order, scores
@@ -21,6 +21,14 @@ class Predictor(ABC):
         """
         pass
 
+    @abstractmethod
+    def predict_horizon(self, steps: int = 5, alpha: float = 0.05) -> dict:
+        """
+        Predict the next `steps` silver prices from a single fit.
+        Returns point forecasts with (1 - alpha) confidence intervals.
+        """
+        pass
+
     @abstractmethod
     def trend(self) -> str:
         """
@@ -0,0 +1,94 @@
+import numpy as np
+
+
+class PriceWindow:
+    """
+    Fixed-capacity rolling window of prices backed by a preallocated
+    NumPy array. Reusable by any Predictor implementation.
+
+    Each value is written twice (at i and i + capacity), so the most
+    recent `len(window)` prices are always one contiguous slice and
+    `view()` never copies.
+    """
+
+    def __init__(self, capacity: int = 5000):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+
+        self.capacity = capacity
+        self._buffer = np.zeros(2 * capacity, dtype=float)
+        self._next = 0      # next write slot in [0, capacity)
+        self._size = 0
+        self.total_added = 0
+
+    # -------------------------------
+    # Data ingestion
+    # -------------------------------
+    def append(self, price: float):
+        self._buffer[self._next] = price
+        self._buffer[self._next + self.capacity] = price
+
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self.total_added += 1
+
+    def extend(self, prices):
+        """
+        Bulk append (vectorized); only the newest `capacity` values are kept.
+        """
+        values = np.asarray(prices, dtype=float).ravel()
+        count = len(values)
+        cap = self.capacity
+
+        if count == 0:
+            return
+
+        if count >= cap:
+            values = values[-cap:]
+            self._buffer[:cap] = values
+            self._buffer[cap:] = values
+            self._next = 0
+        else:
+            first = min(count, cap - self._next)
+            rest = count - first
+
+            self._buffer[self._next:self._next + first] = values[:first]
+            self._buffer[self._next + cap:self._next + cap + first] = values[:first]
+            self._buffer[:rest] = values[first:]
+            self._buffer[cap:cap + rest] = values[first:]
+
+            self._next = (self._next + count) % cap
+
+        self._size = min(self._size + count, cap)
+        self.total_added += count
+
+    def clear(self):
+        self._next = 0
+        self._size = 0
+
+    # -------------------------------
+    # Access
+    # -------------------------------
+    def view(self) -> np.ndarray:
+        """
+        Returns a read-only, zero-copy view of the window in
+        chronological order (oldest first).
+        """
+        start = self._next - self._size + self.capacity
+        window = self._buffer[start:start + self._size]
+        window.flags.writeable = False
+        return window
+
+    def last(self):
+        if self._size == 0:
+            return None
+        return float(self._buffer[self._next - 1 + self.capacity])
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        return self.view()[index]
+
+    def __iter__(self):
+        return iter(self.view())
@@ -1,27 +1,122 @@
+from collections import deque
+
 import numpy as np
-from statsmodels.tsa.arima.model import ARIMA
+from models.order_selection import select_order
 from models.predictor_interface import Predictor
+from models.price_window import PriceWindow
+from utils import metrics
+
+FULL_FIT_SECONDS = metrics.histogram("arima_fit_seconds", "ARIMA fit latency", kind="full")
+FILTER_UPDATE_SECONDS = metrics.histogram("arima_fit_seconds", "ARIMA fit latency", kind="filter")
+
+
+def one_step_mse(fitted):
+    """
+    In-sample one-step MSE of a fitted ARIMA. The diffuse burn-in
+    residuals are skipped (the first one equals the price level when
+    d >= 1).
+    """
+    residuals = np.asarray(fitted.resid, dtype=float)[fitted.loglikelihood_burn:]
+    return float(np.mean(residuals ** 2)) if len(residuals) else 0.0
 
 
 class SilverPricePredictorARIMA(Predictor):
     """
     ARIMA-based time series predictor for silver prices.
     Fully implements Predictor interface.
+
+    In incremental mode, new prices are folded into the already fitted
+    model by a Kalman filter update instead of a full refit. Parameters
+    are re-estimated every `refit_interval` new prices, or earlier when
+    recent one-step errors drift above `drift_threshold` times the error
+    level of the last full fit.
+
+    History is kept in a bounded PriceWindow of `window_size` prices,
+    so memory and fit cost stay capped in long-running processes.
+
+    With `order="auto"`, the (p, d, q) order is grid-searched by AIC/BIC
+    in a process pool and reused until `reselect_interval` new prices
+    arrive or residual drift is detected.
     """
 
-    def __init__(self, order=(2, 1, 2), min_data_points=10):
-        self.order = order
+    def __init__(
+        self,
+        order=(2, 1, 2),
+        min_data_points=10,
+        incremental=False,
+        refit_interval=250,
+        drift_threshold=3.0,
+        drift_window=20,
+        window_size=5000,
+        order_candidates=None,
+        criterion="aic",
+        reselect_interval=1000,
+        max_workers=None
+    ):
+        self.order = (2, 1, 2) if order == "auto" else order
         self.min_data_points = min_data_points
-        self.prices = []
+        self.prices = PriceWindow(window_size)
         self._last_prediction = None
         self._last_confidence = None
 
+        # 🔹 Incremental state-space mode
+        self.incremental = incremental
+        self.refit_interval = refit_interval
+        self.drift_threshold = drift_threshold
+        self.drift_window = drift_window
+
+        self._fitted = None
+        self._pending = []
+        self._since_refit = 0
+        self._baseline_mse = None
+        self._recent_errors = deque(maxlen=drift_window)
+
+        # 🔹 Automatic order selection
+        self.auto_order = order == "auto"
+        self.order_candidates = order_candidates
+        self.criterion = criterion
+        self.reselect_interval = reselect_interval
+        self.max_workers = max_workers
+        self.order_scores = {}
+
+        self._selected_at = None
+        self._drift_detected = False
+
+        # 🔹 Fit cache (valid until the next add_price)
+        self._fit_current = False
+        self._horizon_cache = {}
+
     # -------------------------------
     # Data ingestion
     # -------------------------------
     def add_price(self, price: float):
         self.prices.append(price)
 
+        self._fit_current = False
+        self._horizon_cache.clear()
+
+        if self.incremental and self._fitted is not None:
+            self._pending.append(price)
+
+    def load_history(self, prices, replace=False):
+        """
+        Bulk-loads prices (oldest first), e.g. a warm start from the price store.
+        With replace=True the window is reset first and the next prediction refits.
+        """
+        prices = np.asarray(prices, dtype=float)
+
+        if replace:
+            self.prices.clear()
+            self._reset_fit()
+
+        self.prices.extend(prices)
+
+        self._fit_current = False
+        self._horizon_cache.clear()
+
+        if self.incremental and self._fitted is not None:
+            self._pending.extend(prices.tolist())
+
     def is_ready(self) -> bool:
         return len(self.prices) >= self.min_data_points
 
@@ -44,16 +139,15 @@ class SilverPricePredictorARIMA(Predictor):
             }
 
         try:
-            model = ARIMA(self.prices, order=self.order)
-            fitted = model.fit()
+            fitted = self._ensure_fitted()
+            mse = self._current_mse()
+
             forecast = fitted.forecast(steps=1)
 
             predicted_price = float(round(forecast[0], 4))
             self._last_prediction = predicted_price
 
             # --- confidence ---
-            residuals = fitted.resid
-            mse = np.mean(residuals ** 2)
             self._last_confidence = round(1 / (1 + mse), 4)
 
             return {
@@ -66,12 +160,160 @@ class SilverPricePredictorARIMA(Predictor):
             print("ARIMA prediction error:", e)
             self._last_prediction = None
             self._last_confidence = 0.0
+            self._reset_fit()
             return {
                 "predicted_price": None,
                 "trend": "error",
                 "confidence": 0.0
             }
 
+    def predict_horizon(self, steps: int = 5, alpha: float = 0.05):
+        """
+        Forecasts the next `steps` prices with (1 - alpha) intervals
+        from a single fit. Results are cached until the next add_price.
+        """
+        key = (steps, alpha)
+        if key in self._horizon_cache:
+            return self._horizon_cache[key]
+
+        if not self.is_ready():
+            return {
+                "steps": steps,
+                "alpha": alpha,
+                "forecast": None,
+                "lower": None,
+                "upper": None
+            }
+
+        try:
+            forecast = self._ensure_fitted().get_forecast(steps=steps)
+            intervals = np.asarray(forecast.conf_int(alpha=alpha))
+
+            result = {
+                "steps": steps,
+                "alpha": alpha,
+                "forecast": np.round(np.asarray(forecast.predicted_mean), 4).tolist(),
+                "lower": np.round(intervals[:, 0], 4).tolist(),
+                "upper": np.round(intervals[:, 1], 4).tolist()
+            }
+
+        except Exception as e:
+            print("ARIMA horizon error:", e)
+            self._reset_fit()
+            return {
+                "steps": steps,
+                "alpha": alpha,
+                "forecast": None,
+                "lower": None,
+                "upper": None
+            }
+
+        self._horizon_cache[key] = result
+        return result
+
+    # -------------------------------
+    # Fitting helpers
+    # -------------------------------
+    def _ensure_fitted(self):
+        """
+        Returns a fitted model that includes every added price,
+        fitting (or filter-updating) only if prices arrived since.
+        """
+        if self._fit_current:
+            return self._fitted
+
+        if not self.incremental or self._fitted is None or self._needs_refit():
+            with FULL_FIT_SECONDS.time():
+                self._full_fit()
+        else:
+            with FILTER_UPDATE_SECONDS.time():
+                self._filter_update()
+
+        self._fit_current = True
+        return self._fitted
+
+    def _reset_fit(self):
+        self._fitted = None
+        self._pending = []
+        self._fit_current = False
+        self._horizon_cache.clear()
+
+    def _full_fit(self):
+        """
+        Re-estimates ARIMA parameters over the price window.
+        """
+        # statsmodels costs ~1.5s to import; defer it to the first fit
+        from statsmodels.tsa.arima.model import ARIMA
+
+        if self.auto_order and self._needs_reselect():
+            self._select_order()
+
+        model = ARIMA(self.prices.view(), order=self.order)
+        fitted = model.fit()
+
+        self._baseline_mse = one_step_mse(fitted)
+
+        self._fitted = fitted
+        self._pending = []
+        self._since_refit = 0
+        self._recent_errors.clear()
+
+        return fitted
+
+    def _filter_update(self):
+        """
+        Appends pending prices to the fitted model without re-estimation.
+        Cost depends only on the number of new prices.
+        """
+        if not self._pending:
+            return
+
+        extended = self._fitted.extend(np.asarray(self._pending, dtype=float))
+
+        # Residuals of the extension are one-step-ahead forecast errors
+        for error in np.asarray(extended.resid, dtype=float):
+            self._recent_errors.append(float(error) ** 2)
+
+        self._since_refit += len(self._pending)
+        self._fitted = extended
+        self._pending = []
+
+    def _needs_refit(self) -> bool:
+        if self._since_refit + len(self._pending) >= self.refit_interval:
+            return True
+
+        if len(self._recent_errors) < self.drift_window:
+            return False
+
+        recent_mse = sum(self._recent_errors) / len(self._recent_errors)
+        if recent_mse > self.drift_threshold * self._baseline_mse:
+            self._drift_detected = True
+            return True
+        return False
+
+    def _needs_reselect(self) -> bool:
+        if self._selected_at is None or self._drift_detected:
+            return True
+        return self.prices.total_added - self._selected_at >= self.reselect_interval
+
+    def _select_order(self):
+        """
+        Grid-searches the order over the current window and caches it.
+        """
+        self.order, self.order_scores = select_order(
+            self.prices.view(),
+            candidates=self.order_candidates,
+            criterion=self.criterion,
+            max_workers=self.max_workers
+        )
+        self._selected_at = self.prices.total_added
+        self._drift_detected = False
+
+    def _current_mse(self):
+        if not self._recent_errors:
+            return self._baseline_mse
+        return sum(self._recent_errors) / len(self._recent_errors)
+
     # -------------------------------
     # REQUIRED abstract methods
     # -------------------------------
@@ -0,0 +1,179 @@
+import asyncio
+import signal
+import time
+
+from pipeline.pipeline import BackendPipeline
+from utils.logger import AILogger
+
+
+class PipelineDaemon:
+    """
+    Runs BackendPipeline cycles on a fixed cadence inside one asyncio loop.
+
+    - Fetch and decision stages run in worker threads, linked by a
+      one-slot queue: if decisions fall behind, the pending snapshot is
+      replaced by the newest one instead of queueing (backpressure).
+    - A tick that arrives while the previous fetch is still running is
+      skipped rather than queued (overlap protection).
+    - SIGINT/SIGTERM stop the scheduler and let the in-flight cycle
+      finish before exiting (disable with `handle_signals=False` when
+      embedded in a server that owns the signals).
+    - SIGUSR1 toggles the pipeline's cycle profiler.
+    - Running out of agent budget is logged once per episode and counted
+      in `stats["budget_exhausted"]`; fetching and publishing continue,
+      and decisions resume when the pipeline's budget period refills it.
+
+    `on_cycle(pipeline, result)` runs on the worker thread after
+    every decision cycle, e.g. to publish a snapshot.
+    """
+
+    def __init__(
+        self,
+        pipeline=None,
+        interval=60.0,
+        shutdown_timeout=30.0,
+        max_cycles=None,
+        on_cycle=None,
+        handle_signals=True
+    ):
+        self.pipeline = pipeline or BackendPipeline()
+        self.interval = interval
+        self.shutdown_timeout = shutdown_timeout
+        self.max_cycles = max_cycles
+        self.on_cycle = on_cycle
+        self.handle_signals = handle_signals
+
+        self.logger = AILogger(name="PipelineDaemon")
+
+        self.stats = {
+            "fetched": 0, "processed": 0, "skipped_ticks": 0,
+            "dropped_snapshots": 0, "errors": 0, "budget_exhausted": 0
+        }
+        self.last_result = None
+        self._exhausted = False
+
+        self._stop = asyncio.Event()
+        self._queue = None
+
+    # -------------------------------
+    # Lifecycle
+    # -------------------------------
+    def run(self):
+        asyncio.run(self.serve())
+
+    def stop(self):
+        self._stop.set()
+
+    async def serve(self):
+        self._queue = asyncio.Queue(maxsize=1)
+
+        if self.handle_signals:
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, self.stop)
+                except (NotImplementedError, RuntimeError):
+                    pass    # e.g. Windows, or not on the main thread
+
+            if hasattr(signal, "SIGUSR1"):
+                try:
+                    loop.add_signal_handler(signal.SIGUSR1, self._toggle_profiler)
+                except (NotImplementedError, RuntimeError):
+                    pass
+
+        self.logger.logger.info("DAEMON | Started | Interval: %.1fs", self.interval)
+
+        fetcher = asyncio.create_task(self._fetch_loop())
+        processor = asyncio.create_task(self._process_loop())
+
+        await self._stop.wait()
+        self.logger.logger.info("DAEMON | Shutting down | Stats: %s", self.stats)
+
+        fetcher.cancel()
+        # Let the in-flight decision cycle finish, then stop the consumer
+        self._offer(None)
+        try:
+            await asyncio.wait_for(processor, timeout=self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            processor.cancel()
+
+        await asyncio.gather(fetcher, return_exceptions=True)
+        self.logger.logger.info("DAEMON | Stopped")
+
+    def _toggle_profiler(self):
+        enabled = self.pipeline.profiler.toggle()
+        self.logger.logger.info("DAEMON | Cycle profiling %s", "enabled" if enabled else "disabled")
+
+    # -------------------------------
+    # Stages
+    # -------------------------------
+    async def _fetch_loop(self):
+        next_tick = time.monotonic()
+
+        while not self._stop.is_set():
+            try:
+                snapshot = await asyncio.to_thread(self.pipeline.fetch)
+                self.stats["fetched"] += 1
+                self._offer(snapshot)
+            except Exception as e:
+                self.stats["errors"] += 1
+                self.logger.log_error(f"Fetch stage failed: {e}")
+
+            # Skip ticks missed while the fetch was running
+            next_tick += self.interval
+            now = time.monotonic()
+            if now > next_tick:
+                missed = int((now - next_tick) // self.interval) + 1
+                self.stats["skipped_ticks"] += missed
+                next_tick += missed * self.interval
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=next_tick - now)
+            except asyncio.TimeoutError:
+                pass
+
+    def _offer(self, snapshot):
+        """
+        Latest-wins hand-off to the decision stage.
+        """
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.stats["dropped_snapshots"] += 1
+        self._queue.put_nowait(snapshot)
+
+    async def _process_loop(self):
+        while True:
+            snapshot = await self._queue.get()
+            if snapshot is None:
+                return
+
+            try:
+                self.last_result = await asyncio.to_thread(self._process, snapshot)
+                self.stats["processed"] += 1
+            except Exception as e:
+                self.stats["errors"] += 1
+                self.logger.log_error(f"Decision stage failed: {e}")
+
+            if self.max_cycles is not None and self.stats["processed"] >= self.max_cycles:
+                self.stop()
+                return
+
+    def _process(self, snapshot):
+        self.pipeline.advance(snapshot)
+        result = self.pipeline.run_cycle() if snapshot else None
+        self._check_budget()
+
+        if self.on_cycle is not None:
+            self.on_cycle(self.pipeline, result)
+        return result
+
+    def _check_budget(self):
+        exhausted = self.pipeline.budget_exhausted
+        if exhausted and not self._exhausted:
+            self.stats["budget_exhausted"] += 1
+            period = self.pipeline.budget_period
+            self.logger.logger.warning(
+                "DAEMON | Budget exhausted | Decisions paused %s",
+                f"until the next {period:.0f}s budget period" if period else "(no refill configured)"
+            )
+        self._exhausted = exhausted
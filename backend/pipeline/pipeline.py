@@ -0,0 +1,188 @@
+import time
+
+from agent.agent import DataCollectionAgent
+from data_sources.price_store import get_default_store
+from environment.environment import SilverMarketEnvironment
+from models.silver_predictor_arima import SilverPricePredictorARIMA
+from utils import metrics
+from utils.cycle_profiler import get_default_profiler
+from utils.logger import AILogger
+
+
+# Demo-safe warm-up used when the price store is cold
+FALLBACK_PRICES = [
+    23.5, 23.6, 23.55, 23.7, 23.8,
+    23.75, 23.9, 24.0, 23.95, 24.1
+]
+
+STAGES = ("fetch", "select", "predict", "reward", "learn")
+
+STAGE_SECONDS = {
+    stage: metrics.histogram("pipeline_stage_seconds", "Wall time per pipeline stage", stage=stage)
+    for stage in STAGES
+}
+CYCLES = metrics.counter("pipeline_cycles", "Decision cycles run")
+
+# Executor threads the fetch stage fans out to (sampled when profiling)
+FETCH_THREADS = ("silver-source", "silver-attempt", "source-cache")
+BUDGET = metrics.gauge("agent_remaining_budget", "Agent budget left")
+
+
+class BackendPipeline:
+    """
+    Fetch → select → predict → reward → learn, with the environment,
+    agent (and its bandit memory) and predictor kept resident between
+    cycles.
+
+    With `budget_period` (seconds) the agent's budget is refilled at
+    the first cycle of every period; without it the budget is spent
+    once and later cycles select nothing.
+    """
+
+    def __init__(
+        self,
+        total_budget=5.0,
+        epsilon=0.2,
+        environment=None,
+        predictor=None,
+        profiler=None,
+        budget_period=None,
+        clock=time.monotonic
+    ):
+        self.logger = AILogger(name="BackendRunner")
+
+        # 🔹 Opt-in cycle profiler (AI_PROFILE=1 or profiler.enable())
+        self.profiler = profiler or get_default_profiler()
+
+        # 1️⃣ Create dynamic silver market environment
+        self.env = environment or SilverMarketEnvironment()
+
+        self.logger.log_environment(
+            timestep=self.env.time_step,
+            info=f"Initialized environment with {len(self.env.get_all_sources())} sources"
+        )
+
+        # 2️⃣ Create agent
+        self.agent = DataCollectionAgent(total_budget=total_budget, epsilon=epsilon)
+        BUDGET.set(self.agent.remaining_budget)
+
+        # 🔹 Budget refill policy
+        self.budget_period = budget_period
+        self._clock = clock
+        self._budget_refill_at = clock() + budget_period if budget_period else None
+
+        # 3️⃣ Create and warm up the prediction model
+        self.predictor = predictor or SilverPricePredictorARIMA()
+        self._warm_up_predictor()
+
+        self.cycles = 0
+        self.fetches = 0
+
+    def _warm_up_predictor(self):
+        # 🔹 Warm-up ARIMA from the local price store (no network)
+        historical_prices = get_default_store().tail("SI=F", self.predictor.prices.capacity)
+
+        if len(historical_prices) < self.predictor.min_data_points:
+            historical_prices = FALLBACK_PRICES
+
+        self.predictor.load_history(historical_prices)
+
+    # -------------------------------
+    # Stages
+    # -------------------------------
+    def fetch(self):
+        """
+        I/O stage: returns a fresh source snapshot without touching
+        the environment state.
+        """
+        self.fetches += 1
+
+        with STAGE_SECONDS["fetch"].time():
+            if not self.profiler.enabled:
+                return self.env.fetch_sources()
+            return self.profiler.profile(
+                self.fetches, self.env.fetch_sources, name="fetch", threads=FETCH_THREADS
+            )
+
+    def advance(self, sources=None):
+        """
+        Advances the environment, optionally to a prefetched snapshot.
+        """
+        self.env.step(sources)
+
+    def run_cycle(self):
+        """
+        Decision stage on the current snapshot.
+        Returns a result dict, or None if no source was selected.
+        """
+        self.cycles += 1
+        CYCLES.inc()
+        self._refill_budget_if_due()
+
+        if not self.profiler.enabled:
+            return self._run_cycle()
+        return self.profiler.profile(self.cycles, self._run_cycle)
+
+    @property
+    def budget_exhausted(self):
+        return self.agent.remaining_budget <= 0
+
+    def _refill_budget_if_due(self):
+        if self._budget_refill_at is None:
+            return
+
+        now = self._clock()
+        if now < self._budget_refill_at:
+            return
+
+        # Periods that passed without a cycle are not carried over
+        periods = int((now - self._budget_refill_at) // self.budget_period) + 1
+        self._budget_refill_at += periods * self.budget_period
+
+        self.agent.refill_budget()
+        BUDGET.set(self.agent.remaining_budget)
+
+    def _run_cycle(self):
+        env, agent = self.env, self.agent
+
+        # Agent selects best source
+        with STAGE_SECONDS["select"].time():
+            selected_source, decision_score = agent.select_best_source(env)
+
+        if selected_source is None:
+            self.logger.log_error("No source selected.")
+            return None
+
+        # Deduct cost from budget
+        source_state = env.get_all_sources()[selected_source]
+        agent.deduct_cost(source_state["cost"])
+        BUDGET.set(agent.remaining_budget)
+
+        # 🔹 Feed real-time price from environment
+        with STAGE_SECONDS["predict"].time():
+            self.predictor.add_price(source_state["value"])
+            prediction_result = self.predictor.predict_next()
+
+        self.logger.log_prediction(
+            prediction_result["predicted_price"],
+            prediction_result["trend"],
+            prediction_result["confidence"]
+        )
+
+        # Calculate reward using environment logic
+        with STAGE_SECONDS["reward"].time():
+            reward = env.calculate_reward(selected_source)
+
+        # Update learning
+        with STAGE_SECONDS["learn"].time():
+            agent.update_learning(selected_source, reward)
+
+        return {
+            "cycle": self.cycles,
+            "timestep": env.time_step,
+            "source": selected_source,
+            "score": decision_score,
+            "reward": reward,
+            "remaining_budget": agent.remaining_budget,
+            "prediction": prediction_result,
+        }
@@ -0,0 +1,37 @@
+import os
+import sys
+import warnings
+
+import pytest
+
+# Tests import backend modules the same way the entry points do
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+@pytest.fixture
+def quiet_statsmodels():
+    """
+    Silences statsmodels convergence and frequency warnings for ARIMA fits.
+    Opt in per module with pytestmark = pytest.mark.usefixtures("quiet_statsmodels").
+    """
+    # statsmodels adds "always" filters when this module is first
+    # imported; doing that inside the block below would outrank "ignore"
+    pytest.importorskip("statsmodels.tools.sm_exceptions")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+@pytest.fixture
+def fresh_pools(monkeypatch):
+    """
+    Gives the test its own process pools and shuts them down afterwards.
+    """
+    from utils import process_pool
+
+    pools = {}
+    monkeypatch.setattr(process_pool, "_pools", pools)
+    yield pools
+    for pool in pools.values():
+        pool.shutdown(wait=True)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from models.silver_predictor_arima import SilverPricePredictorARIMA
+
+pytestmark = pytest.mark.usefixtures("quiet_statsmodels")
+
+
+def random_walk(n, scale, rng, start=24.0):
+    return start + np.cumsum(rng.normal(0, scale, n))
+
+
+def test_baseline_mse_matches_one_step_error():
+    rng = np.random.default_rng(0)
+    predictor = SilverPricePredictorARIMA(order=(1, 1, 0), incremental=True)
+    predictor.load_history(random_walk(300, 0.05, rng))
+    predictor.predict_next()
+
+    # One-step error variance of the walk is 0.05² = 0.0025,
+    # not the price level squared leaking in from the burn-in residual
+    assert predictor._baseline_mse == pytest.approx(0.0025, rel=0.3)
+
+
+def test_confidence_does_not_jump_after_first_filter_update():
+    rng = np.random.default_rng(1)
+    prices = random_walk(301, 0.05, rng)
+
+    predictor = SilverPricePredictorARIMA(order=(1, 1, 0), incremental=True)
+    predictor.load_history(prices[:300])
+    first = predictor.predict_next()["confidence"]
+
+    predictor.add_price(prices[300])
+    second = predictor.predict_next()["confidence"]
+
+    assert abs(second - first) < 0.05
+
+
+def test_volatility_shift_triggers_refit():
+    rng = np.random.default_rng(2)
+    calm = random_walk(300, 0.05, rng)
+    shocked = random_walk(40, 0.5, rng, start=calm[-1])
+
+    predictor = SilverPricePredictorARIMA(
+        order=(1, 1, 0), incremental=True, refit_interval=10_000, drift_window=20
+    )
+    predictor.load_history(calm)
+    predictor.predict_next()
+
+    full_fits = []
+    original = predictor._full_fit
+
+    def counting_full_fit():
+        full_fits.append(predictor.prices.total_added)
+        return original()
+
+    predictor._full_fit = counting_full_fit
+
+    for price in shocked:
+        predictor.add_price(price)
+        predictor.predict_next()
+
+    assert full_fits, "drift never triggered a refit"
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from learning.bandit import (
+    DiscountedMean,
+    GaussianThompson,
+    MultiArmedBandit,
+    SampleAverage,
+    SlidingWindow,
+)
+
+
+STRATEGIES = [SampleAverage, lambda: DiscountedMean(alpha=0.3), lambda: SlidingWindow(window=3)]
+
+
+def observations(n=40, arms=5, seed=0):
+    rng = np.random.default_rng(seed)
+    names = [f"source-{i}" for i in rng.integers(0, arms, size=n)]
+    return names, rng.normal(size=n)
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_update_many_matches_sequential_updates(strategy):
+    names, rewards = observations()
+    batch = MultiArmedBandit(strategy(), initial_capacity=1)
+    single = MultiArmedBandit(strategy(), initial_capacity=1)
+
+    batch.update_many(names, rewards)
+    for name, reward in zip(names, rewards):
+        single.update(name, reward)
+
+    assert batch.arms == single.arms
+    np.testing.assert_allclose(batch.estimates(), single.estimates())
+    np.testing.assert_array_equal(batch.pull_counts(), single.pull_counts())
+    assert batch.total_pulls == single.total_pulls == len(names)
+
+
+def test_sample_average_is_running_mean():
+    bandit = MultiArmedBandit()
+    bandit.update_many(["a", "a", "b", "a"], [1.0, 2.0, 5.0, 6.0])
+
+    assert bandit.get_estimated_value("a") == pytest.approx(3.0)
+    assert bandit.get_estimated_value("b") == pytest.approx(5.0)
+    assert bandit.get_count("a") == 3
+    assert bandit.get_estimated_value("missing") == 0.0
+    assert bandit.get_count("missing") == 0
+
+
+def test_discounted_mean_first_reward_is_unbiased_and_tracks_recent():
+    bandit = MultiArmedBandit(DiscountedMean(alpha=0.5))
+
+    bandit.update("a", 4.0)
+    assert bandit.get_estimated_value("a") == pytest.approx(4.0)
+
+    for _ in range(20):
+        bandit.update("a", -1.0)
+    assert bandit.get_estimated_value("a") == pytest.approx(-1.0, abs=1e-4)
+    assert bandit.strategy.effective_counts(bandit)[0] == pytest.approx(3.0)
+
+
+def test_sliding_window_forgets_old_rewards():
+    bandit = MultiArmedBandit(SlidingWindow(window=2))
+    bandit.update_many(["a"] * 4, [10.0, 10.0, 1.0, 3.0])
+
+    assert bandit.get_estimated_value("a") == pytest.approx(2.0)
+    assert bandit.strategy.effective_counts(bandit)[0] == 2
+
+
+def test_register_grows_capacity_and_keeps_indices():
+    bandit = MultiArmedBandit(SlidingWindow(window=4), initial_capacity=1)
+    bandit.update("a", 1.0)
+
+    idx = bandit.register(["b", "c", "a", "d"])
+
+    assert idx.tolist() == [1, 2, 0, 3]
+    assert bandit.arms == ["a", "b", "c", "d"]
+    assert len(bandit.counts) >= 4
+    assert bandit.get_estimated_value("a") == pytest.approx(1.0)
+
+
+def test_ucb_scores_prefer_unpulled_arms():
+    bandit = MultiArmedBandit()
+    bandit.register(["a", "b"])
+    bandit.update("a", 1.0)
+
+    scores = bandit.ucb_scores(c=1.0)
+
+    assert np.isinf(scores[1])
+    assert scores[0] == pytest.approx(1.0 + np.sqrt(np.log(2)))
+
+
+def test_gaussian_thompson_posterior_shrinks_with_pulls():
+    strategy = GaussianThompson(prior_mean=0.0, prior_var=1.0, noise_var=1.0, seed=0)
+    bandit = MultiArmedBandit(strategy)
+    bandit.update_many(["a"] * 3 + ["b"], [2.0, 2.0, 2.0, 2.0])
+
+    mean, var = strategy.posterior(bandit)
+
+    assert mean.tolist() == pytest.approx([1.5, 1.0])
+    assert var.tolist() == pytest.approx([0.25, 0.5])
+    assert bandit.sample().shape == (2,)
+    assert MultiArmedBandit().sample().shape == (0,)
+
+
+@pytest.mark.parametrize("strategy, horizon", [
+    (SlidingWindow(window=10), 10),
+    (DiscountedMean(alpha=0.1), 19.0),
+    (SampleAverage(), 1000),
+])
+def test_ucb_log_term_uses_effective_horizon(strategy, horizon):
+    bandit = MultiArmedBandit(strategy)
+    bandit.update_many(["a", "b"] * 500, [1.0, 0.0] * 500)
+
+    n = strategy.effective_counts(bandit)
+    bonus = bandit.ucb_scores(c=1.0) - bandit.estimates()
+
+    assert strategy.effective_horizon(bandit) == pytest.approx(horizon)
+    assert bonus == pytest.approx(np.sqrt(np.log(horizon + 1) / n))
+
+
+def test_lookup_reads_unknown_arms_as_zero_without_registering():
+    bandit = MultiArmedBandit()
+    bandit.update_many(["a", "a", "b"], [1.0, 3.0, 5.0])
+
+    values, counts = bandit.lookup(["b", "x", "a"])
+
+    assert values.tolist() == [5.0, 0.0, 2.0]
+    assert counts.tolist() == [1, 0, 2]
+    assert bandit.arms == ["a", "b"]
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from models.batch_engine import BatchForecastEngine
+from utils import process_pool
+
+pytestmark = pytest.mark.usefixtures("quiet_statsmodels")
+
+
+def histories(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "silver": 24.0 + np.cumsum(rng.normal(0, 0.05, n)),
+        "gold": 2300.0 + np.cumsum(rng.normal(0, 2.0, n)),
+    }
+
+
+def test_refresh_replaces_history_instead_of_duplicating():
+    engine = BatchForecastEngine(["silver", "gold"], max_workers=1)
+    fetched = histories()
+
+    for _ in range(3):
+        engine.refresh(fetch=lambda names: fetched)
+
+    window = engine.predictors["silver"].prices
+    assert len(window) == 60
+    np.testing.assert_array_equal(window.view(), fetched["silver"])
+
+
+def test_refresh_after_forecast_refits_on_new_window():
+    engine = BatchForecastEngine(["silver"], max_workers=1)
+    engine.refresh(fetch=lambda names: histories(seed=1))
+    first = engine.forecast()
+
+    engine.refresh(fetch=lambda names: {"silver": histories(seed=2)["silver"] + 5})
+    second = engine.forecast()
+
+    assert second["n_obs"][0] == 60
+    assert second["last_price"][0] != first["last_price"][0]
+    assert abs(second["predicted_price"][0] - second["last_price"][0]) < 1.0
+
+
+def test_load_histories_appends_by_default():
+    engine = BatchForecastEngine(["silver"], max_workers=1)
+    engine.load_histories({"silver": [1.0, 2.0]})
+    engine.load_histories({"silver": [3.0]})
+
+    assert engine.predictors["silver"].prices.view().tolist() == [1.0, 2.0, 3.0]
+
+
+def test_forecast_table_skips_instruments_that_are_not_ready():
+    engine = BatchForecastEngine(["silver", "gold"], max_workers=1)
+    engine.load_histories({"silver": histories()["silver"], "gold": [2300.0]})
+
+    table = engine.forecast(steps=2)
+
+    assert table["instrument"].tolist() == ["silver"]
+    assert table["lower"][0] <= table["predicted_price"][0] <= table["upper"][0]
+    assert table["trend"][0] in ("up", "down", "stable")
+
+
+def test_process_pools_are_kept_per_size(fresh_pools):
+    one = process_pool.get_process_pool(1)
+    two = process_pool.get_process_pool(2)
+
+    assert process_pool.get_process_pool(1) is one
+    assert process_pool.get_process_pool(2) is two
+    assert one is not two
+
+    # Asking for another size must not shut down a pool in use
+    assert one.submit(abs, -3).result(timeout=30) == 3
+
+
+def test_process_pools_do_not_fork_the_parent(fresh_pools):
+    pool = process_pool.get_process_pool(1)
+
+    assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+    assert pool.submit(abs, -3).result(timeout=60) == 3
+
+
+def test_worker_pool_forecast_matches_in_process_forecast(fresh_pools):
+    tables = []
+    for workers in (1, 2):
+        engine = BatchForecastEngine(["silver", "gold"], max_workers=workers)
+        engine.load_histories(histories(n=80, seed=3))
+        tables.append(engine.forecast(steps=3))
+
+    local, pooled = tables
+    assert pooled["instrument"].tolist() == local["instrument"].tolist()
+    assert list(fresh_pools) == [2]
+    for column in ("last_price", "predicted_price", "lower", "upper", "confidence"):
+        np.testing.assert_allclose(pooled[column], local[column], rtol=1e-3, err_msg=column)
+    assert pooled["trend"].tolist() == local["trend"].tolist()
@@ -0,0 +1,48 @@
+import json
+import logging
+import warnings
+
+import numpy as np
+import pytest
+
+from benchmarks import suite
+
+
+def test_summarize_reports_percentiles_in_microseconds():
+    stats = suite.summarize(np.array([0.001, 0.002, 0.003, 0.004]))
+
+    assert stats["iterations"] == 4
+    assert stats["ops_per_sec"] == pytest.approx(400.0)
+    assert stats["p50_us"] == pytest.approx(2500.0)
+    assert stats["mean_us"] == pytest.approx(2500.0)
+    assert stats["p99_us"] <= 4000.0
+
+
+def test_find_regressions_applies_tolerance_and_skips_new_cases():
+    baseline = {"a": {"p50_us": 100.0}, "b": {"p50_us": 100.0}}
+    results = {"a": {"p50_us": 124.0}, "b": {"p50_us": 126.0}, "new": {"p50_us": 1e9}}
+
+    assert suite.find_regressions(results, baseline, tolerance=0.25) == [("b", 100.0, 126.0)]
+
+
+@pytest.fixture
+def restore_globals():
+    # main() silences logging and warnings process-wide
+    with warnings.catch_warnings():
+        yield
+    logging.disable(logging.NOTSET)
+
+
+def test_main_saves_baseline_then_flags_regressions(tmp_path, restore_globals):
+    output, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+    args = ["-k", "bandit_update", "--scale", "0.001",
+            "--output", str(output), "--baseline", str(baseline)]
+
+    assert suite.main(args + ["--save-baseline"]) == 0
+    saved = json.loads(baseline.read_text())["results"]
+    assert list(saved) == ["bandit_update"]
+
+    saved["bandit_update"]["p50_us"] = 1e-9
+    baseline.write_text(json.dumps({"results": saved}))
+    assert suite.main(args) == 1
+    assert "bandit_update" in json.loads(output.read_text())["results"]
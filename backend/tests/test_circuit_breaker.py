@@ -0,0 +1,86 @@
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker():
+    clock = FakeClock()
+    return CircuitBreaker(failure_threshold=3, reset_timeout=30.0, clock=clock), clock
+
+
+def test_opens_after_consecutive_failures():
+    breaker, _ = make_breaker()
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()        # resets the streak
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.trips == 1
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+
+
+def test_half_open_allows_a_single_probe():
+    breaker, clock = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now += 29.9
+    assert not breaker.allow()
+
+    clock.now += 0.1
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+
+
+def test_probe_success_closes():
+    breaker, clock = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 30
+    breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state == CLOSED and breaker.failures == 0
+    assert breaker.allow() and breaker.allow()
+
+
+def test_probe_failure_reopens_with_fresh_timeout():
+    breaker, clock = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 30
+    breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN and breaker.trips == 2
+    assert breaker.snapshot()["retry_in"] == 30.0
+
+    clock.now += 10
+    assert not breaker.allow()
+    assert breaker.snapshot()["retry_in"] == 20.0
+
+
+def test_failures_while_open_do_not_count_extra_trips():
+    breaker, _ = make_breaker()
+    for _ in range(5):
+        breaker.record_failure()
+
+    assert breaker.trips == 1
+    assert breaker.snapshot() == {
+        "state": OPEN, "failures": 5, "trips": 1, "rejected": 0, "retry_in": 30.0,
+    }
@@ -0,0 +1,80 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.cycle_profiler import CycleProfiler
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return seconds
+
+
+def read_stacks(path):
+    stacks = {}
+    for line in path.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        stacks[stack] = int(count)
+    return stacks
+
+
+def make_profiler(tmp_path, **kwargs):
+    return CycleProfiler(enabled=True, out_dir=str(tmp_path), interval=0.001, **kwargs)
+
+
+def test_nth_cycle_writes_padded_stacks_and_allocations(tmp_path):
+    profiler = make_profiler(tmp_path, every=5)
+
+    assert profiler.profile(4, busy, 0.01) == 0.01
+    assert not list(tmp_path.iterdir())
+
+    profiler.profile(5, busy, 0.05)
+
+    stacks = read_stacks(tmp_path / "cycle-000005.collapsed")
+    assert all(stack.startswith("cycle-000005;") for stack in stacks)
+    assert any(stack.endswith("test_cycle_profiler:busy") for stack in stacks)
+    assert (tmp_path / "cycle-000005.alloc.txt").read_text().startswith("# cycle-000005 |")
+    assert list(profiler.captured)[0][:2] == (5, "nth")
+
+
+def test_slow_cycles_are_dumped_without_tracemalloc(tmp_path):
+    profiler = make_profiler(tmp_path, every=0, threshold=0.02)
+
+    profiler.profile(1, busy, 0.001)
+    profiler.profile(2, busy, 0.03)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cycle-000002.collapsed"]
+    assert [c[:2] for c in profiler.captured] == [(2, "slow")]
+
+
+def test_pool_threads_are_sampled_under_their_name(tmp_path):
+    profiler = make_profiler(tmp_path, every=1)
+    idle = ThreadPoolExecutor(max_workers=1, thread_name_prefix="silver-attempt")
+    idle.submit(int).result()
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="silver-source") as pool:
+        profiler.profile(1, lambda: pool.submit(busy, 0.05).result(), name="fetch",
+                         threads=("silver-source", "silver-attempt"))
+    idle.shutdown()
+
+    stacks = read_stacks(tmp_path / "fetch-000001.collapsed")
+    pooled = [s for s in stacks if s.startswith("fetch-000001;silver-source")]
+    assert any(s.endswith("test_cycle_profiler:busy") for s in pooled)
+    assert not any(";silver-attempt" in s for s in stacks)
+
+
+def test_captured_is_bounded(tmp_path):
+    profiler = make_profiler(tmp_path, every=1, max_captured=3)
+
+    for cycle in range(1, 6):
+        profiler.profile(cycle, int)
+
+    assert [c[0] for c in profiler.captured] == [3, 4, 5]
+
+
+def test_toggle_accepts_signal_arguments(tmp_path):
+    profiler = CycleProfiler(enabled=False, out_dir=str(tmp_path))
+
+    assert profiler.toggle(10, None) is True
+    assert profiler.toggle() is False
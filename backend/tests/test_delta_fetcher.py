@@ -0,0 +1,127 @@
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_sources.delta_fetcher import DAY, YahooDeltaFetcher
+
+
+def bars(start, closes):
+    index = pd.to_datetime(np.arange(start, start + len(closes)) * 60, unit="s", utc=True)
+    return pd.DataFrame({"Close": closes, "Volume": np.ones(len(closes))}, index=index)
+
+
+def make_fetcher(now=3600.0, **kwargs):
+    # Bars start at the epoch; keep the clock within their lookback
+    return YahooDeltaFetcher(clock=lambda: now, **kwargs)
+
+
+class FakeYahoo:
+    """
+    Stands in for the yfinance module; serves queued history frames
+    and records the arguments of each request.
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def Ticker(self, symbol):
+        return SimpleNamespace(history=lambda **kwargs: self._history(symbol, kwargs))
+
+    def _history(self, symbol, kwargs):
+        self.requests.append((symbol, kwargs))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def yahoo(monkeypatch):
+    def install(*responses):
+        fake = FakeYahoo(*responses)
+        monkeypatch.setitem(sys.modules, "yfinance", fake)
+        return fake
+    return install
+
+
+def test_first_update_uses_initial_period(yahoo):
+    fake = yahoo(bars(0, [1.0, 2.0, 3.0]))
+    fetcher = make_fetcher(store=False)
+
+    series = fetcher.update("SI=F", interval="1m", initial_period="1d")
+
+    assert series["close"].tolist() == [1.0, 2.0, 3.0]
+    assert series["ts"].tolist() == [0.0, 60.0, 120.0]
+    assert fake.requests[0][1]["period"] == "1d"
+
+
+def test_later_updates_request_from_last_bar_and_replace_it(yahoo):
+    fake = yahoo(bars(0, [1.0, 2.0, 3.0]), bars(2, [3.5, 4.0]))
+    fetcher = make_fetcher(store=False)
+
+    fetcher.update("SI=F")
+    series = fetcher.update("SI=F")
+
+    assert fake.requests[1][1]["start"] == 120
+    assert series["close"].tolist() == [1.0, 2.0, 3.5, 4.0]
+    assert fetcher.series("SI=F")["ts"].tolist() == [0.0, 60.0, 120.0, 180.0]
+
+
+def test_empty_response_keeps_series(yahoo):
+    yahoo(bars(0, [1.0, 2.0]), bars(0, []))
+    fetcher = make_fetcher(store=False)
+
+    fetcher.update("SI=F")
+    assert fetcher.last_close("SI=F") == 2.0
+    assert fetcher.series("missing")["close"].size == 0
+
+
+def test_series_is_bounded(yahoo):
+    yahoo(bars(0, [1.0, 2.0, 3.0]), bars(3, [4.0, 5.0]))
+    fetcher = make_fetcher(max_bars=3, store=False)
+
+    fetcher.update("SI=F")
+    series = fetcher.update("SI=F")
+
+    assert series["close"].tolist() == [3.0, 4.0, 5.0]
+
+
+def test_new_bars_are_recorded(yahoo, monkeypatch):
+    from data_sources import delta_fetcher
+
+    recorded = []
+    monkeypatch.setattr(delta_fetcher, "record_prices", lambda *args: recorded.append(args))
+    yahoo(bars(0, [1.0, 2.0]))
+
+    make_fetcher().update("SI=F")
+
+    assert recorded[0][0] == "SI=F"
+    assert recorded[0][2].tolist() == [1.0, 2.0]
+
+
+def test_stale_overlapping_response_does_not_roll_back(yahoo):
+    # A slower request started before the latest merge returns last
+    yahoo(bars(0, [1.0, 2.0, 3.0]), bars(2, [3.5, 4.0, 5.0]), bars(1, [2.1, 3.1]))
+    fetcher = make_fetcher(store=False)
+
+    fetcher.update("SI=F")
+    fetcher.update("SI=F")
+    series = fetcher.update("SI=F")
+
+    assert series["close"].tolist() == [1.0, 2.0, 3.5, 4.0, 5.0]
+    assert fetcher.series("SI=F")["ts"][-1] == 240.0
+
+
+def test_series_older_than_lookback_is_refetched_from_initial_period(yahoo):
+    clock = SimpleNamespace(now=3600.0)
+    fake = yahoo(bars(0, [1.0, 2.0]), bars(20000, [9.0, 9.5]))
+    fetcher = YahooDeltaFetcher(store=False, clock=lambda: clock.now)
+
+    fetcher.update("SI=F", interval="1m", initial_period="1d")
+    clock.now = 60.0 + 8 * DAY
+    series = fetcher.update("SI=F", interval="1m", initial_period="1d")
+
+    assert fake.requests[1][1]["period"] == "1d"
+    assert "start" not in fake.requests[1][1]
+    assert series["close"].tolist() == [9.0, 9.5]
@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+from api.events import EventBus
+
+
+def ids(backlog):
+    return [event_id for event_id, _ in backlog]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_publish_filters_events_and_numbers_frames():
+    bus = EventBus()
+    bus.publish("DECISION", {"source": "yahoo"})
+    bus.publish("BUDGET", {"new": 1.0})
+    bus.publish("REWARD", {"reward": 0.5})
+
+    _, backlog = bus.subscribe(cursor=0)
+    assert ids(backlog) == [1, 2]
+
+    frame = backlog[0][1].decode()
+    assert frame.startswith("id: 1\nevent: DECISION\ndata: ")
+    assert json.loads(frame.split("data: ")[1])["source"] == "yahoo"
+
+
+def test_subscribe_resumes_after_cursor():
+    bus = EventBus()
+    for i in range(5):
+        bus.publish("REWARD", {"i": i})
+
+    assert ids(bus.subscribe(cursor=3)[1]) == [4, 5]
+    assert ids(bus.subscribe(cursor=5)[1]) == []
+    assert bus.subscribe()[1] == []
+
+
+def test_evicted_cursor_gets_reset_and_full_history():
+    bus = EventBus(history=3)
+    for i in range(6):
+        bus.publish("REWARD", {"i": i})
+
+    # Events 2 and 3 were evicted
+    backlog = bus.subscribe(cursor=1)[1]
+    assert ids(backlog) == [0, 4, 5, 6]
+    assert backlog[0][1].startswith(b"event: reset\n")
+    assert json.loads(backlog[0][1].decode().split("data: ")[1]) == {"cursor": 1, "oldest": 4}
+
+    # Nothing missed yet: event 4 is still retained
+    assert ids(bus.subscribe(cursor=3)[1]) == [4, 5, 6]
+
+
+def test_cursor_from_earlier_process_gets_reset():
+    bus = EventBus()
+    bus.publish("REWARD", {})
+
+    backlog = bus.subscribe(cursor=500)[1]
+    assert ids(backlog) == [0, 1]
+
+
+def test_event_published_right_after_subscribe_is_delivered():
+    async def scenario():
+        bus = EventBus()
+        bus.bind(asyncio.get_running_loop())
+
+        queue, backlog = bus.subscribe()
+        bus.publish("DECISION", {"source": "yahoo"})
+        return await asyncio.wait_for(queue.get(), timeout=1), backlog
+
+    (event_id, _), backlog = run(scenario())
+    assert event_id == 1 and backlog == []
+
+
+def test_slow_client_drops_oldest_frames():
+    async def scenario():
+        bus = EventBus(client_queue_size=2)
+        bus.bind(asyncio.get_running_loop())
+        queue, _ = bus.subscribe()
+
+        for i in range(5):
+            bus.publish("REWARD", {"i": i})
+        await asyncio.sleep(0)
+
+        return bus, [queue.get_nowait()[0] for _ in range(queue.qsize())]
+
+    bus, received = run(scenario())
+    assert received == [4, 5]
+    assert bus.dropped == 3
+
+
+def test_stream_replays_backlog_then_live_events():
+    async def scenario():
+        bus = EventBus()
+        bus.bind(asyncio.get_running_loop())
+        bus.publish("REWARD", {"i": 0})
+        bus.publish("REWARD", {"i": 1})
+
+        stream = bus.stream(cursor=1, heartbeat=0.05)
+        first = await stream.__anext__()
+        keep_alive = await stream.__anext__()
+
+        bus.publish("REWARD", {"i": 2})
+        live = await stream.__anext__()
+        await stream.aclose()
+        return first, keep_alive, live, bus
+
+    first, keep_alive, live, bus = run(scenario())
+    assert first.startswith(b"id: 2\n")
+    assert keep_alive == b": keep-alive\n\n"
+    assert live.startswith(b"id: 3\n")
+    assert not bus._clients
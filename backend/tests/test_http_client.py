@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("requests")
+
+from utils import http_client
+
+
+@pytest.fixture
+def fresh_session(monkeypatch):
+    monkeypatch.setattr(http_client, "_session", None)
+
+
+def test_session_is_created_once_and_reused(fresh_session):
+    session = http_client.get_session()
+
+    assert http_client.get_session() is session
+
+
+def test_adapter_pools_and_retries_from_config(fresh_session):
+    adapter = http_client.get_session().get_adapter("https://gnews.io")
+    retry = adapter.max_retries
+
+    assert adapter._pool_maxsize == http_client.POOL_SIZE
+    assert retry.total == http_client.RETRY_OPTIONS["total"]
+    assert retry.backoff_factor == http_client.RETRY_OPTIONS["backoff_factor"]
+    assert set(retry.status_forcelist) == set(http_client.RETRY_OPTIONS["status_forcelist"])
+    assert http_client.get_session().get_adapter("http://example.com") is adapter
+
+
+def test_get_json_uses_default_timeout(fresh_session, monkeypatch):
+    calls = []
+
+    class FakeResponse:
+        def json(self):
+            return {"ok": True}
+
+    def fake_get(url, params=None, timeout=None, **kwargs):
+        calls.append((url, params, timeout))
+        return FakeResponse()
+
+    monkeypatch.setattr(http_client.get_session(), "get", fake_get)
+
+    assert http_client.get_json("https://example.com/api", params={"q": "silver"}) == {"ok": True}
+    assert calls == [("https://example.com/api", {"q": "silver"}, http_client.DEFAULT_TIMEOUT)]
@@ -0,0 +1,62 @@
+import logging
+import queue
+
+import numpy as np
+
+from utils import logger as ai_logger
+
+
+def make_record(msg, *args):
+    return logging.LogRecord("ai.test", logging.INFO, __file__, 1, msg, args, None)
+
+
+def test_prepare_freezes_mutable_args_and_keeps_numbers():
+    handler = ai_logger._DeferredQueueHandler(queue.SimpleQueue())
+    info = {"sources": 3}
+    record = make_record("ENV | %s | %.2f | %d", info, np.float64(1.5), np.int64(7))
+
+    handler.prepare(record)
+    info["sources"] = 99
+
+    assert record.getMessage() == "ENV | {'sources': 3} | 1.50 | 7"
+
+
+def test_prepare_freezes_mapping_args():
+    handler = ai_logger._DeferredQueueHandler(queue.SimpleQueue())
+    stats = [1, 2]
+    record = make_record("%(stats)s %(name)s", {"stats": stats, "name": "daemon"})
+
+    handler.prepare(record)
+    stats.append(3)
+
+    assert record.getMessage() == "[1, 2] daemon"
+
+
+def test_prepare_freezes_structured_fields():
+    handler = ai_logger._DeferredQueueHandler(queue.SimpleQueue())
+    sources = ["gold"]
+    record = make_record("ENV")
+    record.fields = {"sources": sources, "score": 0.5}
+
+    handler.prepare(record)
+    sources.append("silver")
+
+    assert record.fields == {"sources": "['gold']", "score": 0.5}
+
+
+def test_event_sinks_receive_structured_fields(tmp_path):
+    events = []
+
+    def sink(event, fields):
+        events.append((event, fields))
+
+    log = ai_logger.AILogger(name="Test", log_dir=str(tmp_path))
+    ai_logger.add_event_sink(sink)
+    ai_logger.add_event_sink(sink)
+    try:
+        log.log_reward("yahoo", 0.25)
+    finally:
+        ai_logger.remove_event_sink(sink)
+
+    log.log_reward("yahoo", 0.5)
+    assert events == [("REWARD", {"source": "yahoo", "reward": 0.25})]
@@ -0,0 +1,122 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from intelligence import market
+from intelligence.market import MarketImpactAnalyzer
+from utils.streaming_stats import EWMA
+
+
+def bar(close):
+    return {"4. close": str(close)}
+
+
+class FakeFeed:
+    """
+    Stands in for FX_INTRADAY: each call returns the full series so far.
+    """
+
+    def __init__(self):
+        self.series = {}
+        self.calls = 0
+
+    def add(self, minute, close):
+        self.series[f"2026-01-01 10:{minute:02d}:00"] = bar(close)
+
+    def __call__(self):
+        self.calls += 1
+        return dict(self.series)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(market, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+@pytest.fixture
+def feed():
+    feed = FakeFeed()
+    for minute, close in enumerate((25.00, 25.10, 25.20, 25.30, 25.40)):
+        feed.add(minute * 5, close)
+    return feed
+
+
+def make_analyzer(feed, **kwargs):
+    analyzer = MarketImpactAnalyzer(**kwargs)
+    analyzer._fetch_series = feed
+    return analyzer
+
+
+def test_evaluations_within_a_bar_do_not_refetch(clock, feed):
+    analyzer = make_analyzer(feed)
+
+    first = analyzer.evaluate()
+    clock.now += 299
+    assert analyzer.evaluate() == first
+    assert feed.calls == 1
+
+    clock.now += 1
+    analyzer.evaluate()
+    assert feed.calls == 2
+
+
+def test_refresh_merges_only_new_bars(clock, feed):
+    analyzer = make_analyzer(feed, max_bars=6)
+    assert analyzer.refresh() == 5
+
+    feed.add(25, 25.50)
+    feed.add(30, 25.60)
+    assert analyzer.refresh(force=True) == 2
+    assert analyzer.refresh(force=True) == 0
+
+    timestamps = [t for t, _ in analyzer.bars]
+    assert len(timestamps) == 6 and timestamps == sorted(timestamps)
+    assert analyzer.fetch_intraday() == [25.60, 25.50, 25.40, 25.30, 25.20]
+
+
+def test_impact_is_clamped_mean_of_window_momenta(clock, feed):
+    analyzer = make_analyzer(feed, momentum_windows=(1, 4))
+    analyzer.refresh()
+
+    short = (25.40 - 25.30) / 25.30
+    assert analyzer.momentum(1) == pytest.approx(short)
+    assert analyzer.momentum(4) == pytest.approx(0.40 / 25.00)
+    assert analyzer.momentum(2) == pytest.approx(0.20 / 25.20)
+    assert analyzer.evaluate() == round((short / 0.02 + 0.016 / 0.02) / 2, 4)
+
+    # A 20% jump saturates both windows
+    feed.add(25, 30.48)
+    analyzer.refresh(force=True)
+    assert analyzer.evaluate() == 1.0
+
+
+def test_failed_fetch_keeps_cached_bars(clock, feed):
+    analyzer = make_analyzer(feed)
+    analyzer.refresh()
+    impact = analyzer.evaluate()
+
+    analyzer._fetch_series = lambda: {}
+    assert analyzer.refresh(force=True) == 0
+    assert analyzer.evaluate() == impact
+    assert len(analyzer.bars) == 5
+
+
+def test_volatility_and_range_follow_new_bars(clock, feed):
+    analyzer = make_analyzer(feed, volatility_halflife=2, range_window=3)
+    assert analyzer.price_range() == (None, None)
+    assert analyzer.volatility() == 0.0
+
+    feed.add(25, 25.10)
+    analyzer.refresh()
+
+    closes = [25.00, 25.10, 25.20, 25.30, 25.40, 25.10]
+    expected = EWMA(halflife=2)
+    for r in np.diff(np.log(closes)):
+        expected.update(r)
+
+    assert analyzer.log_returns.count == 5
+    assert analyzer.volatility() == pytest.approx(expected.std)
+    assert analyzer.price_range() == (25.10, 25.40)
@@ -0,0 +1,113 @@
+import math
+import urllib.request
+
+import pytest
+
+from utils.metrics import CONTENT_TYPE, Histogram, MetricsRegistry
+
+
+def test_counter_and_gauge_render_with_labels():
+    registry = MetricsRegistry()
+    registry.counter("provider_fetches", "Fetches", provider="yahoo", status="ok").inc()
+    registry.counter("provider_fetches", provider="yahoo", status="ok").inc(2)
+    registry.gauge("agent_remaining_budget", "Budget left").set(4.5)
+
+    assert registry.render().splitlines() == [
+        "# HELP agent_remaining_budget Budget left",
+        "# TYPE agent_remaining_budget gauge",
+        "agent_remaining_budget 4.5",
+        "# HELP provider_fetches_total Fetches",
+        "# TYPE provider_fetches_total counter",
+        'provider_fetches_total{provider="yahoo",status="ok"} 3.0',
+    ]
+
+
+def test_label_order_does_not_matter():
+    registry = MetricsRegistry()
+
+    assert registry.counter("c", a="1", b="2") is registry.counter("c", b="2", a="1")
+    assert registry.counter("c", a="1") is not registry.counter("c", a="2")
+
+
+def test_kind_conflict_is_rejected():
+    registry = MetricsRegistry()
+    registry.counter("x")
+
+    with pytest.raises(ValueError):
+        registry.gauge("x")
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    samples = list(histogram.samples("latency", ()))
+
+    assert samples == [
+        ("latency_bucket", (("le", "0.1"),), 2),
+        ("latency_bucket", (("le", "1.0"),), 3),
+        ("latency_bucket", (("le", "+Inf"),), 4),
+        ("latency_sum", (), pytest.approx(3.65)),
+        ("latency_count", (), 4),
+    ]
+
+
+def test_timer_observes_elapsed_time():
+    registry = MetricsRegistry()
+    with registry.timer("stage_seconds", stage="fetch"):
+        pass
+
+    histogram = registry.histogram("stage_seconds", stage="fetch")
+    assert histogram.count == 1
+    assert 0 <= histogram.sum < 1
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.gauge("g", source='a "b"\\c\nd').set(math.inf)
+
+    assert registry.render().splitlines()[-1] == 'g{source="a \\"b\\"\\\\c\\nd"} +Inf'
+
+
+def test_write_textfile_is_atomic(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter("cycles").inc()
+    path = tmp_path / "metrics" / "backend.prom"
+
+    registry.write_textfile(str(path))
+
+    assert path.read_text() == registry.render()
+    assert [p.name for p in path.parent.iterdir()] == ["backend.prom"]
+
+
+def test_http_server_serves_metrics():
+    registry = MetricsRegistry()
+    registry.gauge("up").set(1)
+    server = registry.start_http_server(port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert b"up 1" in response.read()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pipeline_publishes_budget_before_first_deduction(tmp_path, monkeypatch):
+    from data_sources.price_store import PriceStore
+    from environment.replay import ReplayMarketEnvironment
+    from models.silver_predictor_arima import SilverPricePredictorARIMA
+    from pipeline import pipeline as pipeline_module
+
+    monkeypatch.setattr(pipeline_module, "get_default_store", lambda: PriceStore(str(tmp_path)))
+    pipeline_module.BUDGET.set(0.0)
+
+    pipeline_module.BackendPipeline(
+        total_budget=5.0,
+        environment=ReplayMarketEnvironment.synthetic(n_frames=2),
+        predictor=SilverPricePredictorARIMA()
+    )
+
+    assert pipeline_module.BUDGET.value == 5.0
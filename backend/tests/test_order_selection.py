@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from models import order_selection
+from models.order_selection import candidate_orders, select_order
+from models.silver_predictor_arima import SilverPricePredictorARIMA
+
+pytestmark = pytest.mark.usefixtures("quiet_statsmodels")
+
+
+def ar1(n, phi, rng):
+    x = np.zeros(n)
+    for t in range(1, n):
+        x[t] = phi * x[t - 1] + rng.normal()
+    return 24.0 + x
+
+
+def test_candidate_orders_is_full_grid():
+    orders = candidate_orders(range(2), range(1), range(3))
+
+    assert len(orders) == 6
+    assert orders[0] == (0, 0, 0) and orders[-1] == (1, 0, 2)
+    assert len(candidate_orders()) == 4 * 3 * 4
+
+
+def test_select_order_prefers_true_ar_order():
+    prices = ar1(400, 0.8, np.random.default_rng(0))
+    candidates = [(0, 0, 0), (1, 0, 0), (0, 1, 1)]
+
+    best, scores = select_order(prices, candidates, criterion="bic", max_workers=1)
+
+    assert best == (1, 0, 0)
+    assert set(scores) == set(candidates)
+    assert scores[best] == min(scores.values())
+
+
+def test_select_order_rejects_unknown_criterion():
+    with pytest.raises(ValueError):
+        select_order([1.0, 2.0, 3.0], criterion="hqic")
+
+
+def test_select_order_raises_when_nothing_fits(monkeypatch):
+    monkeypatch.setattr(order_selection, "score_order", lambda *a: math.inf)
+
+    with pytest.raises(RuntimeError):
+        select_order(np.arange(20.0), [(1, 0, 0), (0, 1, 0)], max_workers=1)
+
+
+def test_auto_order_predictor_uses_selected_order():
+    prices = ar1(200, 0.8, np.random.default_rng(1))
+    predictor = SilverPricePredictorARIMA(
+        order="auto", order_candidates=[(0, 0, 0), (1, 0, 0)],
+        criterion="bic", max_workers=1
+    )
+    predictor.load_history(prices)
+
+    assert predictor.predict_next()["predicted_price"] is not None
+    assert predictor.order == (1, 0, 0)
+    assert set(predictor.order_scores) == {(0, 0, 0), (1, 0, 0)}
@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from environment.replay import ReplayMarketEnvironment
+from pipeline import pipeline as pipeline_module
+from pipeline.daemon import PipelineDaemon
+from pipeline.pipeline import BackendPipeline
+from utils.cycle_profiler import CycleProfiler
+
+
+class StubPredictor:
+    min_data_points = 1
+
+    def __init__(self):
+        self.prices = SimpleNamespace(capacity=10)
+
+    def load_history(self, prices):
+        pass
+
+    def add_price(self, price):
+        pass
+
+    def predict_next(self):
+        return {"predicted_price": 24.0, "trend": "up", "confidence": 0.5}
+
+
+class ReplayEnvironment(ReplayMarketEnvironment):
+    """
+    Replay environment with the live fetch/step(sources) interface.
+    """
+
+    def fetch_sources(self):
+        return self.sources
+
+    def step(self, sources=None):
+        super().step()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def empty_price_store(monkeypatch, tmp_path):
+    from data_sources.price_store import PriceStore
+    monkeypatch.setattr(pipeline_module, "get_default_store", lambda: PriceStore(str(tmp_path)))
+
+
+def make_pipeline(**kwargs):
+    return BackendPipeline(
+        total_budget=1.0,
+        epsilon=0.0,
+        environment=ReplayEnvironment.synthetic(n_sources=3, n_frames=20, seed=0),
+        predictor=StubPredictor(),
+        profiler=CycleProfiler(enabled=False),
+        **kwargs
+    )
+
+
+def run_until_exhausted(pipeline, limit=50):
+    for _ in range(limit):
+        if pipeline.run_cycle() is None:
+            return
+        pipeline.advance()
+    pytest.fail("budget never ran out")
+
+
+def test_budget_is_spent_once_without_refill_policy():
+    pipeline = make_pipeline()
+    run_until_exhausted(pipeline)
+
+    assert pipeline.budget_exhausted
+    assert pipeline.run_cycle() is None
+
+
+def test_budget_refills_each_period():
+    clock = FakeClock()
+    pipeline = make_pipeline(budget_period=60.0, clock=clock)
+    run_until_exhausted(pipeline)
+
+    clock.now = 59.0
+    assert pipeline.run_cycle() is None
+
+    clock.now = 60.0
+    assert pipeline.run_cycle() is not None
+    assert pipeline.agent.remaining_budget < 1.0
+
+    # Missed periods are not carried over: one refill, next due at 240s
+    run_until_exhausted(pipeline)
+    clock.now = 200.0
+    assert pipeline.run_cycle() is not None
+    run_until_exhausted(pipeline)
+    clock.now = 239.0
+    assert pipeline.run_cycle() is None
+
+
+def test_daemon_flags_exhaustion_once_per_episode():
+    clock = FakeClock()
+    pipeline = make_pipeline(budget_period=60.0, clock=clock)
+    daemon = PipelineDaemon(pipeline, handle_signals=False)
+    snapshot = pipeline.fetch()
+
+    for _ in range(30):
+        daemon._process(snapshot)
+    assert daemon.stats["budget_exhausted"] == 1
+
+    clock.now = 60.0
+    for _ in range(30):
+        daemon._process(snapshot)
+    assert daemon.stats["budget_exhausted"] == 2
+
+
+class TimedPipeline:
+    """
+    Daemon-facing pipeline stub: fetch returns 1, 2, 3, ... and each
+    stage sleeps for the given time on its worker thread.
+    """
+
+    budget_exhausted = False
+    budget_period = None
+
+    def __init__(self, fetch_seconds=0.0, cycle_seconds=0.0):
+        self.fetch_seconds = fetch_seconds
+        self.cycle_seconds = cycle_seconds
+        self.fetches = 0
+        self.advanced = []
+        self.completed = 0
+        self.cycle_started = threading.Event()
+
+    def fetch(self):
+        time.sleep(self.fetch_seconds)
+        self.fetches += 1
+        return self.fetches
+
+    def advance(self, snapshot):
+        self.advanced.append(snapshot)
+
+    def run_cycle(self):
+        self.cycle_started.set()
+        time.sleep(self.cycle_seconds)
+        self.completed += 1
+        return {"cycle": self.completed}
+
+
+def test_daemon_skips_ticks_missed_by_a_slow_fetch():
+    pipeline = TimedPipeline(fetch_seconds=0.2)
+    daemon = PipelineDaemon(pipeline, interval=0.05, max_cycles=2, handle_signals=False)
+
+    asyncio.run(daemon.serve())
+
+    assert daemon.stats["processed"] == 2
+    # Each 0.2s fetch spans about three 0.05s ticks
+    assert daemon.stats["skipped_ticks"] >= 2 * daemon.stats["fetched"] - 1
+    assert daemon.stats["errors"] == 0
+
+
+def test_daemon_hands_the_latest_snapshot_to_a_slow_decision_stage():
+    pipeline = TimedPipeline(cycle_seconds=0.15)
+    daemon = PipelineDaemon(pipeline, interval=0.01, max_cycles=3, handle_signals=False)
+
+    asyncio.run(daemon.serve())
+
+    stats = daemon.stats
+    assert stats["processed"] == 3
+    assert stats["dropped_snapshots"] > 0
+    assert stats["fetched"] == stats["processed"] + stats["dropped_snapshots"]
+    # Snapshots that piled up during a cycle were replaced, not queued
+    assert pipeline.advanced == sorted(pipeline.advanced)
+    assert pipeline.advanced[-1] - pipeline.advanced[0] > len(pipeline.advanced) - 1
+
+
+def test_daemon_shutdown_lets_the_in_flight_cycle_finish():
+    pipeline = TimedPipeline(cycle_seconds=0.3)
+    daemon = PipelineDaemon(pipeline, interval=0.05, handle_signals=False)
+
+    async def main():
+        serving = asyncio.create_task(daemon.serve())
+        await asyncio.to_thread(pipeline.cycle_started.wait, 5)
+        daemon.stop()
+        await serving
+
+    asyncio.run(main())
+
+    assert pipeline.completed == 1
+    assert len(pipeline.advanced) == 1
+    assert daemon.stats["processed"] == 1
+    assert daemon.last_result == {"cycle": 1}
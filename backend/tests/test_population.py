@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from agent.agent import DataCollectionAgent
+from agent.population import PARAMS, AgentPopulation, grid, market_rewards, run_sweep
+from environment.replay import ReplayMarketEnvironment
+
+
+def run_scalar_agent(env, steps, **params):
+    agent = DataCollectionAgent(**params)
+    names = list(env.names)
+    choices, rewards = [], []
+
+    for _ in range(steps):
+        name, _ = agent.select_best_source(env)
+        if name is None:
+            choices.append(-1)
+        else:
+            agent.deduct_cost(env.get_all_sources()[name]["cost"])
+            reward = env.calculate_reward(name)
+            agent.update_learning(name, reward)
+            choices.append(names.index(name))
+            rewards.append(reward)
+        env.step()
+
+    return choices, agent, sum(rewards)
+
+
+@pytest.mark.parametrize("ucb_weight", [0.0, 0.5, 2.0])
+def test_greedy_population_matches_scalar_agent(ucb_weight):
+    params = dict(total_budget=12.0, epsilon=0.0, min_epsilon=0.0, ucb_weight=ucb_weight)
+    steps = 80
+
+    env = ReplayMarketEnvironment.synthetic(n_sources=4, n_frames=steps, seed=3)
+    expected, agent, total_reward = run_scalar_agent(env, steps, **params)
+
+    fields = env.fields
+    rewards = market_rewards(fields)
+    population = AgentPopulation(4, **params)
+    chosen = []
+    for t in range(steps):
+        choice = population.step(
+            fields["freshness"][t], fields["reliability"][t], fields["cost"][t], rewards[t]
+        )
+        chosen.append(int(choice[0]))
+
+    assert chosen == expected
+    assert -1 in chosen     # the budget ran out along the way
+    assert population.remaining_budget[0] == pytest.approx(agent.remaining_budget)
+    assert population.total_reward[0] == pytest.approx(total_reward)
+    np.testing.assert_allclose(
+        population.values[0], [agent.bandit.get_estimated_value(n) for n in env.names]
+    )
+
+
+def test_market_rewards_matches_environment_reward():
+    env = ReplayMarketEnvironment.synthetic(n_sources=3, n_frames=5, seed=4)
+    rewards = market_rewards(env.fields)
+
+    for t in range(5):
+        for j, name in enumerate(env.names):
+            assert rewards[t, j] == pytest.approx(env.calculate_reward(name))
+        env.step()
+
+
+def test_grid_crosses_axes_and_fills_defaults():
+    configs = grid(epsilon=[0.1, 0.2], ucb_weight=[0.0, 0.5, 1.0])
+
+    assert len(configs["epsilon"]) == 6
+    assert configs["epsilon"].tolist() == [0.1, 0.1, 0.1, 0.2, 0.2, 0.2]
+    assert configs["ucb_weight"].tolist() == [0.0, 0.5, 1.0] * 2
+    assert (configs["total_budget"] == PARAMS["total_budget"]).all()
+
+    with pytest.raises(ValueError):
+        grid(learning_rate=[0.1])
+
+
+def test_mismatched_parameter_lengths_are_rejected():
+    with pytest.raises(ValueError):
+        AgentPopulation(3, epsilon=[0.1, 0.2], ucb_weight=[0.0, 0.5, 1.0])
+
+
+def test_absent_sources_are_never_chosen():
+    population = AgentPopulation(3, total_budget=np.full(50, 100.0), seed=0, epsilon=1.0)
+    present = np.array([True, False, True])
+
+    choice = population.select(np.ones(3), np.ones(3), np.full(3, 0.1), present)
+
+    assert set(choice.tolist()) <= {0, 2}
+
+
+def test_run_sweep_single_worker_is_seeded():
+    fields = ReplayMarketEnvironment.synthetic(n_sources=3, n_frames=50, seed=5).fields
+    configs = grid(epsilon=[0.0, 0.3], total_budget=[2.0, 4.0])
+
+    first = run_sweep(configs, fields, steps=60, max_workers=1, seed=7)
+    second = run_sweep(configs, fields, steps=60, max_workers=1, seed=7)
+
+    assert first["total_reward"].shape == (4,)
+    assert first["values"].shape == (4, 3)
+    np.testing.assert_array_equal(first["total_reward"], second["total_reward"])
+    assert (first["remaining_budget"] <= configs["total_budget"]).all()
+
+
+def test_run_sweep_across_worker_processes(fresh_pools):
+    fields = ReplayMarketEnvironment.synthetic(n_sources=3, n_frames=50, seed=5).fields
+    configs = grid(epsilon=[0.0, 0.3], total_budget=[2.0, 4.0])
+
+    first = run_sweep(configs, fields, steps=60, max_workers=2, seed=7)
+    second = run_sweep(configs, fields, steps=60, max_workers=2, seed=7)
+
+    assert list(fresh_pools) == [2]
+    assert first["values"].shape == (4, 3)
+    np.testing.assert_array_equal(first["total_reward"], second["total_reward"])
+
+
+def test_agent_vector_scores_match_evaluate_source():
+    env = ReplayMarketEnvironment.synthetic(n_sources=6, n_frames=2, seed=5)
+    agent = DataCollectionAgent(total_budget=0.4, ucb_weight=0.5)
+    agent.bandit.update_many(env.names[:3], [0.2, 0.9, 0.4])
+    agent.total_decisions = 7
+    sources = env.get_all_sources()
+
+    _, learned, scores = agent.evaluate_sources(sources)
+
+    expected = [
+        agent.evaluate_source(s["freshness"], s["reliability"], s["cost"], name)
+        for name, s in sources.items()
+    ]
+    np.testing.assert_allclose(scores, expected)
+    assert learned.tolist() == [agent.bandit.get_estimated_value(n) for n in sources]
+    assert agent.bandit.arms == list(env.names[:3])
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from models.silver_predictor_arima import SilverPricePredictorARIMA
+
+pytestmark = pytest.mark.usefixtures("quiet_statsmodels")
+
+
+@pytest.fixture
+def predictor():
+    rng = np.random.default_rng(0)
+    predictor = SilverPricePredictorARIMA(order=(1, 1, 0))
+    predictor.load_history(24.0 + np.cumsum(rng.normal(0, 0.05, 200)))
+    return predictor
+
+
+def count_full_fits(predictor):
+    calls = []
+    full_fit = predictor._full_fit
+
+    def counting():
+        calls.append(1)
+        return full_fit()
+
+    predictor._full_fit = counting
+    return calls
+
+
+def test_horizon_has_ordered_intervals(predictor):
+    result = predictor.predict_horizon(steps=4, alpha=0.1)
+
+    assert result["steps"] == 4 and result["alpha"] == 0.1
+    assert len(result["forecast"]) == len(result["lower"]) == len(result["upper"]) == 4
+    for lo, mid, hi in zip(result["lower"], result["forecast"], result["upper"]):
+        assert lo <= mid <= hi
+
+    # Intervals widen with the horizon on a random walk
+    widths = np.subtract(result["upper"], result["lower"])
+    assert (np.diff(widths) > 0).all()
+
+
+def test_horizon_is_cached_and_shares_the_fit(predictor):
+    fits = count_full_fits(predictor)
+
+    first = predictor.predict_horizon(steps=3)
+    assert predictor.predict_horizon(steps=3) is first
+    predictor.predict_horizon(steps=5, alpha=0.2)
+    predictor.predict_next()
+
+    assert len(fits) == 1
+
+
+def test_add_price_invalidates_cache(predictor):
+    fits = count_full_fits(predictor)
+    first = predictor.predict_horizon(steps=3)
+
+    predictor.add_price(30.0)
+    second = predictor.predict_horizon(steps=3)
+
+    assert second is not first
+    assert second["forecast"] != first["forecast"]
+    assert len(fits) == 2
+
+
+def test_horizon_before_ready_is_empty():
+    result = SilverPricePredictorARIMA().predict_horizon(steps=2)
+
+    assert result["forecast"] is None and result["lower"] is None
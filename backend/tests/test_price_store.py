@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_sources import price_store
+from data_sources.price_store import PriceStore, index_to_epoch
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PriceStore(root=str(tmp_path))
+
+
+def test_append_many_sorts_dedups_and_drops_nan(store):
+    written = store.append_many("SI=F", [3.0, 1.0, 2.0, 2.0, 4.0], [30.0, 10.0, 20.0, 21.0, np.nan])
+
+    assert written == 3
+    ts, prices = store.read_range("SI=F")
+    assert ts.tolist() == [1.0, 2.0, 3.0]
+    assert prices.tolist() == [10.0, 21.0, 30.0]
+
+
+def test_append_drops_points_older_than_last(store):
+    store.append_many("SI=F", [1.0, 2.0], [10.0, 20.0])
+
+    assert store.append_many("SI=F", [1.5, 3.0], [15.0, 30.0]) == 1
+    store.append("SI=F", 25.0, timestamp=2.5)
+
+    assert store.last_timestamp("SI=F") == 3.0
+    assert store.tail("SI=F", 10).tolist() == [10.0, 20.0, 30.0]
+
+
+def test_resending_the_forming_bar_revises_it(store):
+    store.append_many("SI=F", [1.0, 2.0], [10.0, 20.0])
+
+    assert store.append_many("SI=F", [2.0], [22.0]) == 1
+    assert store.append_many("SI=F", [2.0, 3.0], [23.0, 30.0]) == 2
+    store.append("SI=F", 31.0, timestamp=3.0)
+
+    ts, prices = store.read_range("SI=F")
+    assert ts.tolist() == [1.0, 2.0, 3.0]
+    assert prices.tolist() == [10.0, 23.0, 31.0]
+    assert PriceStore(root=store.root).tail("SI=F", 1).tolist() == [31.0]
+
+
+def test_last_timestamp_survives_reopen(store):
+    store.append_many("XAG/USD", [1.0, 2.0], [10.0, 20.0])
+    reopened = PriceStore(root=store.root)
+
+    assert reopened.last_timestamp("XAG/USD") == 2.0
+    assert reopened.append_many("XAG/USD", [1.0, 5.0], [0.0, 50.0]) == 1
+    assert reopened.last_timestamp("missing") is None
+
+
+def test_read_range_is_inclusive(store):
+    store.append_many("SI=F", np.arange(10.0), np.arange(10.0) * 2)
+
+    ts, prices = store.read_range("SI=F", start=3.0, end=5.0)
+    assert ts.tolist() == [3.0, 4.0, 5.0]
+    assert prices.tolist() == [6.0, 8.0, 10.0]
+
+    assert store.read_range("SI=F", start=20.0)[0].size == 0
+    assert store.read_range("missing")[0].size == 0
+
+
+def test_tail_returns_newest_oldest_first(store):
+    store.append_many("SI=F", [1.0, 2.0, 3.0], [10.0, 20.0, 30.0])
+
+    assert store.tail("SI=F", 2).tolist() == [20.0, 30.0]
+    assert store.tail("SI=F", 0).size == 0
+    assert store.tail("missing", 3).size == 0
+
+
+def test_record_price_never_raises(monkeypatch, capsys):
+    def broken():
+        raise OSError("disk full")
+
+    monkeypatch.setattr(price_store, "get_default_store", broken)
+    price_store.record_price("SI=F", 24.0)
+
+    assert "Price store error" in capsys.readouterr().out
+
+
+def test_index_to_epoch():
+    index = pd.DatetimeIndex(["1970-01-01 00:00:01", "1970-01-01 00:01:00"], tz="UTC")
+
+    assert index_to_epoch(index).tolist() == [1.0, 60.0]
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from models.price_window import PriceWindow
+
+
+def test_append_wraps_and_keeps_newest_in_order():
+    window = PriceWindow(capacity=4)
+    for price in range(1, 11):
+        window.append(price)
+
+    assert len(window) == 4
+    assert window.view().tolist() == [7, 8, 9, 10]
+    assert window.last() == 10
+    assert window[0] == 7
+    assert window.total_added == 10
+
+
+def test_extend_matches_repeated_append_across_wraparound():
+    rng = np.random.default_rng(0)
+    bulk, single = PriceWindow(7), PriceWindow(7)
+
+    for size in (3, 5, 1, 9, 2, 6):
+        chunk = rng.normal(size=size)
+        bulk.extend(chunk)
+        for value in chunk:
+            single.append(value)
+
+        np.testing.assert_array_equal(bulk.view(), single.view())
+        assert bulk.total_added == single.total_added
+
+
+def test_view_is_read_only_and_zero_copy():
+    window = PriceWindow(3)
+    window.extend([1.0, 2.0, 3.0])
+
+    first = window.view()
+    with pytest.raises(ValueError):
+        first[0] = 99.0
+
+    window.append(4.0)
+    assert np.shares_memory(window.view(), window._buffer)
+
+
+def test_clear_and_invalid_capacity():
+    window = PriceWindow(2)
+    window.extend([1.0, 2.0])
+    window.clear()
+
+    assert len(window) == 0
+    assert window.last() is None
+
+    with pytest.raises(ValueError):
+        PriceWindow(0)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from environment.environment import compute_reward
+from environment.replay import ReplayMarketEnvironment, SourceRecorder
+
+
+def source(freshness, reliability, cost, value, provider="Test"):
+    return {
+        "freshness": freshness, "reliability": reliability,
+        "cost": cost, "value": value, "provider": provider,
+    }
+
+
+def test_recording_round_trips_through_file(tmp_path):
+    recorder = SourceRecorder(str(tmp_path / "session.npz"))
+    recorder.record({"a": source(1.0, 0.9, 0.2, 0.5, "Yahoo")}, timestamp=10.0)
+    recorder.record({"a": source(0.8, 0.9, 0.2, 0.6), "b": source(0.7, 0.6, 0.1, 0.4, "Metals")},
+                    timestamp=20.0)
+
+    env = ReplayMarketEnvironment.from_file(recorder.save(), loop=False)
+
+    assert len(env) == 2
+    assert list(env.get_all_sources()) == ["a"]
+    assert env.get_all_sources()["a"]["provider"] == "Yahoo"
+    assert env.get_all_sources()["a"]["last_updated"] == 10.0
+
+    env.step()
+    sources = env.get_all_sources()
+    assert sorted(sources) == ["a", "b"]
+    assert sources["b"]["provider"] == "Metals"
+    assert sources["b"]["value"] == pytest.approx(0.4)
+    assert np.isnan(env.fields["value"][0, 1])
+
+
+def test_step_raises_when_exhausted_without_loop():
+    env = ReplayMarketEnvironment.synthetic(n_sources=2, n_frames=3, loop=False)
+    env.step()
+    env.step()
+
+    with pytest.raises(IndexError):
+        env.step()
+
+
+def test_step_loops_back_to_first_frame():
+    env = ReplayMarketEnvironment.synthetic(n_sources=2, n_frames=3)
+    first = env.get_all_sources()
+
+    for _ in range(3):
+        env.step()
+
+    assert env.get_all_sources() is first
+    assert env.time_step == 3
+
+
+def test_synthetic_is_seeded_and_bounded():
+    a = ReplayMarketEnvironment.synthetic(n_sources=4, n_frames=50, seed=7)
+    b = ReplayMarketEnvironment.synthetic(n_sources=4, n_frames=50, seed=7)
+
+    for field, matrix in a.fields.items():
+        assert matrix.shape == (50, 4)
+        np.testing.assert_array_equal(matrix, b.fields[field])
+    assert ((a.fields["freshness"] >= 0) & (a.fields["freshness"] <= 1)).all()
+
+
+def test_reward_matches_live_environment_formula():
+    env = ReplayMarketEnvironment.synthetic(n_sources=3, n_frames=5, seed=1)
+    env.step()
+    sources = env.get_all_sources()
+    avg = sum(s["value"] for s in sources.values()) / len(sources)
+
+    for name, s in sources.items():
+        assert env.calculate_reward(name) == pytest.approx(compute_reward(s, avg)[0])
+
+
+def test_empty_replay_is_rejected():
+    with pytest.raises(ValueError):
+        ReplayMarketEnvironment([], [], {f: np.zeros((0, 0)) for f in
+                                         ("freshness", "reliability", "cost", "value")})
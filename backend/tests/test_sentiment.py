@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("textblob")
+
+from intelligence.sentiment import SentimentAnalyzer
+
+
+def test_analyze_many_scores_repeated_text_once():
+    analyzer = SentimentAnalyzer()
+    texts = ["Silver rallies on strong demand", "  silver RALLIES on strong   demand", "Silver slumps badly"]
+
+    polarities = analyzer.analyze_many(texts)
+
+    assert len(polarities) == 3
+    assert polarities[0] == polarities[1]
+    assert polarities[0] > 0 > polarities[2]
+    assert analyzer.cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
+def test_cache_is_bounded_lru():
+    analyzer = SentimentAnalyzer(cache_size=2)
+
+    analyzer.analyze_many(["good news", "bad news"])
+    analyzer.analyze_many(["good news"])              # refresh "good news"
+    analyzer.analyze_many(["great news"])             # evicts "bad news"
+
+    assert analyzer.cache_stats()["size"] == 2
+    analyzer.analyze_many(["good news", "bad news"])
+    assert analyzer.cache_hits == 2
+    assert analyzer.cache_misses == 4
+
+
+def test_analyze_content_skips_news_fetch(monkeypatch):
+    analyzer = SentimentAnalyzer()
+    monkeypatch.setattr(analyzer, "fetch_news", lambda *a: pytest.fail("fetched news"))
+
+    sentiment, confidence = analyzer.analyze("Silver prices surge to a great high")
+
+    assert -1 <= sentiment <= 1
+    assert confidence == 0.1
+
+
+def test_analyze_without_news_is_neutral(monkeypatch):
+    analyzer = SentimentAnalyzer()
+    monkeypatch.setattr(analyzer, "fetch_news", lambda *a: [])
+
+    assert analyzer.analyze() == (0.0, 0.0)
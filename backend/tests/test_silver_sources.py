@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import deque
+
+import pytest
+
+import data_sources.silver_sources as silver_sources
+from utils.circuit_breaker import CircuitBreaker
+
+
+def ok(value, delay=0.0):
+    def fetch(now, timeout):
+        time.sleep(delay)
+        return {"freshness": 0.9, "reliability": 0.9, "cost": 0.3, "value": value}
+    return fetch
+
+
+def failing(now, timeout):
+    raise RuntimeError("provider down")
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    """
+    Swaps in fake providers (under the real names) and fresh breakers.
+    """
+    fakes = {}
+    monkeypatch.setattr(silver_sources, "PROVIDERS", fakes)
+    names = ("spot_silver", "silver_futures", "alphavantage_silver")
+    monkeypatch.setattr(silver_sources, "BREAKERS", {name: CircuitBreaker() for name in names})
+    monkeypatch.setattr(silver_sources, "_latencies", {name: deque(maxlen=200) for name in names})
+    monkeypatch.setattr(silver_sources, "_hedges", {name: {"fired": 0, "won": 0} for name in names})
+    return fakes
+
+
+def test_sources_are_fetched_concurrently(providers):
+    providers["spot_silver"] = (ok(1.0, delay=0.3), 4.0)
+    providers["silver_futures"] = (ok(2.0, delay=0.3), 4.0)
+    providers["alphavantage_silver"] = (ok(3.0, delay=0.3), 4.0)
+
+    start = time.perf_counter()
+    sources = silver_sources.get_silver_data_sources(deadline=2.0)
+    elapsed = time.perf_counter() - start
+
+    assert list(sources) == ["spot_silver", "silver_futures", "alphavantage_silver"]
+    assert elapsed < 0.8
+    assert all("fetch_ms" in s for s in sources.values())
+
+
+def test_deadline_drops_slow_sources_and_errors_are_skipped(providers):
+    providers["spot_silver"] = (ok(1.0), 4.0)
+    providers["silver_futures"] = (ok(2.0, delay=1.0), 4.0)
+    providers["alphavantage_silver"] = (failing, 4.0)
+
+    start = time.perf_counter()
+    sources, timings = silver_sources.get_silver_data_sources(deadline=0.2, with_timings=True)
+    elapsed = time.perf_counter() - start
+
+    assert list(sources) == ["spot_silver"]
+    assert timings["silver_futures"]["status"] == "timeout"
+    assert timings["alphavantage_silver"]["status"] == "error"
+    assert elapsed < 0.6
+
+
+def test_providers_argument_restricts_fetch(providers):
+    providers["spot_silver"] = (ok(1.0), 4.0)
+    providers["silver_futures"] = (ok(2.0), 4.0)
+
+    sources = silver_sources.get_silver_data_sources(providers=["silver_futures"])
+
+    assert list(sources) == ["silver_futures"]
+
+
+def test_open_breaker_skips_provider(providers):
+    providers["spot_silver"] = (failing, 4.0)
+
+    for _ in range(3):
+        silver_sources.get_silver_data_sources(providers=["spot_silver"])
+    _, timings = silver_sources.get_silver_data_sources(providers=["spot_silver"], with_timings=True)
+
+    assert timings["spot_silver"]["status"] == "open"
+    assert silver_sources.provider_health()["spot_silver"]["breaker"]["state"] == "open"
+
+
+def test_hedge_fires_and_wins_when_primary_is_slow(providers, monkeypatch):
+    monkeypatch.setattr(silver_sources, "HEDGE_DEFAULT_DELAY", 0.05)
+    calls = []
+    lock = threading.Lock()
+
+    def slow_then_fast(now, timeout):
+        with lock:
+            calls.append(now)
+            first = len(calls) == 1
+        time.sleep(0.5 if first else 0.0)
+        return {"freshness": 0.9, "reliability": 0.9, "cost": 0.3, "value": 1.0 if first else 2.0}
+
+    providers["spot_silver"] = (slow_then_fast, 2.0)
+
+    start = time.perf_counter()
+    sources = silver_sources.get_silver_data_sources(deadline=2.0, hedged={"spot_silver"})
+
+    assert time.perf_counter() - start < 0.4
+    assert sources["spot_silver"]["value"] == 2.0
+
+    health = silver_sources.provider_health()["spot_silver"]
+    assert (health["hedges_fired"], health["hedges_won"], health["hedge_win_rate"]) == (1, 1, 1.0)
+
+
+def test_hedge_counters_are_not_lost_across_threads(providers):
+    providers["spot_silver"] = (ok(1.0), 4.0)
+
+    def count():
+        for _ in range(2000):
+            silver_sources._count_hedge("spot_silver", "fired")
+
+    threads = [threading.Thread(target=count) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert silver_sources.provider_health()["spot_silver"]["hedges_fired"] == 8000
@@ -0,0 +1,66 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+
+from api.snapshot import SnapshotStore, _clean
+from learning.bandit import MultiArmedBandit
+
+
+class StubPredictor:
+    def predict_horizon(self, steps, alpha):
+        return {"steps": steps, "alpha": alpha, "forecast": [np.float64(24.5)] * steps,
+                "lower": [float("nan")] * steps, "upper": [float("inf")] * steps}
+
+
+def stub_pipeline():
+    bandit = MultiArmedBandit()
+    bandit.update("yahoo", 0.4)
+    agent = SimpleNamespace(bandit=bandit, total_budget=5.0, remaining_budget=np.float64(4.5), epsilon=0.2)
+    return SimpleNamespace(agent=agent, predictor=StubPredictor(), env=SimpleNamespace(time_step=7))
+
+
+def test_store_starts_warming_up():
+    store = SnapshotStore()
+
+    assert json.loads(store.payload()) == {"status": "warming_up", "version": 0, "updated_at": None}
+    assert json.loads(store.payload("budget"))["budget"] is None
+
+
+def test_publish_serializes_every_section():
+    store = SnapshotStore(horizon_steps=2, alpha=0.1)
+    result = {"source": "yahoo", "score": np.float64(0.7), "reward": 0.3,
+              "prediction": {"predicted_price": 24.1}}
+
+    store.publish(stub_pipeline(), result)
+    snapshot = json.loads(store.payload())
+
+    assert store.version == snapshot["version"] == 1
+    assert snapshot["timestep"] == 7
+    assert snapshot["source"] == {"name": "yahoo", "score": 0.7, "reward": 0.3}
+    assert snapshot["bandit"] == {"yahoo": {"value": 0.4, "count": 1}}
+    assert snapshot["forecast"]["horizon"]["forecast"] == [24.5, 24.5]
+    assert snapshot["forecast"]["horizon"]["lower"] == [None, None]
+
+    budget = json.loads(store.payload("budget"))
+    assert budget == {"version": 1, "updated_at": snapshot["updated_at"],
+                      "budget": {"total": 5.0, "remaining": 4.5, "epsilon": 0.2}}
+
+
+def test_publish_without_result_bumps_version():
+    store = SnapshotStore()
+    pipeline = stub_pipeline()
+
+    store.publish(pipeline)
+    store.publish(pipeline)
+
+    snapshot = json.loads(store.payload())
+    assert store.version == 2
+    assert snapshot["source"] is None and snapshot["forecast"]["next"] is None
+
+
+def test_clean_converts_numpy_and_non_finite():
+    cleaned = _clean({1: (np.int64(3), np.nan), "x": [np.float32(0.5), -np.inf]})
+
+    assert cleaned == {"1": [3, None], "x": [0.5, None]}
+    assert json.dumps(cleaned)
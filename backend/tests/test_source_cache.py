@@ -0,0 +1,102 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import data_sources.source_cache as source_cache
+from data_sources.source_cache import SourceSnapshotCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(source_cache, "time", SimpleNamespace(time=fake.time))
+    return fake
+
+
+def make_cache(calls, gate=None, **kwargs):
+    def fetch(deadline, providers):
+        if gate is not None and calls:
+            gate.wait(1.0)
+        calls.append(list(providers))
+        return {
+            name: {"freshness": 1.0, "reliability": 0.9, "cost": 0.3, "value": float(len(calls))}
+            for name in providers
+        }
+    return SourceSnapshotCache(fetch=fetch, default_ttl=30, max_stale=300, freshness_half_life=60, **kwargs)
+
+
+def wait_for_revalidation(cache):
+    for _ in range(200):
+        with cache._lock:
+            if not cache._refreshing:
+                return
+        time.sleep(0.005)
+    raise AssertionError("background refresh did not finish")
+
+
+def test_fresh_entries_are_served_without_fetching(clock):
+    calls = []
+    cache = make_cache(calls)
+
+    first = cache.get_sources()
+    clock.now += 10
+    second = cache.get_sources()
+
+    assert len(calls) == 1
+    assert cache.misses == 3 and cache.hits == 3
+    assert second["spot_silver"]["value"] == first["spot_silver"]["value"]
+    assert second["spot_silver"]["age"] == pytest.approx(10)
+
+
+def test_stale_entries_are_served_then_revalidated(clock):
+    calls, gate = [], threading.Event()
+    cache = make_cache(calls, gate)
+    cache.get_sources()
+
+    clock.now += 60
+    stale = cache.get_sources()
+    gate.set()
+    wait_for_revalidation(cache)
+
+    assert cache.stale_hits == 3
+    assert stale["spot_silver"]["value"] == 1.0
+    # One synchronous fill, then one background refresh per provider
+    assert len(calls) == 4
+    assert cache.snapshot()["spot_silver"]["value"] > 1.0
+
+
+def test_freshness_decays_with_age_and_expired_entries_are_dropped(clock):
+    calls = []
+    cache = make_cache(calls)
+    cache.get_sources()
+
+    clock.now += 60
+    assert cache.snapshot()["spot_silver"]["freshness"] == pytest.approx(0.5)
+
+    clock.now += 300
+    assert cache.snapshot() == {}
+
+
+def test_per_provider_ttl_and_invalidate(clock):
+    calls = []
+    cache = make_cache(calls, ttls={"spot_silver": 5})
+    cache.get_sources()
+
+    clock.now += 10
+    cache.get_sources()
+    wait_for_revalidation(cache)
+    assert ["spot_silver"] in calls[1:]
+
+    cache.invalidate("silver_futures")
+    cache.get_sources()
+    assert ["silver_futures"] in calls
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Cold-start budget per entry point (seconds), generous for slow CI boxes
+IMPORT_BUDGET = 1.0
+
+HEAVY_MODULES = ("statsmodels", "yfinance", "textblob", "requests", "pandas")
+
+ENTRY_POINTS = [
+    "main",
+    "agent.agent",
+    "environment.environment",
+    "environment.replay",
+    "models.silver_predictor_arima",
+    "learning.bandit",
+    "data_sources.silver_sources",
+    "data_sources.source_cache",
+    "data_sources.yahoo_price_fetcher",
+    "intelligence.sentiment",
+    "intelligence.market",
+    "utils.logger",
+    "utils.http_client",
+    "pipeline.pipeline",
+    "pipeline.daemon",
+]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed)
+print(",".join(heavy))
+"""
+
+
+def cold_import(module):
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, heavy = result.stdout.split("\n")[:2]
+    return float(elapsed), [m for m in heavy.split(",") if m]
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_cold_import_defers_heavy_dependencies(module):
+    elapsed, heavy = cold_import(module)
+
+    assert heavy == [], f"{module} eagerly imports {heavy}"
+    assert elapsed < IMPORT_BUDGET, f"{module} took {elapsed:.2f}s to import"
@@ -0,0 +1,26 @@
+import pytest
+
+from utils.startup_profile import import_times, print_startup_report
+
+
+def test_import_times_lists_modules_slowest_first():
+    rows = import_times("learning.bandit")
+    names = [name for _, _, name in rows]
+
+    assert "learning.bandit" in names
+    assert "numpy" in names
+    assert [r[0] for r in rows] == sorted((r[0] for r in rows), reverse=True)
+    assert all(cumulative >= self_us >= 0 for cumulative, self_us, _ in rows)
+
+
+def test_import_times_raises_for_broken_module():
+    with pytest.raises(RuntimeError, match="no_such_module"):
+        import_times("no_such_module")
+
+
+def test_startup_report_prints_top_rows(capsys):
+    print_startup_report("learning.bandit", top=2)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[0].startswith("Cold import of 'learning.bandit'")
+    assert len(lines) == 4
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from environment.environment import SilverMarketEnvironment, compute_reward
+from utils.streaming_stats import EWMA, RollingMinMax, WindowedMomentum
+
+
+def test_ewma_halflife_and_first_value():
+    ewma = EWMA(halflife=1)
+    assert ewma.alpha == pytest.approx(0.5)
+
+    ewma.update(10.0)
+    assert ewma.mean == 10.0 and ewma.variance == 0.0
+
+    ewma.update(20.0)
+    assert ewma.mean == pytest.approx(15.0)
+    assert ewma.std == pytest.approx(5.0)
+
+    with pytest.raises(ValueError):
+        EWMA()
+
+
+def test_rolling_min_max_matches_brute_force():
+    data = np.random.default_rng(1).normal(size=300)
+    window = RollingMinMax(7)
+
+    for i, x in enumerate(data):
+        window.update(x)
+        recent = data[max(0, i - 6):i + 1]
+        assert window.min == recent.min()
+        assert window.max == recent.max()
+
+    assert RollingMinMax(3).min is None
+
+
+def test_windowed_momentum():
+    momentum = WindowedMomentum(2)
+    assert momentum.value == 0.0
+
+    for x in (10.0, 11.0, 12.0, 15.0):
+        momentum.update(x)
+
+    assert momentum.count == 3
+    assert momentum.value == pytest.approx((15.0 - 11.0) / 11.0)
+
+
+class StaticCache:
+    def __init__(self, sources):
+        self.sources = sources
+
+    def get_sources(self):
+        return self.sources
+
+
+def source(value):
+    return {"freshness": 1.0, "reliability": 0.9, "cost": 0.1, "value": value}
+
+
+def test_environment_average_follows_assigned_sources():
+    env = SilverMarketEnvironment(cache=StaticCache({"a": source(20.0), "b": source(30.0)}))
+    assert env._market_average_value() == 25.0
+
+    env.sources = {"a": source(10.0), "b": source(12.0)}
+    assert env._market_average_value() == 11.0
+    assert env.calculate_reward("a") == pytest.approx(compute_reward(source(10.0), 11.0)[0])
+
+    env.step({})
+    assert env._market_average_value() == 0.0
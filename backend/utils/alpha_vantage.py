@@ -1,4 +1,4 @@
-import requests
+from utils import http_client
 from config import ALPHA_VANTAGE_API_KEY
 
 def fetch_silver_price():
@@ -9,7 +9,7 @@ def fetch_silver_price():
         f"&apikey={ALPHA_VANTAGE_API_KEY}"
     )
 
-    response = requests.get(url).json()
+    response = http_client.get(url).json()
 
     try:
         price = float(response["Global Quote"]["05. price"])
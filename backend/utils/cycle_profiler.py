@@ -0,0 +1,199 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+
+# -------------------------------
+# Config (environment defaults)
+# -------------------------------
+PROFILE_ENABLED = os.getenv("AI_PROFILE", "0") == "1"
+PROFILE_EVERY = int(os.getenv("AI_PROFILE_EVERY", "10"))
+PROFILE_THRESHOLD = float(os.getenv("AI_PROFILE_THRESHOLD", "0")) or None    # seconds
+PROFILE_DIR = os.getenv("AI_PROFILE_DIR", "profiles")
+
+SAMPLE_INTERVAL = 0.005
+
+_default_profiler = None
+_default_lock = threading.Lock()
+
+
+class _StackSampler(threading.Thread):
+    """
+    Samples one thread's Python stack every `interval` seconds and
+    counts collapsed stacks ("root;caller;...;leaf"). Threads whose
+    name starts with one of `prefixes` (e.g. executor pools the work
+    fans out to) are sampled too, under "root;<thread name>"; idle
+    pool workers are skipped.
+    """
+
+    def __init__(self, thread_id, interval, root, prefixes=()):
+        super().__init__(name="cycle-profiler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.root = root
+        self.prefixes = tuple(prefixes)
+        self.stacks = Counter()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            frames = sys._current_frames()
+            self._record(self.root, frames.get(self.thread_id))
+
+            if self.prefixes:
+                for thread in threading.enumerate():
+                    frame = frames.get(thread.ident)
+                    if thread.name.startswith(self.prefixes) and not _idle_worker(frame):
+                        self._record(f"{self.root};{thread.name}", frame)
+
+    def _record(self, root, frame):
+        if frame is None:
+            return
+
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+            frame = frame.f_back
+
+        names.append(root)
+        self.stacks[";".join(reversed(names))] += 1
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def _idle_worker(frame):
+    # An executor worker blocked on its work queue has _worker as its leaf
+    return (
+        frame is None
+        or (
+            frame.f_code.co_name == "_worker"
+            and frame.f_globals.get("__name__") == "concurrent.futures.thread"
+        )
+    )
+
+
+class CycleProfiler:
+    """
+    Opt-in profiler for pipeline cycles.
+
+    While enabled, every cycle runs under a low-overhead stack sampler.
+    Samples are kept only for every `every`-th cycle or for cycles
+    slower than `threshold` seconds, and written as collapsed stacks
+    (flamegraph.pl / speedscope / inferno) to
+    `<out_dir>/<name>-<id:06d>.collapsed` (name defaults to "cycle").
+    Every `every`-th cycle also runs under tracemalloc and writes its
+    top allocations to `<out_dir>/<name>-<id:06d>.alloc.txt`. The last
+    `max_captured` dumps are listed in `captured`.
+
+    Toggle at runtime with enable()/disable()/toggle(), or start
+    enabled with AI_PROFILE=1. Callers check `enabled` before calling
+    profile(), so a disabled profiler costs one attribute read.
+    """
+
+    def __init__(
+        self,
+        enabled=PROFILE_ENABLED,
+        every=PROFILE_EVERY,
+        threshold=PROFILE_THRESHOLD,
+        out_dir=PROFILE_DIR,
+        interval=SAMPLE_INTERVAL,
+        top_allocations=25,
+        max_captured=100
+    ):
+        self.enabled = enabled
+        self.every = every
+        self.threshold = threshold
+        self.out_dir = out_dir
+        self.interval = interval
+        self.top_allocations = top_allocations
+
+        self.captured = deque(maxlen=max_captured)     # (cycle_id, reason, elapsed, path)
+
+    # -------------------------------
+    # Toggle
+    # -------------------------------
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def toggle(self, *args):
+        # Accepts (signum, frame) so it can be a signal handler
+        self.enabled = not self.enabled
+        return self.enabled
+
+    # -------------------------------
+    # Profiling
+    # -------------------------------
+    def profile(self, cycle_id, fn, *args, name="cycle", threads=(), **kwargs):
+        """
+        Runs fn(*args, **kwargs) for cycle `cycle_id` and returns its result.
+        `threads` are thread-name prefixes of pools fn hands work to,
+        sampled alongside the calling thread.
+        """
+        import tracemalloc
+
+        nth = bool(self.every) and cycle_id % self.every == 0
+        owns_tracing = nth and not tracemalloc.is_tracing()
+
+        if owns_tracing:
+            tracemalloc.start()
+
+        label = f"{name}-{cycle_id:06d}"
+        sampler = _StackSampler(threading.get_ident(), self.interval, label, threads)
+        sampler.start()
+        start = time.perf_counter()
+
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            sampler.stop()
+
+            memory = None
+            if nth:
+                # Another concurrently profiled stage may own (and stop) tracing
+                try:
+                    memory = tracemalloc.take_snapshot()
+                except RuntimeError:
+                    pass
+                if owns_tracing:
+                    tracemalloc.stop()
+
+            slow = self.threshold is not None and elapsed >= self.threshold
+            if nth or slow:
+                self._dump(cycle_id, label, "slow" if slow else "nth", elapsed, sampler.stacks, memory)
+
+    def _dump(self, cycle_id, label, reason, elapsed, stacks, memory):
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            base = os.path.join(self.out_dir, label)
+
+            with open(base + ".collapsed", "w") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+
+            if memory is not None:
+                with open(base + ".alloc.txt", "w") as f:
+                    f.write(f"# {label} | {elapsed * 1000:.1f} ms | top allocations\n")
+                    for stat in memory.statistics("lineno")[:self.top_allocations]:
+                        f.write(f"{stat}\n")
+
+            self.captured.append((cycle_id, reason, elapsed, base + ".collapsed"))
+
+        except OSError as e:
+            print("Profiler dump error:", e)
+
+
+def get_default_profiler():
+    global _default_profiler
+    with _default_lock:
+        if _default_profiler is None:
+            _default_profiler = CycleProfiler()
+        return _default_profiler
@@ -0,0 +1,66 @@
+import threading
+
+
+# -------------------------------
+# Config
+# -------------------------------
+DEFAULT_TIMEOUT = (3.05, 10)     # (connect, read) seconds
+POOL_SIZE = 16
+
+RETRY_OPTIONS = dict(
+    total=3,
+    connect=3,
+    read=2,
+    backoff_factor=0.3,
+    backoff_jitter=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+# -------------------------------
+# Shared Session
+# -------------------------------
+def get_session():
+    """
+    Returns the process-wide HTTP session.
+    Keep-alive connections are pooled per host and reused across calls.
+    `requests` is imported on first use to keep start-up cheap.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_SIZE,
+                    pool_maxsize=POOL_SIZE,
+                    max_retries=Retry(**RETRY_OPTIONS),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+
+    return _session
+
+
+def get(url, params=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+    """
+    GET through the shared session with bounded, jittered retries
+    and a consistent default timeout.
+    """
+    return get_session().get(url, params=params, timeout=timeout, **kwargs)
+
+
+def get_json(url, params=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+    return get(url, params=params, timeout=timeout, **kwargs).json()
@@ -1,75 +1,244 @@
+import atexit
+import json
 import logging
-from datetime import datetime
+import logging.handlers
+import numbers
 import os
+import queue
+import threading
 
-class AILogger:
+# -------------------------------
+# Config
+# -------------------------------
+LOG_LEVEL = os.getenv("AI_LOG_LEVEL", "INFO").upper()
+LOG_JSON = os.getenv("AI_LOG_JSON", "0") == "1"
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+ROOT_NAME = "ai"
+
+_listener = None
+_backend_lock = threading.Lock()
+
+# Callables receiving (event, fields) for every structured log event
+_event_sinks = []
+
+# Argument types that are safe to format later on the listener thread
+_IMMUTABLE_ARGS = (str, bytes, numbers.Number, type(None))
+
+
+def _freeze(arg):
+    # str() matches what the %s placeholders used here would render
+    return arg if isinstance(arg, _IMMUTABLE_ARGS) else str(arg)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
     """
-    Central logger for the Autonomous AI Agent.
-    Provides explainability and traceability.
+    Enqueues the record so message formatting happens on the listener
+    thread, not on the caller's hot path. Non-primitive arguments are
+    snapshotted as strings first (structured `fields` included), since
+    the caller may mutate them before the listener gets to the record.
     """
 
-    def __init__(self, name="AI-Agent", log_dir="logs"):
-        self.name = name
-        self.log_dir = log_dir
-        os.makedirs(log_dir, exist_ok=True)
+    def prepare(self, record):
+        args = record.args
+        if isinstance(args, dict):
+            record.args = {key: _freeze(value) for key, value in args.items()}
+        elif args:
+            record.args = tuple(_freeze(arg) for arg in args)
+
+        fields = getattr(record, "fields", None)
+        if fields:
+            record.fields = {key: _freeze(value) for key, value in fields.items()}
+        return record
 
-        log_file = os.path.join(log_dir, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
 
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.INFO)
+class JsonLinesFormatter(logging.Formatter):
+    """
+    One JSON object per line: timestamp, level, logger, event, message
+    and any structured `fields` passed via `extra`.
+    """
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": getattr(record, "event", None),
+            "msg": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(
+    log_dir="logs",
+    level=LOG_LEVEL,
+    json_lines=LOG_JSON,
+    console=True,
+    max_bytes=LOG_MAX_BYTES,
+    backup_count=LOG_BACKUP_COUNT
+):
+    """
+    Sets up the process-wide logging backend once.
+    All AILogger instances share one queue and one listener thread;
+    later calls are no-ops.
+    """
+    global _listener
 
-        # File handler
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.INFO)
+    with _backend_lock:
+        if _listener is not None:
+            return logging.getLogger(ROOT_NAME)
 
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
+        os.makedirs(log_dir, exist_ok=True)
 
         formatter = logging.Formatter(
             "[%(asctime)s] [%(levelname)s] %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
 
+        handlers = []
+
+        # Size-rotated text log
+        file_handler = logging.handlers.RotatingFileHandler(
+            os.path.join(log_dir, "backend.log"),
+            maxBytes=max_bytes,
+            backupCount=backup_count
+        )
         file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+        # Optional structured output
+        if json_lines:
+            json_handler = logging.handlers.RotatingFileHandler(
+                os.path.join(log_dir, "backend.jsonl"),
+                maxBytes=max_bytes,
+                backupCount=backup_count
+            )
+            json_handler.setFormatter(JsonLinesFormatter())
+            handlers.append(json_handler)
+
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
+
+        log_queue = queue.SimpleQueue()
+
+        root = logging.getLogger(ROOT_NAME)
+        root.setLevel(level)
+        root.propagate = False
+        root.handlers = [_DeferredQueueHandler(log_queue)]
+
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        root.info("=== AI Logging System Initialized ===")
+        return root
+
+
+def shutdown_logging():
+    """
+    Flushes queued records and stops the listener thread.
+    """
+    global _listener
+
+    with _backend_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def add_event_sink(sink):
+    """
+    Registers `sink(event, fields)` to receive DECISION, REWARD,
+    LEARNING, PREDICTION, ... events regardless of log level.
+    """
+    if sink not in _event_sinks:
+        _event_sinks.append(sink)
+
+
+def remove_event_sink(sink):
+    if sink in _event_sinks:
+        _event_sinks.remove(sink)
+
+
+class AILogger:
+    """
+    Central logger for the Autonomous AI Agent.
+    Provides explainability and traceability.
+
+    Instances are thin named views over the shared queue-backed
+    backend, so creating many never adds handlers or files. Messages
+    use lazy %-formatting and are skipped entirely for disabled levels.
+    """
+
+    def __init__(self, name="AI-Agent", log_dir="logs"):
+        self.name = name
+        self.log_dir = log_dir
+
+        configure_logging(log_dir=log_dir)
+        self.logger = logging.getLogger(ROOT_NAME).getChild(name)
 
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+    def _info(self, event, msg, *args, **fields):
+        for sink in _event_sinks:
+            sink(event, fields)
 
-        self.logger.info("=== AI Logging System Initialized ===")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(msg, *args, extra={"event": event, "fields": fields})
 
     # -------- General Logs -------- #
 
     def log_decision(self, source_name, score, budget_remaining):
-        self.logger.info(
-            f"DECISION | Selected Source: {source_name} | Score: {score:.4f} | Budget Remaining: {budget_remaining:.2f}"
+        self._info(
+            "DECISION",
+            "DECISION | Selected Source: %s | Score: %.4f | Budget Remaining: %.2f",
+            source_name, score, budget_remaining,
+            source=source_name, score=score, budget_remaining=budget_remaining
         )
 
     def log_reward(self, source_name, reward):
-        self.logger.info(
-            f"REWARD | Source: {source_name} | Reward: {reward:.4f}"
+        self._info(
+            "REWARD",
+            "REWARD | Source: %s | Reward: %.4f",
+            source_name, reward,
+            source=source_name, reward=reward
         )
 
     def log_budget(self, old_budget, new_budget):
-        self.logger.info(
-            f"BUDGET | Old: {old_budget:.2f} -> New: {new_budget:.2f}"
+        self._info(
+            "BUDGET",
+            "BUDGET | Old: %.2f -> New: %.2f",
+            old_budget, new_budget,
+            old=old_budget, new=new_budget
         )
 
     def log_learning(self, source_name, old_value, new_value):
-        self.logger.info(
-            f"LEARNING | Source: {source_name} | Old Value: {old_value:.4f} -> New Value: {new_value:.4f}"
+        self._info(
+            "LEARNING",
+            "LEARNING | Source: %s | Old Value: %.4f -> New Value: %.4f",
+            source_name, old_value, new_value,
+            source=source_name, old=old_value, new=new_value
         )
 
     def log_environment(self, timestep, info):
-        self.logger.info(
-            f"ENV | Timestep: {timestep} | Info: {info}"
+        self._info(
+            "ENV",
+            "ENV | Timestep: %s | Info: %s",
+            timestep, info,
+            timestep=timestep, info=info
         )
 
     def log_prediction(self, predicted_price, trend, confidence):
-        self.logger.info(
-            f"PREDICTION | Next Price: {predicted_price} | Trend: {trend} | Confidence: {confidence}"
+        self._info(
+            "PREDICTION",
+            "PREDICTION | Next Price: %s | Trend: %s | Confidence: %s",
+            predicted_price, trend, confidence,
+            predicted_price=predicted_price, trend=trend, confidence=confidence
         )
 
     def log_error(self, error_msg):
-        self.logger.error(f"ERROR | {error_msg}")
+        self.logger.error("ERROR | %s", error_msg, extra={"event": "ERROR", "fields": {}})
@@ -0,0 +1,240 @@
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+
+
+# Default latency buckets (seconds)
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# -------------------------------
+# Metric types
+# -------------------------------
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def samples(self, name, labels):
+        yield name + "_total", labels, self.value
+
+
+class Gauge:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value):
+        self.value = value
+
+    def samples(self, name, labels):
+        yield name, labels, self.value
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram. `observe` is one bisect plus three adds.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1)     # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self):
+        return _Timer(self)
+
+    def samples(self, name, labels):
+        cumulative = 0
+        for bound, n in zip(self.bounds + (math.inf,), self.counts):
+            cumulative += n
+            yield name + "_bucket", labels + (("le", _format_value(bound)),), cumulative
+        yield name + "_sum", labels, self.sum
+        yield name + "_count", labels, self.count
+
+
+class _Timer:
+    """
+    Context manager observing elapsed wall time into a histogram.
+    """
+
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+# -------------------------------
+# Registry
+# -------------------------------
+class MetricsRegistry:
+    """
+    In-process registry of counters, gauges and histograms.
+
+    Metrics are identified by name plus keyword labels; asking for the
+    same (name, labels) again returns the same object, so hot paths
+    should look a metric up once and keep the reference.
+
+    Recording is lock-free to stay well under a microsecond; only
+    registration and rendering take the registry lock. Under the GIL
+    a concurrent increment from another thread can very rarely be lost,
+    which is acceptable for monitoring.
+    """
+
+    def __init__(self):
+        self._families = {}     # name → {"type", "help", "children": {labels: metric}}
+        self._lock = threading.Lock()
+
+    def counter(self, name, help="", **labels):
+        return self._get(name, "counter", help, labels, Counter)
+
+    def gauge(self, name, help="", **labels):
+        return self._get(name, "gauge", help, labels, Gauge)
+
+    def histogram(self, name, help="", buckets=LATENCY_BUCKETS, **labels):
+        return self._get(name, "histogram", help, labels, lambda: Histogram(buckets))
+
+    def timer(self, name, help="", **labels):
+        return self.histogram(name, help, **labels).time()
+
+    def _get(self, name, kind, help, labels, factory):
+        key = tuple(sorted(labels.items()))
+
+        family = self._families.get(name)
+        if family is not None and family["type"] == kind:
+            metric = family["children"].get(key)
+            if metric is not None:
+                return metric
+
+        with self._lock:
+            family = self._families.setdefault(
+                name, {"type": kind, "help": help, "children": {}}
+            )
+            if family["type"] != kind:
+                raise ValueError(f"metric {name} already registered as {family['type']}")
+            if help and not family["help"]:
+                family["help"] = help
+            return family["children"].setdefault(key, factory())
+
+    # -------------------------------
+    # Exposition
+    # -------------------------------
+    def render(self):
+        """
+        Prometheus text exposition format (version 0.0.4).
+        """
+        lines = []
+
+        with self._lock:
+            families = [
+                (name, family["type"], family["help"], list(family["children"].items()))
+                for name, family in sorted(self._families.items())
+            ]
+
+        for name, kind, help, children in families:
+            header = name + "_total" if kind == "counter" else name
+            if help:
+                lines.append(f"# HELP {header} {help}")
+            lines.append(f"# TYPE {header} {kind}")
+
+            for labels, metric in children:
+                for sample, sample_labels, value in metric.samples(name, labels):
+                    lines.append(f"{sample}{_format_labels(sample_labels)} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """
+        Atomically writes the exposition to `path`
+        (e.g. for node_exporter's textfile collector).
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+    def start_http_server(self, port=9100, host="127.0.0.1"):
+        """
+        Serves GET /metrics from a daemon thread. Returns the server.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# Process-wide default registry
+REGISTRY = MetricsRegistry()
+
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
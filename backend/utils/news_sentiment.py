@@ -1,5 +1,5 @@
 import os
-import requests
+from utils import http_client
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -34,7 +34,7 @@ class NewsSentimentAnalyzer:
         }
 
         try:
-            r = requests.get(self.endpoint, params=params, timeout=10)
+            r = http_client.get(self.endpoint, params=params)
             articles = r.json().get("articles", [])
 
             if not articles:
@@ -1,17 +1,18 @@
-import yfinance as yf
+from data_sources.delta_fetcher import get_default_fetcher
+
 
 def minute_aware_price(ticker_symbol: str) -> float | None:
     """
     Returns REAL silver price using true minute delta.
     """
-    ticker = yf.Ticker(ticker_symbol)
-    hist = ticker.history(period="2d", interval="1m")
+    # Only bars newer than the last poll are downloaded
+    closes = get_default_fetcher().update(ticker_symbol, interval="1m", initial_period="2d")["close"]
 
-    if hist is None or len(hist) < 2:
+    if len(closes) < 2:
         return None
 
-    last = float(hist["Close"].iloc[-1])
-    prev = float(hist["Close"].iloc[-2])
+    last = float(closes[-1])
+    prev = float(closes[-2])
 
     minute_delta = last - prev
     adjusted_price = last + (minute_delta * 0.6)
@@ -0,0 +1,30 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# Forking a process that already runs logger/fetch threads can copy
+# held locks into the child, so workers start from a clean interpreter
+START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# max_workers → pool
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_process_pool(max_workers):
+    """
+    Process pool kept alive between calls so workers only pay
+    heavy imports (statsmodels) once. One pool is kept per size, so
+    callers asking for different sizes never shut each other's down.
+    """
+    with _pools_lock:
+        pool = _pools.get(max_workers)
+        if pool is None:
+            pool = _pools[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context(START_METHOD),
+            )
+        return pool
+
@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def import_times(module, python=sys.executable):
+    """
+    Imports `module` in a fresh interpreter with `-X importtime`.
+    Returns [(cumulative_us, self_us, module_name)] sorted slowest first.
+    """
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+
+    rows.sort(reverse=True)
+    return rows
+
+
+def print_startup_report(module="main", top=15):
+    """
+    Prints the slowest imports (cumulative) for a cold start of `module`.
+    """
+    rows = import_times(module)
+    total = rows[0][0] if rows else 0
+
+    print(f"Cold import of '{module}': {total / 1000:.1f} ms")
+    print(f"{'cumulative ms':>14} | {'self ms':>8} | module")
+
+    for cumulative_us, self_us, name in rows[:top]:
+        print(f"{cumulative_us / 1000:>14.1f} | {self_us / 1000:>8.1f} | {name}")
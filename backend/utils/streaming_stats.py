@@ -0,0 +1,108 @@
+import math
+from collections import deque
+
+
+# -------------------------------
+# Exponentially weighted mean / variance
+# -------------------------------
+class EWMA:
+    """
+    Exponentially weighted moving mean and variance.
+    Set either `alpha` directly or a `halflife` in observations.
+    """
+
+    def __init__(self, alpha=None, halflife=None):
+        if alpha is None:
+            if halflife is None:
+                raise ValueError("set alpha or halflife")
+            alpha = 1 - 0.5 ** (1 / halflife)
+
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+
+    def update(self, x):
+        self.count += 1
+        if self.count == 1:
+            self.mean = x
+            return self.mean
+
+        delta = x - self.mean
+        self.mean += self.alpha * delta
+        self.variance = (1 - self.alpha) * (self.variance + self.alpha * delta * delta)
+        return self.mean
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+# -------------------------------
+# Rolling min / max
+# -------------------------------
+class RollingMinMax:
+    """
+    Min and max over the last `window` observations using monotonic
+    deques (amortized O(1) per update, O(1) per query).
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.count = 0
+        self._min = deque()     # (index, value), increasing values
+        self._max = deque()     # (index, value), decreasing values
+
+    def update(self, x):
+        i = self.count
+        self.count += 1
+
+        while self._min and self._min[-1][1] >= x:
+            self._min.pop()
+        while self._max and self._max[-1][1] <= x:
+            self._max.pop()
+
+        self._min.append((i, x))
+        self._max.append((i, x))
+
+        oldest = i - self.window + 1
+        if self._min[0][0] < oldest:
+            self._min.popleft()
+        if self._max[0][0] < oldest:
+            self._max.popleft()
+
+    @property
+    def min(self):
+        return self._min[0][1] if self._min else None
+
+    @property
+    def max(self):
+        return self._max[0][1] if self._max else None
+
+
+# -------------------------------
+# Windowed momentum
+# -------------------------------
+class WindowedMomentum:
+    """
+    Fractional change between the newest observation and the one
+    `window` observations earlier: (x_t - x_{t-window}) / x_{t-window}.
+    Until the window fills, compares against the oldest observation.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._values = deque(maxlen=window + 1)
+
+    def update(self, x):
+        self._values.append(x)
+
+    @property
+    def count(self):
+        return len(self._values)
+
+    @property
+    def value(self):
+        if len(self._values) < 2 or self._values[0] == 0:
+            return 0.0
+        return (self._values[-1] - self._values[0]) / self._values[0]